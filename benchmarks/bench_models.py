@@ -0,0 +1,88 @@
+"""
+공고 모델 벤치마크 - 레코드당 메모리, 초당 처리 건수
+실행: python -m benchmarks.bench_models [건수]
+"""
+import json
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from src.models import Announcement, CompactAnnouncement, decode_jsonl, encode_jsonl
+
+
+SOURCES = ["ntis", "bizinfo", "kstartup", "aifactory"]
+STATUSES = ["접수중", "접수예정", "마감", "D-7"]
+
+
+def make_announcements(n: int):
+    base = datetime(2026, 1, 1)
+    scraped_at = datetime.now()
+    return [
+        Announcement(
+            id=f"{SOURCES[i % 4]}_{i}_2026년_스마트공장_구축_지원사업",
+            source=SOURCES[i % 4],
+            title=f"2026년 스마트공장 구축 및 고도화 지원사업 {i}차 공고",
+            url=f"https://www.example.go.kr/view.do?id={i}",
+            organization="중소벤처기업부",
+            deadline=base + timedelta(days=i % 365),
+            status=STATUSES[i % 4],
+            scraped_at=scraped_at,
+        )
+        for i in range(n)
+    ]
+
+
+def measure_memory(factory, n: int) -> float:
+    """factory()가 만든 객체들의 레코드당 바이트"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objs = factory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del objs
+    return size / n
+
+
+def rate(label: str, n: int, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<32} {n / elapsed:>12,.0f} records/s")
+    return result
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    print(f"[bench] {n:,} records")
+
+    dicts = [a.to_dict() for a in make_announcements(n)]
+
+    print("[memory] bytes/record")
+    full = measure_memory(lambda: [Announcement.from_dict(d) for d in dicts], n)
+    compact = measure_memory(lambda: [CompactAnnouncement.from_dict(d) for d in dicts], n)
+    print(f"  {'Announcement':<32} {full:>12,.0f}")
+    print(f"  {'CompactAnnouncement':<32} {compact:>12,.0f}")
+
+    announcements = [Announcement.from_dict(d) for d in dicts]
+    records = [CompactAnnouncement.from_dict(d) for d in dicts]
+
+    print("[throughput]")
+    rate("Announcement.to_dict", n, lambda: [a.to_dict() for a in announcements])
+    rate("Announcement.from_dict", n, lambda: [Announcement.from_dict(d) for d in dicts])
+    rate("CompactAnnouncement.from_dict", n, lambda: [CompactAnnouncement.from_dict(d) for d in dicts])
+    rate("json.dumps(to_dict) per record", n,
+         lambda: "\n".join(json.dumps(a.to_dict(), ensure_ascii=False) for a in announcements))
+    data = rate("encode_jsonl", n, lambda: encode_jsonl(records))
+    decoded = rate("decode_jsonl", n, lambda: decode_jsonl(data))
+    assert decoded == records
+
+    dict_size = len("\n".join(json.dumps(d, ensure_ascii=False) for d in dicts).encode("utf-8"))
+    print("[size] bytes/record")
+    print(f"  {'json (to_dict)':<32} {dict_size / n:>12,.0f}")
+    print(f"  {'encode_jsonl':<32} {len(data) / n:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+목록 파서 벤치마크 - 출처별 초당 처리 행 수, 행당 메모리 할당
+benchmarks/fixtures/<출처>.json (페이지에서 뽑은 원본 행)을 지정한 행 수만큼 늘려서 파싱
+실행: python -m benchmarks.bench_parsers [행 수] [출처 ...]
+"""
+import json
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+from src.parsers import PARSERS
+
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# 픽스처 날짜 기준 수집 시각 (결과가 실행 날짜에 따라 달라지지 않게 고정)
+NOW = datetime(2026, 3, 15, 9, 0)
+
+
+def load_fixture(source: str):
+    return json.loads((FIXTURES_DIR / f"{source}.json").read_text(encoding="utf-8"))
+
+
+def rows_of(payload) -> list:
+    """원본 행 목록 (dict면 rows/items, list면 그대로)"""
+    if isinstance(payload, list):
+        return payload
+    return payload.get("rows") or payload.get("items") or []
+
+
+def scale(payload, n: int):
+    """픽스처 행을 반복해 n행짜리 원본 만들기"""
+    rows = rows_of(payload)
+    repeated = [rows[i % len(rows)] for i in range(n)]
+    if isinstance(payload, list):
+        return repeated
+    key = "rows" if "rows" in payload else "items"
+    return {**payload, key: repeated}
+
+
+def measure_allocations(parse, payload, n: int):
+    """파싱 중 최대 할당 바이트와 결과가 잡고 있는 바이트 (행당)"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = parse(payload, NOW)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return (peak - before) / n, (current - before) / n
+
+
+def rate(parse, payload, n: int, repeat: int = 3) -> float:
+    """가장 빠른 회차 기준 초당 행 수"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(payload, NOW)
+        best = min(best, time.perf_counter() - start)
+    return n / best
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    sources = sys.argv[2:] or sorted(PARSERS)
+    print(f"[bench] {n:,} rows/parser (now={NOW:%Y-%m-%d %H:%M})")
+    print(f"  {'parser':<12} {'parsed':>8} {'rows/s':>12} {'peak B/row':>12} {'kept B/row':>12}")
+
+    for source in sources:
+        parse = PARSERS[source]
+        fixture = load_fixture(source)
+        parsed = len(parse(fixture, NOW))
+        payload = scale(fixture, n)
+        rows_per_sec = rate(parse, payload, n)
+        peak, kept = measure_allocations(parse, payload, n)
+        print(
+            f"  {source:<12} {parsed:>3}/{len(rows_of(fixture)):<4} "
+            f"{rows_per_sec:>12,.0f} {peak:>12,.0f} {kept:>12,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,14 +5,39 @@ Timer trigger로 매일/반일마다 실행
 import azure.functions as func
 import asyncio
 import logging
+import os
+from typing import Optional
 
-from src.main import run_observer
+from src.backfill import BACKFILL_SOURCES, backfill
+from src.main import run_observer, watch_announcement
+from src.trigger import TriggerCoalescer
+from src.workqueue import WorkQueue
 
 app = func.FunctionApp()
 
+# 동시에 들어온 수동 실행은 한 번만 실행하고, 최근 결과는 잠시 재사용
+manual_runs = TriggerCoalescer.from_env(run_observer)
+
+# HTTP 백필 한 번의 시간 제한 (분)
+# HTTP 응답 한도 230초 안에 끝나야 하므로, 제한 시각에 진행 중이던 페이지(이동 타임아웃 60초)와
+# 브라우저 시작/종료 시간을 감안해 여유를 둠
+BACKFILL_MINUTES = 2
+MAX_BACKFILL_MINUTES = 2.5
+
+
+def _json_object(req: func.HttpRequest) -> Optional[dict]:
+    """요청 본문 JSON 객체 (본문이 없으면 빈 dict, JSON 객체가 아니면 None)"""
+    if not req.get_body():
+        return {}
+    try:
+        body = req.get_json()
+    except ValueError:
+        return None
+    return body if isinstance(body, dict) else None
+
 
 @app.timer_trigger(
-    schedule="0 0 9,18 * * *",  # 매일 9시, 18시 실행 (UTC 기준으로 조정 필요)
+    schedule="0 */30 * * * *",  # 30분마다 깨어나 수집할 때가 된 출처만 실행
     arg_name="timer",
     run_on_startup=False,
 )
@@ -20,13 +45,17 @@ async def rndo_observer(timer: func.TimerRequest) -> None:
     """
     rndo 공고 감시 타이머 함수
 
-    스케줄: 0 0 9,18 * * *
-    - 매일 9시, 18시에 실행 (KST 기준으로 하려면 0,9로 변경)
+    스케줄: 0 */30 * * * *
+    - 30분마다 실행되지만 출처별 게시 빈도(src/scheduler.py)로 판단해
+      수집할 때가 된 출처만 스크래핑
+    - RNDO_MODE=coordinator면 직접 수집하지 않고 출처별 작업을 작업 큐에 넣음
+      (워커: python -m src.workers work)
     """
     logging.info("rndo observer 시작")
 
     try:
-        await run_observer()
+        queue = WorkQueue.from_env() if os.environ.get("RNDO_MODE") == "coordinator" else None
+        await run_observer(scheduled=True, queue=queue)
         logging.info("rndo observer 완료")
     except Exception as e:
         logging.error(f"rndo observer 오류: {e}")
@@ -35,12 +64,70 @@ async def rndo_observer(timer: func.TimerRequest) -> None:
 
 @app.route(route="trigger", methods=["POST"])
 async def manual_trigger(req: func.HttpRequest) -> func.HttpResponse:
-    """수동 실행용 HTTP 트리거"""
-    logging.info("수동 트리거 실행")
+    """수동 실행용 HTTP 트리거
+
+    실행 중이면 그 실행에 합류하고, 최근(RNDO_TRIGGER_FRESH_SECONDS) 결과가 있으면 그 요약을 돌려줌
+    ?force=1 또는 본문 {"force": true}면 최근 결과를 무시하고 다시 수집
+    """
+    body = _json_object(req)
+    if body is None:
+        return func.HttpResponse("요청 본문은 JSON 객체여야 합니다.", status_code=400)
+    force = req.params.get("force", "").lower() in ("1", "true", "yes") or bool(body.get("force"))
+    logging.info(f"수동 트리거 실행 (force={force})")
 
     try:
-        await run_observer()
-        return func.HttpResponse("rndo 실행 완료", status_code=200)
+        result = await manual_runs.trigger(force=force)
+        logging.info(f"수동 트리거 {result.mode}")
+        return func.HttpResponse(result.message, status_code=200)
     except Exception as e:
         logging.error(f"오류: {e}")
         return func.HttpResponse(f"오류: {e}", status_code=500)
+
+
+@app.route(route="watch", methods=["POST"])
+async def watch(req: func.HttpRequest) -> func.HttpResponse:
+    """관심 공고 등록 (마감 D-14/D-7/D-1 리마인더 예약)
+
+    요청 본문: {"id": "<공고 ID>"}
+    """
+    body = _json_object(req)
+    announcement_id = body.get("id") if body else None
+    if not announcement_id:
+        return func.HttpResponse("id가 필요합니다.", status_code=400)
+
+    count = watch_announcement(announcement_id)
+    if count < 0:
+        return func.HttpResponse(f"공고를 찾을 수 없습니다: {announcement_id}", status_code=404)
+    return func.HttpResponse(f"리마인더 {count}건 예약", status_code=200)
+
+
+@app.route(route="backfill", methods=["POST"])
+async def backfill_history(req: func.HttpRequest) -> func.HttpResponse:
+    """과거 공고 백필 (시간 제한 안에서 진행하고, 남은 페이지는 다음 호출에서 이어서)
+
+    요청 본문: {"source": "ntis" | "bizinfo", "pages": 300, "minutes": 2}
+    minutes는 MAX_BACKFILL_MINUTES 이하 (HTTP 응답 한도 230초)
+    """
+    body = _json_object(req)
+    if body is None:
+        return func.HttpResponse("요청 본문은 JSON 객체여야 합니다.", status_code=400)
+    source = body.get("source")
+    if source not in BACKFILL_SOURCES:
+        return func.HttpResponse(f"source는 {', '.join(sorted(BACKFILL_SOURCES))} 중 하나", status_code=400)
+    try:
+        pages = int(body.get("pages", 300))
+        minutes = float(body.get("minutes", BACKFILL_MINUTES))
+    except (TypeError, ValueError):
+        return func.HttpResponse("pages는 정수, minutes는 숫자여야 합니다.", status_code=400)
+    if pages < 1 or not 0 < minutes <= MAX_BACKFILL_MINUTES:
+        return func.HttpResponse(
+            f"pages는 1 이상, minutes는 0 초과 {MAX_BACKFILL_MINUTES} 이하여야 합니다.", status_code=400
+        )
+
+    checkpoint = await backfill(source, pages, minutes=minutes)
+    if checkpoint.complete:
+        return func.HttpResponse(f"백필 완료: {checkpoint.saved}건", status_code=200)
+    return func.HttpResponse(
+        f"백필 진행 중: {checkpoint.saved}건, 남은 샤드 {len(checkpoint.pending())}개 (다시 호출하면 이어서)",
+        status_code=202,
+    )
@@ -0,0 +1,271 @@
+"""
+NTIS/기업마당 과거 공고 백필
+평소 수집은 목록 앞쪽 몇 페이지만 보고 올해 공고만 남기므로, 게시판 전체를 페이지 범위(샤드)로 나눠 훑어서
+연도 제한 없이 공고 이력(SQLite)에 바로 저장
+- 샤드는 한 브라우저 안의 탭 여러 개로 동시에 수집 (동시 탭 수 제한, 호스트별 속도 제한은 politeness가 지킴)
+- 페이지마다 진행 상황을 data/backfill/<출처>.json에 기록해 중단(Functions 시간 초과 등)돼도 이어서 실행
+- 빈 페이지가 나오면 게시판 끝으로 보고 그 뒤 페이지는 건너뜀
+
+사용법:
+    python -m src.backfill --source ntis --pages 300 [--shard-size 10] [--workers 3] [--minutes 8] [--restart]
+"""
+import argparse
+import asyncio
+import json
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Optional
+
+from src.parsers import bizinfo as bizinfo_parser
+from src.parsers import ntis as ntis_parser
+from src.scrapers import BizinfoScraper, NtisScraper
+from src.storage import AnnouncementStore
+from src.storage.history import ORIGIN_BACKFILL
+from src.storage.paths import DATA_DIR
+
+
+# 진행 상황 저장 위치
+CHECKPOINT_DIR = DATA_DIR / "backfill"
+
+# 출처 이름 → (스크래퍼, 파서 모듈)
+BACKFILL_SOURCES = {
+    ntis_parser.SOURCE: (NtisScraper, ntis_parser),
+    bizinfo_parser.SOURCE: (BizinfoScraper, bizinfo_parser),
+}
+
+
+@dataclass
+class Shard:
+    """페이지 범위 하나 (start~end, 양 끝 포함)"""
+    start: int
+    end: int
+    next_page: int
+    done: bool = False
+    saved: int = 0
+
+    @property
+    def key(self) -> str:
+        return f"{self.start}-{self.end}"
+
+
+class Checkpoint:
+    """백필 진행 상황 (샤드별 다음 페이지, 게시판 마지막 페이지)
+
+    Args:
+        source: 출처 이름
+        pages: 훑을 최대 페이지 수
+        shard_size: 샤드당 페이지 수
+        path: 저장 파일 (기본: data/backfill/<출처>.json)
+    """
+
+    def __init__(self, source: str, pages: int, shard_size: int, path: Path = None):
+        self.source = source
+        self.pages = pages
+        self.shard_size = shard_size
+        self.path = path or CHECKPOINT_DIR / f"{source}.json"
+        self.last_page: Optional[int] = None  # 빈 페이지 직전 페이지 (알게 되면 기록)
+        self.shards: List[Shard] = [
+            Shard(start, min(start + shard_size - 1, pages), start)
+            for start in range(1, pages + 1, shard_size)
+        ]
+
+    @classmethod
+    def load(cls, source: str, pages: int, shard_size: int, path: Path = None) -> "Checkpoint":
+        """저장된 진행 상황 불러오기 (없거나 페이지 범위가 다르면 처음부터)"""
+        checkpoint = cls(source, pages, shard_size, path)
+        if not checkpoint.path.exists():
+            return checkpoint
+        data = json.loads(checkpoint.path.read_text(encoding="utf-8"))
+        if data.get("pages") != pages or data.get("shard_size") != shard_size:
+            print(f"[백필] 페이지 범위가 달라 처음부터 시작 ({checkpoint.path})")
+            return checkpoint
+        checkpoint.last_page = data.get("last_page")
+        checkpoint.shards = [Shard(**shard) for shard in data.get("shards", [])]
+        return checkpoint
+
+    def save(self):
+        """임시 파일에 쓰고 교체 (쓰는 도중 중단돼도 이전 내용 유지)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "source": self.source,
+            "pages": self.pages,
+            "shard_size": self.shard_size,
+            "last_page": self.last_page,
+            "updated_at": datetime.now().isoformat(),
+            "shards": [asdict(shard) for shard in self.shards],
+        }
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        tmp.replace(self.path)
+
+    def mark_end(self, page_num: int):
+        """page_num이 빈 페이지 → 게시판 마지막 페이지는 그 앞"""
+        if self.last_page is None or page_num - 1 < self.last_page:
+            self.last_page = page_num - 1
+
+    def in_range(self, page_num: int) -> bool:
+        return self.last_page is None or page_num <= self.last_page
+
+    def pending(self) -> List[Shard]:
+        return [s for s in self.shards if not s.done and self.in_range(s.next_page)]
+
+    @property
+    def saved(self) -> int:
+        return sum(s.saved for s in self.shards)
+
+    @property
+    def complete(self) -> bool:
+        return not self.pending()
+
+
+async def _run_shard(
+    scraper,
+    parser,
+    shard: Shard,
+    checkpoint: Checkpoint,
+    store: AnnouncementStore,
+    now: datetime,
+    deadline: Optional[datetime],
+):
+    """샤드 하나를 새 탭에서 수집 (페이지마다 저장 후 진행 상황 기록)"""
+    tab = await scraper.context.new_page()
+    try:
+        while shard.next_page <= shard.end:
+            page_num = shard.next_page
+            if not checkpoint.in_range(page_num):
+                break
+            if deadline and datetime.now() >= deadline:
+                print(f"  [중단] {shard.key} 시간 초과, {page_num}페이지부터 다음에 이어서")
+                return
+
+            await scraper.goto(parser.page_url(page_num), page=tab, wait_until="networkidle", timeout=60000)
+            await tab.wait_for_timeout(1000)
+            rows_data = await scraper.extract_rows(tab)
+            if not rows_data.get("rows"):
+                print(f"  [끝] {page_num}페이지가 비어 있음")
+                checkpoint.mark_end(page_num)
+                break
+
+            await scraper.archive_page(rows_data, page=tab)
+            announcements = parser.parse(rows_data, now, all_years=True)
+            store.upsert_many(announcements, origin=ORIGIN_BACKFILL)
+
+            shard.saved += len(announcements)
+            shard.next_page = page_num + 1
+            checkpoint.save()
+            print(f"  [{page_num}페이지] {len(announcements)}건 저장")
+
+        shard.done = True
+        checkpoint.save()
+    except Exception as e:
+        # 이 샤드는 done이 아니므로 다음 실행에서 next_page부터 다시 시도
+        print(f"  [실패] {shard.key} {shard.next_page}페이지: {e}")
+    finally:
+        await tab.close()
+
+
+async def backfill(
+    source: str,
+    pages: int,
+    shard_size: int = 10,
+    workers: int = 3,
+    minutes: float = None,
+    restart: bool = False,
+    store: AnnouncementStore = None,
+) -> Checkpoint:
+    """게시판 1~pages 페이지를 샤드로 나눠 공고 이력에 저장
+
+    Args:
+        source: ntis 또는 bizinfo
+        pages: 훑을 최대 페이지 수 (게시판이 더 짧으면 빈 페이지에서 멈춤)
+        shard_size: 샤드당 페이지 수
+        workers: 동시에 수집할 샤드(탭) 수
+        minutes: 이 시간이 지나면 새 페이지를 시작하지 않고 멈춤 (진행 상황은 저장됨)
+        restart: 저장된 진행 상황을 버리고 처음부터
+
+    Returns:
+        진행 상황 (complete가 False면 다시 실행해 이어서)
+    """
+    scraper_cls, parser = BACKFILL_SOURCES[source]
+    if restart:
+        checkpoint = Checkpoint(source, pages, shard_size)
+    else:
+        checkpoint = Checkpoint.load(source, pages, shard_size)
+    pending = checkpoint.pending()
+    print(f"[백필] {source} {pages}페이지, 샤드 {len(checkpoint.shards)}개 중 {len(pending)}개 남음")
+    if not pending:
+        return checkpoint
+
+    now = datetime.now()
+    deadline = now + timedelta(minutes=minutes) if minutes else None
+    own_store = store is None
+    store = store or AnnouncementStore()
+    semaphore = asyncio.Semaphore(workers)
+
+    async def run(shard: Shard):
+        async with semaphore:
+            await _run_shard(scraper, parser, shard, checkpoint, store, now, deadline)
+
+    try:
+        async with scraper_cls() as scraper:
+            await asyncio.gather(*(run(shard) for shard in pending))
+    finally:
+        checkpoint.save()
+        if own_store:
+            store.close()
+
+    status = "완료" if checkpoint.complete else f"남은 샤드 {len(checkpoint.pending())}개"
+    print(f"[백필] {source} 누적 {checkpoint.saved}건 저장, {status}")
+    return checkpoint
+
+
+async def backfill_range(source: str, start: int, end: int, store: AnnouncementStore = None) -> Shard:
+    """페이지 범위 하나만 백필 (작업 큐 워커용)
+
+    진행 상황은 data/backfill/<출처>-<start>-<end>.json에 따로 기록해 재시도된 작업은 이어서 수집
+
+    Returns:
+        샤드 (done이 False면 다시 시도할 작업)
+    """
+    scraper_cls, parser = BACKFILL_SOURCES[source]
+    path = CHECKPOINT_DIR / f"{source}-{start}-{end}.json"
+    checkpoint = Checkpoint.load(source, end, end - start + 1, path)
+    if not path.exists():
+        checkpoint.shards = [Shard(start, end, start)]
+    shard = checkpoint.shards[0]
+    if not checkpoint.pending():
+        shard.done = True  # 이전 시도에서 끝냈거나 게시판이 이 범위 앞에서 끝남
+        return shard
+
+    own_store = store is None
+    store = store or AnnouncementStore()
+    try:
+        async with scraper_cls() as scraper:
+            await _run_shard(scraper, parser, shard, checkpoint, store, datetime.now(), None)
+    finally:
+        if own_store:
+            store.close()
+    # 게시판이 이 범위 앞에서 끝났으면 수집할 페이지가 없으므로 완료
+    shard.done = shard.done or not checkpoint.in_range(shard.next_page)
+    print(f"[백필] {source} {shard.key} {shard.saved}건 저장, {'완료' if shard.done else '미완료'}")
+    return shard
+
+
+def main():
+    parser = argparse.ArgumentParser(description="NTIS/기업마당 과거 공고를 공고 이력에 백필")
+    parser.add_argument("--source", required=True, choices=sorted(BACKFILL_SOURCES))
+    parser.add_argument("--pages", type=int, required=True, help="훑을 최대 페이지 수")
+    parser.add_argument("--shard-size", type=int, default=10, help="샤드당 페이지 수")
+    parser.add_argument("--workers", type=int, default=3, help="동시에 수집할 샤드 수")
+    parser.add_argument("--minutes", type=float, help="이 시간 뒤 멈추고 다음 실행에서 이어서")
+    parser.add_argument("--restart", action="store_true", help="저장된 진행 상황 무시")
+    args = parser.parse_args()
+
+    asyncio.run(
+        backfill(args.source, args.pages, args.shard_size, args.workers, args.minutes, args.restart)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+실행 시간 예산
+Azure Functions(소비 플랜)는 실행 시간이 지나면 호스트가 강제로 종료하므로, 실행 전체에 마감 시각을 두고
+- 알림 발송/정리용 시간(reserve)을 먼저 떼어 두고
+- 남은 수집 시간을 아직 시작 안 한 출처에 나눠 줌 (동시 브라우저 수 고려, 먼저 끝난 출처가 남긴 시간은 뒤 출처 몫)
+- 예산을 다 쓴 출처는 그때까지 모은 공고만 넘기고 멈춤
+"""
+import math
+import os
+import time
+from dataclasses import dataclass, field
+
+
+class BudgetExceeded(Exception):
+    """출처에 배정된 시간을 다 씀 (그때까지 모은 공고는 유효)"""
+
+
+@dataclass
+class RunBudget:
+    """실행 한 번의 시간 예산 (time.monotonic 기준)"""
+    seconds: float = 270.0  # 실행 전체 예산 (소비 플랜 기본 제한 5분에서 여유를 둠)
+    reserve: float = 30.0  # 수집이 끝난 뒤 알림 발송/정리에 남겨 둘 시간
+    started: float = field(default_factory=time.monotonic)
+
+    @classmethod
+    def from_env(cls) -> "RunBudget":
+        return cls(
+            seconds=float(os.environ.get("RNDO_RUN_BUDGET_SECONDS", cls.seconds)),
+            reserve=float(os.environ.get("RNDO_RUN_RESERVE_SECONDS", cls.reserve)),
+        )
+
+    @property
+    def deadline(self) -> float:
+        return self.started + self.seconds
+
+    def remaining(self) -> float:
+        """실행 마감까지 남은 초"""
+        return max(0.0, self.deadline - time.monotonic())
+
+    def scrape_remaining(self) -> float:
+        """수집에 쓸 수 있는 남은 초 (reserve 제외)"""
+        return max(0.0, self.remaining() - self.reserve)
+
+    def allocate(self, waiting: int, slots: int) -> float:
+        """지금 시작하는 출처 하나에 줄 시간
+
+        Args:
+            waiting: 아직 시작 안 한 출처 수 (지금 시작하는 출처 포함)
+            slots: 동시에 수집하는 출처 수 (브라우저 수)
+        """
+        waves = math.ceil(max(waiting, 1) / max(slots, 1))
+        return self.scrape_remaining() / waves
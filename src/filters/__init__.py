@@ -0,0 +1,15 @@
+from .dedupe import DedupeResult, Deduplicator, MinHasher
+from .relevance import RelevanceProfile, RelevanceResult, RelevanceScorer
+from .watchlist import KeywordAutomaton, Subscription, Watchlist
+
+__all__ = [
+    "DedupeResult",
+    "Deduplicator",
+    "KeywordAutomaton",
+    "MinHasher",
+    "RelevanceProfile",
+    "RelevanceResult",
+    "RelevanceScorer",
+    "Subscription",
+    "Watchlist",
+]
@@ -0,0 +1,320 @@
+"""
+출처 간 중복 공고 병합 (MinHash + LSH)
+같은 사업이 NTIS/IRIS/기업마당/K-Startup에 제목만 조금 다르게 올라오는 경우
+하나의 대표 공고로 합치고 나머지 출처는 링크로 붙임
+"""
+import re
+import sqlite3
+import zlib
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set
+
+from src.models import Announcement
+
+
+# 대표 공고로 우선 선택할 출처 순서 (앞일수록 원 공고에 가까움)
+SOURCE_PRIORITY = ["ntis", "iris", "bizinfo", "kstartup", "g2b", "aifactory"]
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# 제목 정규화 시 제거할 상투 표현
+_NOISE_RE = re.compile(
+    r"\[[^\]]*\]|\([^)]*\)|20\d{2}년도?|제?\d+차|재공고|정정공고|공고|모집|안내|\W+"
+)
+
+# 기관명 비교 시 제거할 표현 (괄호 안 약칭, 공백/기호)
+_ORG_NOISE_RE = re.compile(r"\([^)]*\)|\W+")
+
+# shingle이 이보다 적은 제목은 서명이 거의 같아지므로 LSH 병합에서 제외
+MIN_SHINGLES = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS minhash (
+    id TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    deadline TEXT,
+    signature BLOB NOT NULL,
+    organization TEXT
+);
+CREATE TABLE IF NOT EXISTS lsh_buckets (
+    band INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_lsh_buckets ON lsh_buckets(band, bucket);
+"""
+
+
+def normalize_title(title: str) -> str:
+    """비교용 제목 정규화 (괄호, 연도, 차수, '공고' 등 제거)"""
+    return _NOISE_RE.sub("", (title or "").lower())
+
+
+def normalize_organization(organization: Optional[str]) -> str:
+    """비교용 기관명 정규화 (괄호 안 약칭, 공백/기호 제거)"""
+    return _ORG_NOISE_RE.sub("", (organization or "").lower())
+
+
+def organizations_compatible(o1: Optional[str], o2: Optional[str]) -> bool:
+    """같은 사업으로 볼 수 있는 기관명인지
+
+    한쪽이라도 없으면 제목만으로 판단, 한쪽이 다른 쪽을 포함하면 같은 기관
+    (출처마다 '과학기술정보통신부'와 '과학기술정보통신부 정보통신산업진흥원'처럼 표기가 다름)
+    그 밖에는 글자 바이그램이 절반 이상 겹쳐야 같은 기관
+    """
+    n1, n2 = normalize_organization(o1), normalize_organization(o2)
+    if not n1 or not n2 or n1 in n2 or n2 in n1:
+        return True
+    b1 = {n1[i:i + 2] for i in range(len(n1) - 1)}
+    b2 = {n2[i:i + 2] for i in range(len(n2) - 1)}
+    if not b1 or not b2:
+        return False
+    return len(b1 & b2) / len(b1 | b2) >= 0.5
+
+
+class MinHasher:
+    """문자 n-gram shingle 기반 MinHash 서명 생성기"""
+
+    def __init__(self, num_perm: int = 64, shingle_size: int = 3, seed: int = 7):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        # (a * x + b) mod p 형태의 해시 순열 계수 (시드 고정으로 실행 간 재현)
+        coeffs = []
+        state = seed
+        for _ in range(num_perm * 2):
+            state = (state * 6364136223846793005 + 1442695040888963407) % (1 << 64)
+            coeffs.append(state % _MERSENNE_PRIME)
+        self.a = [c or 1 for c in coeffs[:num_perm]]
+        self.b = coeffs[num_perm:]
+
+    def shingles(self, text: str) -> Set[int]:
+        n = self.shingle_size
+        if len(text) <= n:
+            return {zlib.crc32(text.encode("utf-8"))} if text else set()
+        return {zlib.crc32(text[i:i + n].encode("utf-8")) for i in range(len(text) - n + 1)}
+
+    def signature(self, text: str) -> array:
+        hashes = self.shingles(text)
+        sig = array("I", [_MAX_HASH] * self.num_perm)
+        if not hashes:
+            return sig
+        for i, (a, b) in enumerate(zip(self.a, self.b)):
+            sig[i] = min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+        return sig
+
+    @staticmethod
+    def similarity(sig1: array, sig2: array) -> float:
+        """두 서명의 추정 Jaccard 유사도"""
+        return sum(1 for x, y in zip(sig1, sig2) if x == y) / len(sig1)
+
+
+@dataclass
+class DedupeResult:
+    """중복 병합 결과"""
+    canonical: List[Announcement] = field(default_factory=list)
+    # 중복으로 흡수된 공고 ID → 대표 공고 ID
+    merged: Dict[str, str] = field(default_factory=dict)
+    # 대표 공고 ID → 같은 사업으로 보이는 과거 공고 ID (다른 출처, 알림 여부와 무관)
+    matches: Dict[str, List[str]] = field(default_factory=dict)
+
+
+class Deduplicator:
+    """출처 간 유사 공고 병합기
+
+    서명과 LSH 버킷을 SQLite에 저장해 두므로 이력이 쌓여도
+    새 공고마다 같은 버킷 후보만 비교함 (전체 재비교 없음)
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        threshold: float = 0.6,
+        bands: int = 16,
+        num_perm: int = 64,
+        deadline_tolerance_days: int = 1,
+    ):
+        self.conn = conn
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.deadline_tolerance_days = deadline_tolerance_days
+        self.hasher = MinHasher(num_perm=num_perm)
+        self.conn.executescript(_SCHEMA)
+
+    def _text(self, a: Announcement) -> str:
+        return normalize_title(a.title)
+
+    def _comparable(self, text: str) -> bool:
+        """서명으로 비교할 수 있을 만큼 긴 제목인지 (짧으면 서명이 모두 같은 값이 돼 무관한 공고가 합쳐짐)"""
+        return len(self.hasher.shingles(text)) >= MIN_SHINGLES
+
+    def _buckets(self, sig: array) -> List[int]:
+        r = self.rows
+        return [zlib.crc32(sig[i * r:(i + 1) * r].tobytes()) for i in range(self.bands)]
+
+    def _deadline_compatible(self, d1: Optional[str], d2: Optional[str]) -> bool:
+        # 한쪽이라도 마감일이 없으면 제목만으로 판단
+        if not d1 or not d2:
+            return True
+        delta = abs((datetime.fromisoformat(d1) - datetime.fromisoformat(d2)).days)
+        return delta <= self.deadline_tolerance_days
+
+    def index(self, announcements: Iterable[Announcement]) -> int:
+        """공고 서명을 인덱스에 추가 (이미 있는 ID는 건너뜀)
+
+        Returns:
+            새로 추가한 건수
+        """
+        announcements = list(announcements)
+        known = set()
+        ids = [a.id for a in announcements]
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            known.update(
+                row[0] for row in self.conn.execute(
+                    f"SELECT id FROM minhash WHERE id IN ({placeholders})", chunk
+                )
+            )
+        added = 0
+        with self.conn:
+            for a in announcements:
+                if a.id in known:
+                    continue
+                known.add(a.id)
+                text = self._text(a)
+                if not self._comparable(text):
+                    continue
+                sig = self.hasher.signature(text)
+                self.conn.execute(
+                    "INSERT INTO minhash (id, source, deadline, signature, organization) VALUES (?, ?, ?, ?, ?)",
+                    (
+                        a.id, a.source, a.deadline.isoformat() if a.deadline else None,
+                        sig.tobytes(), a.organization,
+                    ),
+                )
+                self.conn.executemany(
+                    "INSERT INTO lsh_buckets (band, bucket, id) VALUES (?, ?, ?)",
+                    [(band, bucket, a.id) for band, bucket in enumerate(self._buckets(sig))],
+                )
+                added += 1
+        return added
+
+    def _history_candidates(self, sig: array) -> Dict[str, tuple]:
+        """같은 LSH 버킷에 들어있는 과거 공고 (id → (source, deadline, signature, organization))"""
+        clauses = " OR ".join(["(l.band = ? AND l.bucket = ?)"] * self.bands)
+        params = [v for pair in enumerate(self._buckets(sig)) for v in pair]
+        rows = self.conn.execute(
+            f"""
+            SELECT DISTINCT m.id, m.source, m.deadline, m.signature, m.organization
+            FROM lsh_buckets l JOIN minhash m ON m.id = l.id
+            WHERE {clauses}
+            """,
+            params,
+        ).fetchall()
+        candidates = {}
+        for row_id, source, deadline, blob, organization in rows:
+            stored = array("I")
+            stored.frombytes(blob)
+            candidates[row_id] = (source, deadline, stored, organization)
+        return candidates
+
+    def merge(self, announcements: List[Announcement], seen_ids: Set[str]) -> DedupeResult:
+        """새 공고 중 중복을 병합
+
+        - 이미 알린 다른 출처 공고와 같은 사업이면 제외 (merged에 기록)
+        - 이번 배치 안에서 같은 사업이면 대표 공고 하나로 합치고 링크 추가
+        - 알림 여부와 관계없이 같은 사업으로 보이는 과거 공고는 matches에 기록
+          (받는 곳마다 알린 공고가 다르면 seen_ids를 비워 두고 matches로 따로 판단)
+
+        Args:
+            announcements: 새 공고 목록
+            seen_ids: 이미 알린 공고 ID
+        """
+        result = DedupeResult()
+        texts = {a.id: self._text(a) for a in announcements}
+        signatures = {a_id: self.hasher.signature(text) for a_id, text in texts.items()}
+        by_id = {a.id: a for a in announcements}
+
+        # 배치 내 union-find (그룹마다 들어있는 출처, 한 그룹에 같은 출처는 하나만)
+        parent = {a.id: a.id for a in announcements}
+        group_sources = {a.id: {a.source} for a in announcements}
+
+        def find(x):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        batch_buckets: Dict[tuple, List[str]] = {}
+        for a in announcements:
+            if not self._comparable(texts[a.id]):
+                continue  # 혼자 대표 공고로 남음
+            sig = signatures[a.id]
+            deadline = a.deadline.isoformat() if a.deadline else None
+
+            # 과거 이력과 비교
+            matches = []
+            for other_id, (source, other_deadline, other_sig, other_org) in self._history_candidates(sig).items():
+                if other_id == a.id or source == a.source:
+                    continue
+                if not self._deadline_compatible(deadline, other_deadline):
+                    continue
+                if not organizations_compatible(a.organization, other_org):
+                    continue
+                if self.hasher.similarity(sig, other_sig) >= self.threshold:
+                    matches.append(other_id)
+            seen_match = next((other_id for other_id in matches if other_id in seen_ids), None)
+            if seen_match:
+                result.merged[a.id] = seen_match
+                continue
+            if matches:
+                result.matches[a.id] = matches
+
+            # 배치 내 비교
+            for key in enumerate(self._buckets(sig)):
+                for other_id in batch_buckets.get(key, []):
+                    root, other_root = find(a.id), find(other_id)
+                    # 같은 그룹이거나, 합치면 한 그룹에 같은 출처 공고가 둘이 됨
+                    # (다른 출처 공고를 사이에 두고 같은 출처의 서로 다른 사업이 이어지는 경우)
+                    if root == other_root or group_sources[root] & group_sources[other_root]:
+                        continue
+                    other = by_id[other_id]
+                    other_deadline = other.deadline.isoformat() if other.deadline else None
+                    if not self._deadline_compatible(deadline, other_deadline):
+                        continue
+                    if not organizations_compatible(a.organization, other.organization):
+                        continue
+                    if self.hasher.similarity(sig, signatures[other_id]) >= self.threshold:
+                        parent[root] = other_root
+                        group_sources[other_root] |= group_sources.pop(root)
+                batch_buckets.setdefault(key, []).append(a.id)
+
+        groups: Dict[str, List[Announcement]] = {}
+        for a in announcements:
+            if a.id not in result.merged:
+                groups.setdefault(find(a.id), []).append(a)
+
+        for members in groups.values():
+            members.sort(key=self._priority)
+            canonical = members[0]
+            for dup in members[1:]:
+                canonical.links.append({"source": dup.source, "url": dup.url})
+                result.merged[dup.id] = canonical.id
+                if dup.id in result.matches:
+                    result.matches.setdefault(canonical.id, []).extend(result.matches.pop(dup.id))
+            result.canonical.append(canonical)
+
+        # 입력 순서 유지
+        order = {a.id: i for i, a in enumerate(announcements)}
+        result.canonical.sort(key=lambda a: order[a.id])
+        return result
+
+    @staticmethod
+    def _priority(a: Announcement) -> int:
+        if a.source in SOURCE_PRIORITY:
+            return SOURCE_PRIORITY.index(a.source)
+        return len(SOURCE_PRIORITY)
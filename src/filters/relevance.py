@@ -0,0 +1,165 @@
+"""
+팀 프로필 기반 공고 관련도 점수화
+키워드/분야/과거 선정 주제로 만든 프로필 벡터와 공고 TF-IDF 벡터의 코사인 유사도로
+발송(send) / 요약(digest) / 제외(drop)를 결정
+"""
+import json
+import math
+import os
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.models import Announcement
+from src.text import to_bigrams
+
+
+# 기본 프로필 위치 (RNDO_PROFILE 환경변수로 변경 가능)
+DEFAULT_PROFILE = Path(__file__).parent.parent.parent / "config" / "profile.json"
+
+# 희소 벡터: (열 번호, 값) 목록
+SparseVector = List[Tuple[int, float]]
+
+
+@dataclass
+class RelevanceProfile:
+    """팀 관심 프로필"""
+    keywords: List[str] = field(default_factory=list)
+    fields: List[str] = field(default_factory=list)
+    past_topics: List[str] = field(default_factory=list)
+    # 항목별 가중치
+    keyword_weight: float = 1.0
+    field_weight: float = 0.6
+    topic_weight: float = 0.8
+    # 점수 임계값
+    send_threshold: float = 0.25
+    digest_threshold: float = 0.1
+
+    @classmethod
+    def load(cls, path: Path = None) -> Optional["RelevanceProfile"]:
+        """JSON 프로필 로드 (파일이 없으면 None → 필터링 안 함)"""
+        if path is None:
+            path = Path(os.environ.get("RNDO_PROFILE", DEFAULT_PROFILE))
+        path = Path(path)
+        if not path.exists():
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        known = cls.__dataclass_fields__.keys()
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+    def weighted_texts(self) -> List[Tuple[str, float]]:
+        """프로필 문장과 가중치 목록"""
+        return (
+            [(t, self.keyword_weight) for t in self.keywords]
+            + [(t, self.field_weight) for t in self.fields]
+            + [(t, self.topic_weight) for t in self.past_topics]
+        )
+
+
+@dataclass
+class RelevanceResult:
+    """관련도 분류 결과"""
+    send: List[Announcement] = field(default_factory=list)
+    digest: List[Announcement] = field(default_factory=list)
+    drop: List[Announcement] = field(default_factory=list)
+    scores: Dict[str, float] = field(default_factory=dict)
+
+
+def _document_text(a: Announcement) -> str:
+    return f"{a.title} {a.organization or ''}"
+
+
+class RelevanceScorer:
+    """TF-IDF 관련도 점수 계산기
+
+    - fit(): 말뭉치(공고 이력)로 IDF와 프로필 벡터를 미리 계산 (실행마다 한 번, 점수 매길 배치는 넣지 않음)
+    - score(): 공고 행렬(CSR) × 프로필 벡터를 한 번에 곱해 점수 산출
+    """
+
+    def __init__(self, profile: RelevanceProfile):
+        self.profile = profile
+        self.vocab: Dict[str, int] = {}
+        self.idf: List[float] = []
+        # 말뭉치에 없던 단어의 IDF (문서 빈도 0 → 가장 큰 IDF)
+        self.unseen_idf = 1.0
+        self.profile_vector: Dict[int, float] = {}
+
+    def fit(self, corpus: Iterable[str]) -> "RelevanceScorer":
+        """IDF 계산 후 프로필 벡터 구성
+
+        Args:
+            corpus: IDF 산출용 문서 (보통 최근 공고 제목들, 없으면 프로필 문장만)
+        """
+        texts = [t for t, _ in self.profile.weighted_texts()] + list(corpus)
+        df = Counter()
+        for text in texts:
+            df.update(set(to_bigrams(text)))
+
+        n_docs = len(texts)
+        self.vocab = {term: i for i, term in enumerate(df)}
+        self.idf = [0.0] * len(self.vocab)
+        for term, i in self.vocab.items():
+            self.idf[i] = math.log((1 + n_docs) / (1 + df[term])) + 1.0
+        self.unseen_idf = math.log(1 + n_docs) + 1.0
+
+        profile_vector: Dict[int, float] = {}
+        for text, weight in self.profile.weighted_texts():
+            for col, value in self._vectorize(text):
+                profile_vector[col] = profile_vector.get(col, 0.0) + weight * value
+        norm = math.sqrt(sum(v * v for v in profile_vector.values())) or 1.0
+        self.profile_vector = {col: v / norm for col, v in profile_vector.items()}
+        return self
+
+    def _vectorize(self, text: str) -> SparseVector:
+        """문서 → L2 정규화된 희소 TF-IDF 벡터
+
+        어휘 밖 단어는 열이 없어 벡터에서 빠지지만 정규화 크기에는 가장 큰 IDF로 포함
+        (빼고 정규화하면 프로필과 겹치는 단어 몇 개뿐인 공고의 점수가 부풀려짐)
+        """
+        counts = Counter(to_bigrams(text))
+        vector = []
+        unseen = 0.0
+        for term, tf in counts.items():
+            col = self.vocab.get(term)
+            if col is not None:
+                vector.append((col, (1.0 + math.log(tf)) * self.idf[col]))
+            else:
+                unseen += ((1.0 + math.log(tf)) * self.unseen_idf) ** 2
+        norm = math.sqrt(sum(v * v for _, v in vector) + unseen) or 1.0
+        return [(col, v / norm) for col, v in vector]
+
+    def score(self, announcements: List[Announcement]) -> List[float]:
+        """공고 목록 일괄 점수화 (코사인 유사도 0~1)"""
+        if not self.vocab:
+            # 이력이 없으면 프로필 문장만으로 (배치로 IDF를 만들면 배치마다 기준이 달라짐)
+            self.fit([])
+
+        # CSR 행렬 구성: indptr[i]:indptr[i+1] 구간이 i번째 공고의 비영 원소
+        indptr = [0]
+        indices: List[int] = []
+        data: List[float] = []
+        for a in announcements:
+            for col, value in self._vectorize(_document_text(a)):
+                indices.append(col)
+                data.append(value)
+            indptr.append(len(indices))
+
+        # 행렬-벡터 곱
+        weights = self.profile_vector
+        products = [weights.get(col, 0.0) * value for col, value in zip(indices, data)]
+        return [sum(products[indptr[i]:indptr[i + 1]]) for i in range(len(announcements))]
+
+    def partition(self, announcements: List[Announcement]) -> RelevanceResult:
+        """임계값에 따라 send / digest / drop 분류"""
+        result = RelevanceResult()
+        for a, s in zip(announcements, self.score(announcements)):
+            result.scores[a.id] = s
+            if s >= self.profile.send_threshold:
+                result.send.append(a)
+            elif s >= self.profile.digest_threshold:
+                result.digest.append(a)
+            else:
+                result.drop.append(a)
+        return result
@@ -0,0 +1,152 @@
+"""
+키워드 구독 (팀별 관심 키워드 → 채널)
+모든 구독의 키워드/제외어를 Aho-Corasick 오토마타 하나로 컴파일해
+구독 수와 관계없이 공고 한 건의 제목과 주최를 한 번씩만 훑어서 매칭
+"""
+import json
+import os
+import re
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from src.models import Announcement
+
+
+# 기본 구독 설정 위치 (RNDO_SUBSCRIPTIONS 환경변수로 변경 가능)
+DEFAULT_SUBSCRIPTIONS = Path(__file__).parent.parent.parent / "config" / "subscriptions.json"
+
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize(text: Optional[str]) -> str:
+    """매칭용 정규화 (소문자, 공백 제거 → '의료 AI'와 '의료AI'를 같게 취급)"""
+    return _SPACE_RE.sub("", (text or "").lower())
+
+
+@dataclass
+class Subscription:
+    """구독 하나 (키워드 중 하나라도 있고 제외어가 없으면 매칭)"""
+    name: str
+    keywords: List[str]
+    channel: str  # channels에 정의된 이름
+    exclude: List[str] = field(default_factory=list)
+
+
+class KeywordAutomaton:
+    """Aho-Corasick 다중 패턴 매칭기"""
+
+    def __init__(self, patterns: List[str]):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[Set[int]] = [set()]
+
+        for index, pattern in enumerate(patterns):
+            if not pattern:
+                continue
+            node = 0
+            for ch in pattern:
+                nxt = self.goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[node][ch] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(set())
+                node = nxt
+            self.output[node].add(index)
+
+        # BFS로 실패 링크 구성
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self.goto[node].items():
+                queue.append(nxt)
+                f = self.fail[node]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[nxt] = self.goto[f].get(ch, 0)
+                self.output[nxt] |= self.output[self.fail[nxt]]
+
+    def search(self, text: str) -> Set[int]:
+        """text에 나타난 패턴 번호 집합"""
+        found: Set[int] = set()
+        node = 0
+        goto, fail, output = self.goto, self.fail, self.output
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if output[node]:
+                found |= output[node]
+        return found
+
+
+class Watchlist:
+    """구독 레지스트리
+
+    Args:
+        subscriptions: 구독 목록
+        channels: 채널 이름 → Webhook URL
+    """
+
+    def __init__(self, subscriptions: List[Subscription], channels: Dict[str, str]):
+        self.subscriptions = subscriptions
+        self.channels = channels
+
+        # 패턴 번호 → (구독 번호, 제외어 여부)
+        patterns: List[str] = []
+        self.pattern_owner: List[Tuple[int, bool]] = []
+        for i, sub in enumerate(subscriptions):
+            for term in sub.keywords:
+                patterns.append(normalize(term))
+                self.pattern_owner.append((i, False))
+            for term in sub.exclude:
+                patterns.append(normalize(term))
+                self.pattern_owner.append((i, True))
+        self.automaton = KeywordAutomaton(patterns)
+
+    @classmethod
+    def load(cls, path: Path = None) -> Optional["Watchlist"]:
+        """JSON 설정 로드 (파일이 없으면 None)
+
+        Webhook URL에는 ${ENV_VAR} 형태로 환경변수를 쓸 수 있음
+        """
+        if path is None:
+            path = Path(os.environ.get("RNDO_SUBSCRIPTIONS", DEFAULT_SUBSCRIPTIONS))
+        path = Path(path)
+        if not path.exists():
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        channels = {name: os.path.expandvars(url) for name, url in data.get("channels", {}).items()}
+        subscriptions = [Subscription(**sub) for sub in data.get("subscriptions", [])]
+        for sub in subscriptions:
+            if sub.channel not in channels:
+                raise ValueError(f"구독 '{sub.name}'의 채널 '{sub.channel}'이 channels에 없습니다.")
+        return cls(subscriptions, channels)
+
+    def match(self, announcement: Announcement) -> List[Subscription]:
+        """공고에 매칭되는 구독 목록
+
+        제목과 주최는 따로 훑음 (공백을 지우고 이어 붙이면 제목 끝과 주최 앞이 이어져 없는 키워드가 매칭됨)
+        """
+        found: Set[int] = set()
+        for text in (announcement.title, announcement.organization):
+            found |= self.automaton.search(normalize(text))
+        included: Set[int] = set()
+        excluded: Set[int] = set()
+        for pattern in found:
+            owner, is_exclude = self.pattern_owner[pattern]
+            (excluded if is_exclude else included).add(owner)
+        return [self.subscriptions[i] for i in sorted(included - excluded)]
+
+    def route(self, announcements: List[Announcement]) -> Dict[str, List[Announcement]]:
+        """채널별 발송 목록 (채널 이름 → 공고, 같은 채널에는 한 번만)"""
+        routed: Dict[str, List[Announcement]] = {}
+        for a in announcements:
+            channels = {sub.channel for sub in self.match(a)}
+            for channel in channels:
+                routed.setdefault(channel, []).append(a)
+        return routed
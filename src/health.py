@@ -0,0 +1,199 @@
+"""
+출처별 헬스 체크 (서킷 브레이커)
+연속으로 실패한 출처는 수집을 건너뛰고, 쿨다운이 지나면 가벼운 HTTP 요청 한 번으로 살아났는지 확인
+- 로그인이 필요하거나 접속이 안 되는 출처가 매 실행마다 타임아웃/스크린샷으로 시간을 쓰지 않게 함
+- 상태는 공고 DB에 저장되어 실행 사이에 유지됨
+"""
+import os
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+import httpx
+
+from src.politeness import politeness
+
+
+# 브레이커 상태
+CLOSED = "closed"  # 정상 수집
+OPEN = "open"  # 수집 중단 (쿨다운 대기)
+HALF_OPEN = "half_open"  # 프로브 통과, 이번 수집 결과로 복구 여부 결정
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS source_health (
+    source TEXT PRIMARY KEY,
+    state TEXT NOT NULL,
+    failures INTEGER NOT NULL DEFAULT 0,
+    trips INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    last_success TEXT,
+    retry_at TEXT
+);
+"""
+
+
+@dataclass
+class BreakerPolicy:
+    """서킷 브레이커 설정"""
+    failure_threshold: int = 3  # 연속 실패가 이만큼 쌓이면 중단
+    cooldown: timedelta = timedelta(hours=6)  # 첫 중단 후 다시 확인할 때까지
+    max_cooldown: timedelta = timedelta(days=3)  # 복구 실패가 반복되면 쿨다운을 두 배씩 늘리되 이 이상은 안 늘림
+    probe_timeout: float = 10.0  # 프로브 요청 타임아웃 (초)
+
+    @classmethod
+    def from_env(cls) -> "BreakerPolicy":
+        return cls(
+            failure_threshold=int(os.environ.get("RNDO_BREAKER_THRESHOLD", cls.failure_threshold)),
+            cooldown=timedelta(hours=float(os.environ.get("RNDO_BREAKER_COOLDOWN_HOURS", 6))),
+        )
+
+
+@dataclass
+class SourceHealth:
+    """출처 하나의 헬스 상태"""
+    source: str
+    state: str = CLOSED
+    failures: int = 0  # 연속 실패 횟수
+    trips: int = 0  # 연속 중단 횟수 (쿨다운 배수)
+    last_error: Optional[str] = None
+    last_success: Optional[datetime] = None
+    retry_at: Optional[datetime] = None  # OPEN일 때 다시 확인할 시각
+
+    def describe(self) -> str:
+        if self.state == OPEN:
+            retry = self.retry_at.strftime("%m-%d %H:%M") if self.retry_at else "?"
+            return f"중단 (연속 실패 {self.failures}회, {retry} 재확인) - {self.last_error or ''}"
+        if self.state == HALF_OPEN:
+            return "복구 확인 중"
+        if self.failures:
+            return f"정상 (연속 실패 {self.failures}회) - {self.last_error or ''}"
+        return "정상"
+
+
+class CircuitBreaker:
+    """출처별 서킷 브레이커
+
+    CLOSED에서 연속 실패가 failure_threshold에 닿으면 OPEN
+    OPEN은 retry_at까지 수집하지 않고, 지나면 프로브 한 번 → 통과하면 HALF_OPEN으로 수집
+    HALF_OPEN 수집이 성공하면 CLOSED, 실패하면 쿨다운을 두 배로 늘려 다시 OPEN
+    """
+
+    def __init__(self, conn: sqlite3.Connection, policy: BreakerPolicy = None):
+        self.conn = conn
+        self.policy = policy or BreakerPolicy.from_env()
+        self.conn.executescript(_SCHEMA)
+
+    def get(self, source: str) -> SourceHealth:
+        row = self.conn.execute(
+            """
+            SELECT state, failures, trips, last_error, last_success, retry_at
+            FROM source_health WHERE source = ?
+            """,
+            (source,),
+        ).fetchone()
+        if row is None:
+            return SourceHealth(source)
+        return SourceHealth(
+            source=source,
+            state=row[0],
+            failures=row[1],
+            trips=row[2],
+            last_error=row[3],
+            last_success=datetime.fromisoformat(row[4]) if row[4] else None,
+            retry_at=datetime.fromisoformat(row[5]) if row[5] else None,
+        )
+
+    def _save(self, health: SourceHealth):
+        with self.conn:
+            self.conn.execute(
+                """
+                INSERT OR REPLACE INTO source_health (
+                    source, state, failures, trips, last_error, last_success, retry_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    health.source,
+                    health.state,
+                    health.failures,
+                    health.trips,
+                    health.last_error,
+                    health.last_success.isoformat() if health.last_success else None,
+                    health.retry_at.isoformat() if health.retry_at else None,
+                ),
+            )
+
+    async def admit(
+        self, source: str, probe_url: str, client: httpx.AsyncClient, now: datetime = None
+    ) -> Optional[str]:
+        """이번 실행에서 수집해도 되는지 확인
+
+        Returns:
+            건너뛸 사유 (수집해도 되면 None)
+        """
+        now = now or datetime.now()
+        health = self.get(source)
+        if health.state != OPEN:
+            return None
+        if health.retry_at and now < health.retry_at:
+            return health.describe()
+
+        # 쿨다운이 지났으면 브라우저를 띄우기 전에 가벼운 요청으로 먼저 확인
+        error = await probe(probe_url, client, self.policy.probe_timeout)
+        if error:
+            self.record_failure(source, f"프로브 실패: {error}", now)
+            return self.get(source).describe()
+        health.state = HALF_OPEN
+        self._save(health)
+        print(f"  → {source} 프로브 통과, 복구 확인을 위해 수집")
+        return None
+
+    def record_success(self, source: str, now: datetime = None):
+        health = self.get(source)
+        if health.state != CLOSED:
+            print(f"  → {source} 복구됨")
+        health.state = CLOSED
+        health.failures = 0
+        health.trips = 0
+        health.retry_at = None
+        health.last_success = now or datetime.now()
+        self._save(health)
+
+    def record_failure(self, source: str, error: str, now: datetime = None):
+        now = now or datetime.now()
+        health = self.get(source)
+        health.failures += 1
+        health.last_error = error[:200]
+        if health.state != CLOSED or health.failures >= self.policy.failure_threshold:
+            health.trips += 1
+            cooldown = min(
+                self.policy.cooldown * (2 ** (health.trips - 1)), self.policy.max_cooldown
+            )
+            health.state = OPEN
+            health.retry_at = now + cooldown
+            print(f"  → {source} 수집 중단 (연속 실패 {health.failures}회, {health.retry_at:%m-%d %H:%M} 재확인)")
+        self._save(health)
+
+    def snapshot(self) -> Dict[str, str]:
+        """정상이 아닌 출처의 상태 (실행 요약용)"""
+        rows = self.conn.execute(
+            "SELECT source FROM source_health WHERE state != ? OR failures > 0", (CLOSED,)
+        ).fetchall()
+        return {row[0]: self.get(row[0]).describe() for row in rows}
+
+
+async def probe(url: str, client: httpx.AsyncClient, timeout: float) -> Optional[str]:
+    """GET 한 번으로 사이트 응답 확인
+
+    Returns:
+        실패 사유 (정상이면 None)
+    """
+    try:
+        async with politeness.request(url) as slot:
+            response = await client.get(url, timeout=timeout, follow_redirects=True)
+            slot.status = response.status_code
+    except Exception as e:
+        return f"{type(e).__name__} {e}"[:200]
+    if response.status_code >= 500:
+        return f"HTTP {response.status_code}"
+    return None
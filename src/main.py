@@ -3,34 +3,47 @@ rndo - R&D Observer
 배치로 공고를 수집하고 Teams에 알림을 보내는 메인 모듈
 """
 import asyncio
-import json
 import os
 from datetime import datetime
-from pathlib import Path
-from typing import List, Set
-
-from src.scrapers import AifactoryScraper
+from typing import Dict, List, Optional, Set, Type
+
+from src.scrapers import (
+    AifactoryScraper,
+    BaseScraper,
+    BizinfoScraper,
+    G2BScraper,
+    IrisScraper,
+    KStartupScraper,
+    NtisScraper,
+)
+from src.budget import RunBudget
+from src.health import CircuitBreaker
 from src.notifier import TeamsNotifier
 from src.models import Announcement
+from src.pipeline import ObserverPipeline
+from src.reminders import ReminderStore, send_due_reminders
+from src.scheduler import AdaptiveScheduler
+from src.scrapers.rowfilter import SeenRows
+from src.storage import AnnouncementStore, page_archive, state
+from src.tenants import load_tenants
+from src.workqueue import WorkQueue
 
 
-# 이미 알린 공고 ID를 저장하는 파일
-SEEN_FILE = Path(__file__).parent.parent / "data" / "seen_announcements.json"
-
+# 이미 알린 공고 ID 목록의 상태 저장소 키 (local이면 data/seen_announcements.json)
+SEEN_KEY = "seen_announcements.json"
 
-def load_seen_ids() -> Set[str]:
-    """이미 알린 공고 ID 목록 로드"""
-    if not SEEN_FILE.exists():
-        return set()
-    with open(SEEN_FILE, "r", encoding="utf-8") as f:
-        return set(json.load(f))
+# 출처 이름 → 스크래퍼
+SCRAPERS: Dict[str, Type[BaseScraper]] = {
+    "aifactory": AifactoryScraper,
+    "ntis": NtisScraper,
+    "bizinfo": BizinfoScraper,
+    "kstartup": KStartupScraper,
+    "iris": IrisScraper,  # 로그인 필요
+    "g2b": G2BScraper,  # 접속 불가
+}
 
-
-def save_seen_ids(seen_ids: Set[str]):
-    """알린 공고 ID 목록 저장"""
-    SEEN_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(SEEN_FILE, "w", encoding="utf-8") as f:
-        json.dump(list(seen_ids), f, ensure_ascii=False, indent=2)
+# 기본 수집 대상 (RNDO_SOURCES 환경변수로 변경, 쉼표 구분)
+DEFAULT_SOURCES = "aifactory"
 
 
 def filter_new_announcements(
@@ -40,56 +53,121 @@ def filter_new_announcements(
     return [a for a in announcements if a.id not in seen_ids]
 
 
-async def run_observer():
-    """메인 실행 함수"""
-    # 환경변수에서 Webhook URL 가져오기
-    webhook_url = os.environ.get("TEAMS_WEBHOOK_URL")
-    if not webhook_url:
+def enabled_scrapers() -> Dict[str, Type[BaseScraper]]:
+    """RNDO_SOURCES에 지정된 스크래퍼 목록"""
+    names = os.environ.get("RNDO_SOURCES", DEFAULT_SOURCES).split(",")
+    scrapers = {}
+    for name in (n.strip() for n in names):
+        if name in SCRAPERS:
+            scrapers[name] = SCRAPERS[name]
+        elif name:
+            print(f"알 수 없는 출처: {name}")
+    return scrapers
+
+
+async def run_observer(
+    scheduled: bool = False,
+    sources: Optional[List[str]] = None,
+    queue: Optional[WorkQueue] = None,
+):
+    """메인 실행 함수
+
+    Args:
+        scheduled: True면 출처별 게시 빈도로 판단해 수집할 때가 된 출처만 실행
+            (타이머 트리거용, 수동 실행은 전체 수집)
+        sources: 이 출처만 수집 (작업 큐 워커용, 리마인더는 코디네이터가 보내므로 생략)
+        queue: 있으면 직접 수집하지 않고 출처별 작업을 큐에 넣음 (코디네이터)
+    """
+    # 테넌트 설정 (없으면 TEAMS_WEBHOOK_URL 단일 테넌트)
+    tenants = load_tenants(os.environ.get("TEAMS_WEBHOOK_URL"), SEEN_KEY)
+    if not tenants:
         print("TEAMS_WEBHOOK_URL 환경변수가 설정되지 않았습니다.")
         return
 
-    print(f"[{datetime.now()}] rndo 시작...")
-
-    # 이미 알린 공고 목록 로드
-    seen_ids = load_seen_ids()
-    print(f"이미 알린 공고: {len(seen_ids)}건")
-
-    all_announcements = []
-
-    # aifactory 수집
-    try:
-        print("aifactory 수집 중...")
-        async with AifactoryScraper() as scraper:
-            announcements = await scraper.fetch_announcements()
-            all_announcements.extend(announcements)
-            print(f"  → {len(announcements)}건 수집")
-    except Exception as e:
-        print(f"  → 오류: {e}")
-
-    # TODO: IRIS 스크래퍼 추가
-    # async with IrisScraper() as scraper:
-    #     ...
-
-    # 새 공고만 필터링
-    new_announcements = filter_new_announcements(all_announcements, seen_ids)
-    print(f"새 공고: {len(new_announcements)}건")
-
-    if new_announcements:
-        # Teams 알림 발송
-        notifier = TeamsNotifier(webhook_url)
-        success = await notifier.send_new_announcements(new_announcements)
-
-        if success:
-            print("Teams 알림 발송 완료!")
-            # 알린 공고 ID 저장
-            new_ids = {a.id for a in new_announcements}
-            save_seen_ids(seen_ids | new_ids)
-        else:
-            print("Teams 알림 발송 실패!")
-    else:
-        print("새 공고가 없습니다.")
-
+    # 호스트 실행 제한 안에서 끝나도록 실행 전체 시간 예산 (리마인더 발송 시간 포함)
+    budget = RunBudget.from_env()
+    print(f"[{datetime.now()}] rndo 시작... (시간 예산 {budget.seconds:.0f}초)")
+    print("테넌트: " + ", ".join(t.name for t in tenants))
+
+    with AnnouncementStore() as store:
+        # 마감 리마인더는 수집 여부와 관계없이 매 실행마다 대표 테넌트로 발송
+        reminders = ReminderStore(store.conn)
+        if sources is None:
+            primary = next((t for t in tenants if t.primary), tenants[0])
+            await send_due_reminders(reminders, TeamsNotifier(primary.webhook_url))
+
+        scrapers = enabled_scrapers()
+        if sources is not None:
+            scrapers = {name: cls for name, cls in scrapers.items() if name in sources}
+        scheduler = AdaptiveScheduler(store.conn)
+        if scheduled:
+            due = scheduler.due_sources(list(scrapers))
+            for name, reason in due.items():
+                print(f"수집 대상: {name} ({reason})")
+            scrapers = {name: cls for name, cls in scrapers.items() if name in due}
+            if not scrapers:
+                print("수집할 때가 된 출처가 없습니다.")
+                return None
+
+        if queue is not None:
+            # 같은 출처 작업이 아직 큐에 있으면 다시 넣지 않음 (워커가 밀려도 작업이 쌓이지 않게)
+            for name in scrapers:
+                added = queue.enqueue({"kind": "scrape", "source": name}, key=f"scrape:{name}")
+                print(f"작업 추가: {name}" if added else f"작업 대기 중: {name}")
+            return None
+
+        started_at = datetime.now()
+        # 이번 실행의 상태 캐시와 처리한 목록 행 지문 (같은 프로세스에서 겹쳐 도는 실행과 따로 모음)
+        run_state = state.scope()
+        seen_rows = SeenRows(run_state)
+        pipeline = ObserverPipeline(
+            scrapers=scrapers,
+            store=store,
+            tenants=tenants,
+            reminders=reminders,
+            health=CircuitBreaker(store.conn),
+            max_browsers=int(os.environ.get("RNDO_MAX_BROWSERS", "2")),
+            budget=budget,
+            seen_rows=seen_rows,
+            state=run_state,
+        )
+        try:
+            stats = await pipeline.run()
+        finally:
+            # 발송까지 끝난 공고와 목록 행은 파이프라인이 중간에 실패해도 남김
+            # (seen_rows에는 모든 테넌트에 발송이 끝난 배치의 행만 들어 있어 다음 실행부터 페이지에서 거름)
+            seen_rows.commit()
+            run_state.flush()
+        # 중간까지만 수집한 출처는 기록하지 않아 다음 타이머에서 다시 수집
+        for name in scrapers:
+            if name not in stats.errors and name not in stats.skipped and name not in stats.partial:
+                scheduler.record_run(name, started_at)
+        print(f"공고 이력: {store.count()}건")
+
+    # 보관 기간이 지난 원본 페이지 정리
+    pruned = page_archive.prune()
+    archive = page_archive.stats()
+    print(
+        f"원본 보관: 페이지 {archive['pages']}건, 내용 {archive['blobs']}개 "
+        f"({archive['stored'] / 1024 / 1024:.1f}MB 압축, 정리 {pruned}개)"
+    )
+
+    print(stats.summary())
     print(f"[{datetime.now()}] rndo 종료")
+    return stats
+
+
+def watch_announcement(announcement_id: str) -> int:
+    """공고를 관심 공고로 등록 (마감 리마인더 예약)
+
+    Returns:
+        예약한 리마인더 수 (이력에 없는 공고면 -1)
+    """
+    with AnnouncementStore() as store:
+        announcement = store.get(announcement_id)
+        if announcement is None:
+            return -1
+        return ReminderStore(store.conn).watch([announcement])
 
 
 def main():
@@ -1,3 +1,4 @@
 from .announcement import Announcement
+from .compact import CompactAnnouncement, decode_jsonl, encode_jsonl
 
-__all__ = ["Announcement"]
+__all__ = ["Announcement", "CompactAnnouncement", "decode_jsonl", "encode_jsonl"]
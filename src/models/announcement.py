@@ -1,6 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 
 @dataclass
@@ -15,6 +15,7 @@ class Announcement:
     status: Optional[str] = None  # 모집중, 마감 등
     prize: Optional[str] = None  # 상금/지원금
     scraped_at: datetime = None
+    links: List[dict] = field(default_factory=list)  # 같은 사업의 다른 출처 [{source, url}]
 
     def __post_init__(self):
         if self.scraped_at is None:
@@ -31,4 +32,23 @@ class Announcement:
             "status": self.status,
             "prize": self.prize,
             "scraped_at": self.scraped_at.isoformat() if self.scraped_at else None,
+            "links": self.links,
         }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Announcement":
+        """to_dict() 결과에서 복원"""
+        deadline = data.get("deadline")
+        scraped_at = data.get("scraped_at")
+        return cls(
+            id=data["id"],
+            source=data["source"],
+            title=data["title"],
+            url=data["url"],
+            organization=data.get("organization"),
+            deadline=datetime.fromisoformat(deadline) if deadline else None,
+            status=data.get("status"),
+            prize=data.get("prize"),
+            scraped_at=datetime.fromisoformat(scraped_at) if scraped_at else None,
+            links=list(data.get("links") or []),
+        )
@@ -0,0 +1,173 @@
+"""
+메모리 절약형 공고 표현 + 대량 직렬화
+이력/백필처럼 수만 건을 다룰 때 Announcement 대신 사용
+"""
+import json
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional
+
+from .announcement import Announcement
+
+
+# 시간대와 무관하게 변환하기 위한 기준 시각 (naive datetime 그대로 마이크로초 단위로 변환)
+_EPOCH = datetime(1970, 1, 1)
+
+_MICROSECOND = timedelta(microseconds=1)
+
+# JSON-lines 직렬화 시 열 순서 (날짜는 epoch 마이크로초)
+FIELDS = [
+    "id", "source", "title", "url", "organization",
+    "deadline_us", "status", "prize", "scraped_at_us", "links",
+]
+
+
+def to_epoch(value: Optional[datetime]) -> Optional[int]:
+    """datetime → epoch 마이크로초 (정수라 왕복해도 값이 그대로)
+
+    시간대가 있는 값은 이 프로세스의 현지 시각으로 바꿔 naive로 저장 (수집 시각은 datetime.now() 기준)
+    """
+    if value is None:
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def from_epoch(value: Optional[int]) -> Optional[datetime]:
+    return _EPOCH + timedelta(microseconds=value) if value is not None else None
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value else value
+
+
+@dataclass(slots=True)
+class CompactAnnouncement:
+    """공고 압축 표현
+
+    - __slots__로 인스턴스 __dict__ 제거
+    - source/status는 종류가 몇 개뿐이라 intern해서 문자열 공유
+    - 날짜는 epoch 마이크로초(int)로 보관하고 필요할 때만 datetime으로 변환
+    """
+    id: str
+    source: str
+    title: str
+    url: str
+    organization: Optional[str] = None
+    deadline: Optional[int] = None  # epoch 마이크로초
+    status: Optional[str] = None
+    prize: Optional[str] = None
+    scraped_at: Optional[int] = None  # epoch 마이크로초
+    links: Optional[tuple] = None  # ((source, url), ...)
+
+    def __post_init__(self):
+        self.source = _intern(self.source)
+        self.status = _intern(self.status)
+
+    @classmethod
+    def from_announcement(cls, a: Announcement) -> "CompactAnnouncement":
+        return cls(
+            id=a.id,
+            source=a.source,
+            title=a.title,
+            url=a.url,
+            organization=a.organization,
+            deadline=to_epoch(a.deadline),
+            status=a.status,
+            prize=a.prize,
+            scraped_at=to_epoch(a.scraped_at),
+            links=tuple((link["source"], link["url"]) for link in a.links) or None,
+        )
+
+    def to_announcement(self) -> Announcement:
+        return Announcement(
+            id=self.id,
+            source=self.source,
+            title=self.title,
+            url=self.url,
+            organization=self.organization,
+            deadline=from_epoch(self.deadline),
+            status=self.status,
+            prize=self.prize,
+            scraped_at=from_epoch(self.scraped_at),
+            links=[{"source": s, "url": u} for s, u in self.links or ()],
+        )
+
+    def to_dict(self) -> dict:
+        """Announcement.to_dict()와 같은 형식"""
+        deadline = from_epoch(self.deadline)
+        scraped_at = from_epoch(self.scraped_at)
+        return {
+            "id": self.id,
+            "source": self.source,
+            "title": self.title,
+            "url": self.url,
+            "organization": self.organization,
+            "deadline": deadline.isoformat() if deadline else None,
+            "status": self.status,
+            "prize": self.prize,
+            "scraped_at": scraped_at.isoformat() if scraped_at else None,
+            "links": [{"source": s, "url": u} for s, u in self.links or ()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CompactAnnouncement":
+        """to_dict() 결과(또는 Announcement.to_dict())에서 복원"""
+        deadline = data.get("deadline")
+        scraped_at = data.get("scraped_at")
+        links = data.get("links") or ()
+        return cls(
+            id=data["id"],
+            source=data["source"],
+            title=data["title"],
+            url=data["url"],
+            organization=data.get("organization"),
+            deadline=to_epoch(datetime.fromisoformat(deadline)) if deadline else None,
+            status=data.get("status"),
+            prize=data.get("prize"),
+            scraped_at=to_epoch(datetime.fromisoformat(scraped_at)) if scraped_at else None,
+            links=tuple((link["source"], link["url"]) for link in links) or None,
+        )
+
+
+def encode_jsonl(records: Iterable[CompactAnnouncement]) -> bytes:
+    """JSON-lines 직렬화
+
+    첫 줄은 열 이름, 이후 한 줄에 공고 하나를 값 배열로 기록 (키 반복 없음)
+    """
+    lines = [json.dumps(FIELDS)]
+    dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    for r in records:
+        lines.append(dumps([
+            r.id, r.source, r.title, r.url, r.organization,
+            r.deadline, r.status, r.prize, r.scraped_at, r.links,
+        ]))
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def decode_jsonl(data: bytes) -> List[CompactAnnouncement]:
+    """encode_jsonl() 결과 복원"""
+    lines = data.decode("utf-8").splitlines()
+    if not lines:
+        return []
+    columns = json.loads(lines[0])
+    if columns != FIELDS:
+        # 열 순서가 다른 파일은 이름으로 매핑
+        index = [columns.index(name) for name in FIELDS]
+    else:
+        index = None
+
+    loads = json.JSONDecoder().decode
+    records = []
+    for line in lines[1:]:
+        if not line:
+            continue
+        values = loads(line)
+        if index is not None:
+            values = [values[i] for i in index]
+        links = values[9]
+        values[9] = tuple(tuple(link) for link in links) if links else None
+        records.append(CompactAnnouncement(*values))
+    return records
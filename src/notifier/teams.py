@@ -1,13 +1,26 @@
 import httpx
 from typing import List
 from src.models import Announcement
+from src.politeness import webhooks
+from src.storage.changes import ChangeEvent
+
+
+# 변경 알림에 쓸 필드 이름
+FIELD_LABELS = {
+    "title": "제목",
+    "organization": "주최",
+    "deadline": "마감",
+    "status": "상태",
+    "prize": "상금",
+}
 
 
 class TeamsNotifier:
     """Teams Incoming Webhook을 통한 알림 발송"""
 
-    def __init__(self, webhook_url: str):
+    def __init__(self, webhook_url: str, client: httpx.AsyncClient = None):
         self.webhook_url = webhook_url
+        self.client = client  # 여러 Webhook이 연결을 공유할 때 (없으면 호출마다 새로 만듦)
 
     async def send_new_announcements(self, announcements: List[Announcement]) -> bool:
         """새 공고 목록을 Teams에 전송"""
@@ -16,14 +29,26 @@ class TeamsNotifier:
 
         card = self._build_card(announcements)
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.webhook_url,
-                json=card,
-                headers={"Content-Type": "application/json"},
-                timeout=30,
-            )
-            return response.status_code in (200, 202)
+        return await self._post(card)
+
+    async def _post(self, payload: dict) -> bool:
+        """Webhook POST (Webhook별 속도 제한 적용, 수집 사이트 제한과는 별개)"""
+        async with webhooks.request(self.webhook_url) as slot:
+            if self.client is not None:
+                response = await self._send(self.client, payload)
+            else:
+                async with httpx.AsyncClient() as client:
+                    response = await self._send(client, payload)
+            slot.status = response.status_code
+        return response.status_code in (200, 202)
+
+    async def _send(self, client: httpx.AsyncClient, payload: dict) -> httpx.Response:
+        return await client.post(
+            self.webhook_url,
+            json=payload,
+            headers={"Content-Type": "application/json"},
+            timeout=30,
+        )
 
     def _build_card(self, announcements: List[Announcement]) -> dict:
         """Adaptive Card 형식으로 메시지 생성"""
@@ -46,13 +71,7 @@ class TeamsNotifier:
                     },
                     {
                         "type": "ActionSet",
-                        "actions": [
-                            {
-                                "type": "Action.OpenUrl",
-                                "title": "상세보기",
-                                "url": a.url,
-                            }
-                        ],
+                        "actions": self._build_actions(a),
                     },
                 ],
                 "separator": True,
@@ -88,6 +107,17 @@ class TeamsNotifier:
 
         return card
 
+    def _build_actions(self, a: Announcement) -> list:
+        """상세보기 버튼 (다른 출처 링크가 있으면 출처별 버튼 추가)"""
+        actions = [{"type": "Action.OpenUrl", "title": "상세보기", "url": a.url}]
+        for link in a.links:
+            actions.append({
+                "type": "Action.OpenUrl",
+                "title": f"{link['source']}에서 보기",
+                "url": link["url"],
+            })
+        return actions
+
     def _build_facts(self, a: Announcement) -> list:
         """공고 정보를 FactSet 형식으로 변환"""
         facts = [{"title": "출처", "value": a.source}]
@@ -107,15 +137,44 @@ class TeamsNotifier:
 
         return facts
 
+    async def send_digest(self, announcements: List[Announcement]) -> bool:
+        """관련도가 애매한 공고를 제목 목록 한 건으로 요약 전송"""
+        if not announcements:
+            return True
+
+        lines = [f"🦦 관심도 낮은 공고 {len(announcements)}건 요약"]
+        for a in announcements:
+            lines.append(f"- [{a.source}] [{a.title}]({a.url})")
+        return await self.send_simple_message("\n\n".join(lines))
+
+    async def send_changes(self, events: List[ChangeEvent]) -> bool:
+        """이미 알린 공고의 변경 사항(마감 연장, 상태 변경, 정정공고)을 한 건으로 전송"""
+        if not events:
+            return True
+
+        lines = [f"🦦 이미 알린 공고 중 {len(events)}건이 바뀌었어요"]
+        for e in events:
+            label = "정정공고" if e.is_correction else FIELD_LABELS.get(e.field, e.field)
+            lines.append(
+                f"- [{e.announcement.title}]({e.announcement.url}) · "
+                f"{label}: {e.old or '-'} → {e.new or '-'}"
+            )
+        return await self.send_simple_message("\n\n".join(lines))
+
+    async def send_reminders(self, reminders: list) -> bool:
+        """관심 공고 마감 리마인더(D-n)를 한 건으로 전송"""
+        if not reminders:
+            return True
+
+        lines = [f"🦦 마감이 다가오는 관심 공고 {len(reminders)}건"]
+        for r in reminders:
+            a = r.announcement
+            lines.append(
+                f"- **D-{r.offset_days}** [{a.title}]({a.url}) · 마감 {a.deadline.strftime('%Y-%m-%d')}"
+            )
+        return await self.send_simple_message("\n\n".join(lines))
+
     async def send_simple_message(self, message: str) -> bool:
         """단순 텍스트 메시지 전송"""
         payload = {"text": message}
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.webhook_url,
-                json=payload,
-                headers={"Content-Type": "application/json"},
-                timeout=30,
-            )
-            return response.status_code in (200, 202)
+        return await self._post(payload)
@@ -0,0 +1,24 @@
+"""
+출처별 목록 파서 (원본 행 → Announcement)
+스크래퍼와 재파싱(src.reparse), 파서 벤치마크(benchmarks.bench_parsers)가 같은 함수를 사용
+"""
+from typing import Callable, Dict
+
+from . import aifactory, bizinfo, g2b, iris, kstartup, ntis
+
+# 출처 이름 → parse(원본 행, now, year=None)
+PARSERS: Dict[str, Callable] = {
+    ntis.SOURCE: ntis.parse,
+    bizinfo.SOURCE: bizinfo.parse,
+    iris.SOURCE: iris.parse,
+    g2b.SOURCE: g2b.parse,
+    kstartup.SOURCE: kstartup.parse,
+    aifactory.SOURCE: aifactory.parse,
+}
+
+# 출처 이름 → 예전 ID 규칙 (ID 규칙을 바꾼 출처만, 공고 → 예전 ID)
+LEGACY_IDS: Dict[str, Callable] = {
+    aifactory.SOURCE: lambda a: aifactory.legacy_id(a.title),
+}
+
+__all__ = ["LEGACY_IDS", "PARSERS"]
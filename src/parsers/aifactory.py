@@ -0,0 +1,75 @@
+"""
+aifactory 공모전 카드 파서
+화면에서 뽑은 카드(cards_data) → Announcement (브라우저 없이 동작)
+목록 API를 잡으면 스크래퍼가 capture로 바로 변환하고, 이 파서는 화면 추출 경로용
+"""
+import re
+from datetime import datetime
+from typing import List, Optional
+
+from src.models import Announcement
+
+
+SOURCE = "aifactory"
+BASE_URL = "https://aifactory.space"
+# 공모전 목록
+LIST_URL = f"{BASE_URL}/competition"
+# 공모전 상세 (목록 API의 taskId, 카드 링크의 /task/<번호>)
+DETAIL_URL = f"{BASE_URL}/task/{{id}}/overview"
+
+_DATE_RE = re.compile(r"(\d{4})([-.])(\d{2})\2(\d{2})")
+
+
+def parse_date(date_text: str) -> Optional[datetime]:
+    """날짜 문자열에서 가장 늦은 날짜(마감일) 추출"""
+    if not date_text:
+        return None
+    dates = []
+    for match in _DATE_RE.finditer(date_text):
+        try:
+            y, _, m, d = match.groups()
+            dates.append(datetime(int(y), int(m), int(d)))
+        except ValueError:
+            continue
+    return max(dates) if dates else None
+
+
+def make_id(task_id) -> str:
+    """공고 ID (목록 API 경로와 화면 추출 경로가 같은 ID를 쓰도록 공모전 번호 기준)"""
+    return f"{SOURCE}_{task_id}"
+
+
+def legacy_id(title: str) -> str:
+    """공모전 번호를 쓰기 전의 제목 기준 ID (이미 알린 공고를 seen 목록에서 찾을 때, 번호가 없는 카드)"""
+    return f"{SOURCE}_{title[:30].replace(' ', '_')}"
+
+
+def parse(cards_data: List[dict], now: datetime, year: int = None) -> List[Announcement]:
+    """카드 파싱
+
+    Args:
+        cards_data: 목록 페이지 evaluate 결과 ([{'taskId', 'title', 'status', 'organization', 'prize', 'dateText'}, ...])
+            (taskId는 카드 링크의 공모전 번호, 없으면 제목 기준 ID와 목록 URL)
+        now: 수집 시각
+        year: 사용하지 않음 (공모전은 연도 필터 없음, 파서 공통 시그니처)
+    """
+    announcements = []
+    for card in cards_data:
+        title = card.get('title', '')
+        if not title:
+            continue
+        task_id = card.get('taskId')
+        announcements.append(
+            Announcement(
+                id=make_id(task_id) if task_id else legacy_id(title),
+                source=SOURCE,
+                title=title,
+                url=DETAIL_URL.format(id=task_id) if task_id else LIST_URL,
+                organization=card.get('organization'),
+                deadline=parse_date(card.get('dateText', '')),
+                status=card.get('status'),
+                prize=card.get('prize'),
+                scraped_at=now,
+            )
+        )
+    return announcements
@@ -0,0 +1,87 @@
+"""
+기업마당 목록 행 파서
+페이지에서 뽑은 원본 행 → Announcement (브라우저 없이 동작)
+"""
+import re
+from datetime import datetime, timedelta
+from typing import List
+
+from src.models import Announcement
+
+
+SOURCE = "bizinfo"
+BASE_URL = "https://www.bizinfo.go.kr"
+# 지원사업 공고 목록
+LIST_URL = f"{BASE_URL}/web/lay1/bbs/S1T122C128/AS/74/list.do"
+# 목록 페이지 번호 파라미터 (백필에서 페이지로 직접 이동)
+PAGE_PARAM = "cpage"
+
+
+def page_url(page_num: int) -> str:
+    return f"{LIST_URL}?{PAGE_PARAM}={page_num}"
+
+
+def parse(rows_data: dict, now: datetime, year: int = None, all_years: bool = False) -> List[Announcement]:
+    """목록 행 파싱
+
+    Args:
+        rows_data: 목록 페이지 evaluate 결과 ({'rows': [...]})
+            (행 구조: [번호, 지원분야, 지원사업명, 신청기간, 소관부처, 사업수행기관, 등록일, 조회수])
+        now: 수집 시각 (접수중/마감 판단 기준)
+        year: 이 연도 공고만 (기본: now의 연도)
+        all_years: True면 연도 필터 없음 (과거 공고 백필용)
+    """
+    year = year or now.year
+    announcements = []
+    for row in rows_data.get('rows', []):
+        title = row.get('title', '')
+        if not title or len(title) < 5:
+            continue
+
+        # 연도 필터링
+        title_year_match = re.search(r'(20\d{2})년?', title)
+        if not all_years and title_year_match and int(title_year_match.group(1)) != year:
+            continue
+
+        # 신청기간에서 마감일 추출
+        period = row.get('period', '')
+        deadline = None
+        if '~' in period:
+            dates = re.findall(r'(\d{4})-(\d{2})-(\d{2})', period)
+            if dates:
+                try:
+                    last_date = dates[-1]
+                    deadline = datetime(int(last_date[0]), int(last_date[1]), int(last_date[2]))
+                except ValueError:
+                    pass
+
+        # URL 생성
+        href = row.get('href', '')
+        url = LIST_URL
+        if href:
+            if href.startswith('http'):
+                url = href
+            elif href.startswith('/'):
+                url = f"{BASE_URL}{href}"
+            elif 'pblancId' in href:
+                url = f"{BASE_URL}/web/lay1/bbs/S1T122C128/AS/74/{href}"
+
+        # 상태 판단 (마감일은 날짜만 있으므로 마감 당일까지 접수중)
+        status = None
+        if deadline:
+            status = "접수중" if now < deadline + timedelta(days=1) else "마감"
+
+        no = row.get('no', '')
+        announcements.append(
+            Announcement(
+                id=f"bizinfo_{no}_{title[:15].replace(' ', '_')}",
+                source=SOURCE,
+                title=title.strip()[:200],
+                url=url,
+                organization=row.get('department') or row.get('agency') or None,
+                deadline=deadline,
+                status=status,
+                scraped_at=now,
+            )
+        )
+    return announcements
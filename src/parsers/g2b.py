@@ -0,0 +1,94 @@
+"""
+나라장터 목록 행 파서
+입찰공고 프레임에서 뽑은 원본 행(rows_data) → Announcement (브라우저 없이 동작)
+"""
+import re
+from datetime import datetime
+from typing import List
+
+from src.models import Announcement
+
+
+SOURCE = "g2b"
+BASE_URL = "https://www.g2b.go.kr"
+
+_BID_NO_RE = re.compile(r'^\d+-\d+')
+_LEADING_DIGIT_RE = re.compile(r'^\d')
+_DATE_RE = re.compile(r'(\d{4})[/-](\d{2})[/-](\d{2})')
+
+
+def parse(rows_data: dict, now: datetime, year: int = None) -> List[Announcement]:
+    """목록 행 파싱
+
+    Args:
+        rows_data: 목록 프레임 evaluate 결과 ({'type': 'table', 'rows': [...]})
+            (행 구조: [업종, 공고번호-차수, 공고명, 공고기관, 수요기관, 계약방법, 입력일시, 입찰마감일시])
+        now: 수집 시각 (입찰중 판단 기준)
+        year: 사용하지 않음 (연도 필터 없음, 파서 공통 시그니처)
+    """
+    announcements = []
+    for idx, row in enumerate(rows_data.get('rows', [])):
+        cell_texts = row.get('cellTexts', [])
+        if len(cell_texts) < 3:
+            continue
+
+        # 헤더 행 스킵
+        if any(kw in str(cell_texts) for kw in ['업종', '공고번호', '번호', '순번']):
+            continue
+
+        title = ''
+        organization = ''
+        deadline = None
+        bid_no = ''
+
+        for text in cell_texts:
+            if not text:
+                continue
+
+            # 공고번호 (숫자-숫자 패턴)
+            if _BID_NO_RE.match(text):
+                bid_no = text
+
+            # 공고명 (가장 긴 텍스트)
+            if len(text) > len(title) and len(text) > 10:
+                if not _LEADING_DIGIT_RE.match(text) and '기관' not in text:
+                    title = text
+
+            # 기관명
+            if any(kw in text for kw in ['청', '부', '원', '처', '시', '군', '구', '대학', '공사', '공단']):
+                if len(text) < 30 and text != title:
+                    organization = text
+
+            # 마감일시 (YYYY/MM/DD 또는 YYYY-MM-DD 중 가장 늦은 날짜)
+            date_match = _DATE_RE.search(text)
+            if date_match:
+                try:
+                    y, m, d = date_match.groups()
+                    parsed_date = datetime(int(y), int(m), int(d))
+                    if deadline is None or parsed_date > deadline:
+                        deadline = parsed_date
+                except ValueError:
+                    pass
+
+        if not title or len(title) < 5:
+            continue
+
+        # 상세 URL은 onclick 스크립트로만 열려서 목록 기준 URL 사용
+        onclick = row.get('onclick', '') or ''
+        url = BASE_URL
+        if 'bidNm' in onclick:
+            url = f"{BASE_URL}/ep/tbid/tbidDetail.do"
+
+        announcements.append(
+            Announcement(
+                id=f"g2b_{bid_no or idx}_{title[:15].replace(' ', '_')}",
+                source=SOURCE,
+                title=title.strip()[:200],
+                url=url,
+                organization=organization or None,
+                deadline=deadline,
+                status="입찰중" if deadline and deadline > now else None,
+                scraped_at=now,
+            )
+        )
+    return announcements
@@ -0,0 +1,93 @@
+"""
+IRIS 목록 행 파서
+페이지에서 뽑은 원본 행(rows_data) → Announcement (브라우저 없이 동작)
+"""
+import re
+from datetime import datetime
+from typing import List
+
+from src.models import Announcement
+
+
+SOURCE = "iris"
+BASE_URL = "https://www.iris.go.kr"
+# 과제공고 목록 (상세 URL을 못 찾았을 때 사용)
+LIST_URL = f"{BASE_URL}/anmt/anmtList.do"
+
+_DATE_RE = re.compile(r'(\d{4})[.-](\d{2})[.-](\d{2})')
+_ANCM_RE = re.compile(r"ancmId['\"]?\s*[,:=]\s*['\"]?(\w+)")
+
+
+def parse(rows_data: dict, now: datetime, year: int = None) -> List[Announcement]:
+    """목록 행 파싱
+
+    Args:
+        rows_data: 목록 페이지 evaluate 결과 ({'type': 'table', 'rows': [...]})
+        now: 수집 시각
+        year: 사용하지 않음 (연도 필터 없음, 파서 공통 시그니처)
+    """
+    announcements = []
+    for idx, row in enumerate(rows_data.get('rows', [])):
+        cell_texts = row.get('cellTexts', [])
+        if len(cell_texts) < 2:
+            continue
+
+        # 일반적인 구조: [번호, 부처, 공고명, 접수기간, 상태 등]
+        title = ''
+        organization = ''
+        deadline = None
+        status = ''
+
+        for text in cell_texts:
+            # 제목 (가장 긴 텍스트)
+            if len(text) > len(title) and not text.isdigit():
+                if not any(kw in text for kw in ['접수', '마감', '진행', '종료']):
+                    title = text
+
+            # 부처/기관
+            if any(kw in text for kw in ['부', '청', '원', '처', '위원회', '재단', '진흥']):
+                if len(text) < 30:
+                    organization = text
+
+            # 상태
+            if any(kw in text for kw in ['접수중', '접수예정', '마감', '진행중', '종료']):
+                status = text
+
+            # 날짜 (마지막으로 나온 날짜)
+            date_match = _DATE_RE.search(text)
+            if date_match:
+                try:
+                    y, m, d = date_match.groups()
+                    deadline = datetime(int(y), int(m), int(d))
+                except ValueError:
+                    pass
+
+        if not title or len(title) < 5:
+            continue
+
+        # URL 생성
+        href = row.get('href', '') or ''
+        onclick = row.get('onclick', '') or ''
+        url = LIST_URL
+        if href.startswith('http'):
+            url = href
+        elif href.startswith('/'):
+            url = f"{BASE_URL}{href}"
+        elif 'ancmId' in onclick:
+            ancm_match = _ANCM_RE.search(onclick)
+            if ancm_match:
+                url = f"{BASE_URL}/contents/retrieveBsnsAncmView.do?ancmId={ancm_match.group(1)}"
+
+        announcements.append(
+            Announcement(
+                id=f"iris_{title[:30].replace(' ', '_')}_{idx}",
+                source=SOURCE,
+                title=title.strip(),
+                url=url,
+                organization=organization or None,
+                deadline=deadline,
+                status=status or None,
+                scraped_at=now,
+            )
+        )
+    return announcements
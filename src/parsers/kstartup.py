@@ -0,0 +1,103 @@
+"""
+K-Startup 목록 파서
+화면에서 뽑은 공고 항목(items_data) → Announcement (브라우저 없이 동작)
+목록 API로 받은 공고의 연도 필터/D-day 상태도 같은 기준으로 적용
+"""
+import re
+from datetime import datetime, timedelta
+from typing import List
+
+from src.models import Announcement
+
+
+SOURCE = "kstartup"
+BASE_URL = "https://www.k-startup.go.kr"
+# 진행중인 사업공고 목록
+LIST_URL = f"{BASE_URL}/web/contents/bizpbanc-ongoing.do"
+DETAIL_URL = f"{BASE_URL}/web/contents/bizpbanc-detail.do?pbancSn={{id}}"
+
+_D_DAY_RE = re.compile(r'D-(\d+)')
+_D_DAY_LINE_RE = re.compile(r'^D-\d+$')
+_YEAR_RE = re.compile(r'(20\d{2})년?')
+
+
+def _other_year(title: str, year: int) -> bool:
+    title_year_match = _YEAR_RE.search(title)
+    return bool(title_year_match) and int(title_year_match.group(1)) != year
+
+
+def parse(items_data: dict, now: datetime, year: int = None) -> List[Announcement]:
+    """화면 항목 파싱
+
+    Args:
+        items_data: 목록 페이지 evaluate 결과 ({'type': 'items', 'items': [...]})
+        now: 수집 시각 (D-day → 마감일 계산 기준)
+        year: 이 연도 공고만 (기본: now의 연도)
+    """
+    year = year or now.year
+    announcements = []
+    for idx, item in enumerate(items_data.get('items', [])):
+        lines = [l.strip() for l in item.get('text', '').split('\n') if l.strip()]
+        if len(lines) < 2:
+            continue
+
+        title = ''
+        organization = ''
+        deadline = None
+        d_day = ''
+
+        for line in lines:
+            # D-day
+            d_match = _D_DAY_RE.search(line)
+            if d_match:
+                d_day = f"D-{d_match.group(1)}"
+                deadline = now + timedelta(days=int(d_match.group(1)))
+
+            # 제목 (가장 긴 라인)
+            if len(line) > len(title) and len(line) > 10:
+                if not _D_DAY_LINE_RE.match(line) and not line.isdigit():
+                    if '조회' not in line and '스크랩' not in line:
+                        title = line
+
+            # 기관명 (짧은 텍스트 중 기관 키워드 포함)
+            if any(kw in line for kw in ['부', '청', '원', '처', '진흥', '재단', '센터']):
+                if len(line) < 30 and line != title:
+                    organization = line
+
+        if not title or len(title) < 5:
+            continue
+        if _other_year(title, year):
+            continue
+
+        pbanc_sn = item.get('pbancSn', '')
+        url = DETAIL_URL.format(id=pbanc_sn) if pbanc_sn else LIST_URL
+
+        announcements.append(
+            Announcement(
+                id=f"kstartup_{pbanc_sn or idx}_{title[:15].replace(' ', '_')}",
+                source=SOURCE,
+                title=title.strip()[:200],
+                url=url,
+                organization=organization or None,
+                deadline=deadline,
+                status=d_day or "진행중",
+                scraped_at=now,
+            )
+        )
+    return announcements
+
+
+def filter_captured(captured: List[Announcement], now: datetime, year: int = None) -> List[Announcement]:
+    """목록 API로 받은 공고에 연도 필터와 D-day 상태 적용 (화면 항목과 같은 기준)"""
+    year = year or now.year
+    today = now.date()
+    announcements = []
+    for a in captured:
+        if _other_year(a.title, year):
+            continue
+        if a.deadline and a.deadline.date() >= today:
+            a.status = f"D-{(a.deadline.date() - today).days}"
+        else:
+            a.status = "진행중"
+        announcements.append(a)
+    return announcements
@@ -0,0 +1,117 @@
+"""
+NTIS 목록 행 파서
+페이지에서 뽑은 원본 행(rows_data) → Announcement (브라우저 없이 동작)
+"""
+import re
+from datetime import datetime
+from typing import List
+
+from src.models import Announcement
+
+
+SOURCE = "ntis"
+BASE_URL = "https://www.ntis.go.kr"
+# 국가R&D 통합공고 페이지
+LIST_URL = f"{BASE_URL}/rndgate/eg/un/ra/mng.do"
+# 목록 페이지 번호 파라미터 (백필에서 페이지로 직접 이동)
+PAGE_PARAM = "pageIndex"
+
+
+def page_url(page_num: int) -> str:
+    return f"{LIST_URL}?{PAGE_PARAM}={page_num}"
+
+
+def parse(rows_data: dict, now: datetime, year: int = None, all_years: bool = False) -> List[Announcement]:
+    """목록 행 파싱
+
+    Args:
+        rows_data: 목록 페이지 evaluate 결과 ({'type': 'table', 'rows': [...]})
+        now: 수집 시각
+        year: 이 연도 공고만 (기본: now의 연도)
+        all_years: True면 연도 필터 없음 (과거 공고 백필용)
+    """
+    year = year or now.year
+    announcements = []
+    for idx, row in enumerate(rows_data.get('rows', [])):
+        # 페이지에서 행을 걸러 넘기면 원래 위치가 idx로 옴 (공고 ID가 바뀌지 않게)
+        idx = row.get('idx', idx)
+        cell_texts = row.get('cellTexts', [])
+        row_text = row.get('rowText', '')
+
+        # 헤더 행 스킵
+        if not cell_texts and not row_text:
+            continue
+        if any(kw in str(cell_texts) for kw in ['번호', '제목', '공고명', 'No', '순번']):
+            continue
+
+        # 공고 정보 추출
+        title = ''
+        organization = ''
+        deadline = None
+        status = ''
+        period = ''
+
+        for text in cell_texts:
+            if not text:
+                continue
+
+            # 제목 (가장 긴 텍스트)
+            if len(text) > len(title) and len(text) > 10:
+                if not any(kw in text for kw in ['접수', '마감', '종료', '부', '청', '원']):
+                    if not re.match(r'^\d+$', text):  # 숫자만 있는 건 스킵
+                        title = text
+
+            # 부처/기관
+            if any(kw in text for kw in ['부', '청', '원', '처', '위원회', '재단', '진흥', '연구']):
+                if len(text) < 50 and not title == text:
+                    organization = text
+
+            # 상태
+            if any(kw in text for kw in ['접수중', '접수예정', '마감', '진행', '종료', '공고중']):
+                status = text
+
+            # 기간 (날짜 범위)
+            if '~' in text or '-' in text:
+                date_match = re.search(r'(\d{4}[.-]\d{2}[.-]\d{2})', text)
+                if date_match:
+                    period = text
+
+        # 마감일 추출
+        if period:
+            dates = re.findall(r'(\d{4})[.-](\d{2})[.-](\d{2})', period)
+            if dates:
+                try:
+                    last_date = dates[-1]
+                    deadline = datetime(int(last_date[0]), int(last_date[1]), int(last_date[2]))
+                except ValueError:
+                    pass
+
+        if not title or len(title) < 5:
+            continue
+
+        # 연도 필터링 - 제목에 연도가 있으면 체크
+        title_year_match = re.search(r'(20\d{2})년?', title)
+        if not all_years and title_year_match and int(title_year_match.group(1)) != year:
+            continue  # 다른 연도 공고 스킵
+
+        # URL 생성
+        href = row.get('href', '')
+        url = LIST_URL
+        if href and href.startswith('http'):
+            url = href
+        elif href and href.startswith('/'):
+            url = f"{BASE_URL}{href}"
+
+        announcements.append(
+            Announcement(
+                id=f"ntis_{idx}_{title[:20].replace(' ', '_')}",
+                source=SOURCE,
+                title=title.strip()[:200],
+                url=url,
+                organization=organization or None,
+                deadline=deadline,
+                status=status or None,
+                scraped_at=now,
+            )
+        )
+    return announcements
@@ -0,0 +1,601 @@
+"""
+수집 파이프라인
+scrape → fingerprint → dedupe → enrich → notify 단계를 크기 제한 큐로 연결
+느린 페이지 이동 중에도 뒤 단계가 함께 돌고, 백필처럼 건수가 많아도 메모리가 일정함
+수집은 한 번만 하고 enrich/notify 단계에서 테넌트별로 나눠 동시에 발송
+"""
+import asyncio
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Type
+
+import httpx
+
+from src.budget import RunBudget
+from src.filters import Deduplicator, RelevanceScorer
+from src.health import CircuitBreaker
+from src.models import Announcement
+from src.notifier import TeamsNotifier
+from src.parsers import LEGACY_IDS
+from src.politeness import politeness
+from src.reminders import ReminderStore
+from src.scrapers import BaseScraper
+from src.scrapers.navigation import navigation_cache
+from src.scrapers.rowfilter import SeenRows
+from src.storage import AnnouncementStore, ChangeEvent, ChangeTracker, NotificationClaims, StateStore
+from src.storage.state import state as shared_state
+from src.tenants import Tenant
+
+
+# 단계 종료 표시
+_DONE = object()
+
+# 배정 시간이 이보다 짧으면 시작하지 않음 (브라우저 띄우는 시간도 안 됨)
+MIN_SOURCE_SECONDS = 15.0
+
+# 스크래퍼가 배정 시간을 넘겨도 이만큼 더 기다린 뒤 강제로 끊음
+SCRAPE_GRACE_SECONDS = 10.0
+
+_DELIVERIES_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tenant_deliveries (
+    run_at TEXT NOT NULL,
+    tenant TEXT NOT NULL,
+    sent INTEGER NOT NULL,
+    digest INTEGER NOT NULL,
+    dropped INTEGER NOT NULL,
+    failed INTEGER NOT NULL,
+    changes INTEGER NOT NULL,
+    routed INTEGER NOT NULL,
+    requests INTEGER NOT NULL,
+    seconds REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tenant_deliveries ON tenant_deliveries(tenant, run_at);
+"""
+
+
+@dataclass
+class TenantStats:
+    """테넌트별 발송 지표"""
+    sent: int = 0
+    digest: int = 0
+    dropped: int = 0
+    failed: int = 0  # 발송 실패 건수
+    changes: int = 0
+    routed: Dict[str, int] = field(default_factory=dict)  # 구독 채널별 발송 건수
+    requests: int = 0  # Webhook 호출 수
+    seconds: float = 0.0  # 발송에 걸린 시간
+
+    def summary(self) -> str:
+        line = (
+            f"발송 {self.sent}건, 요약 {self.digest}건, 제외 {self.dropped}건, "
+            f"변경 {self.changes}건, 실패 {self.failed}건 "
+            f"(호출 {self.requests}회, {self.seconds:.1f}초)"
+        )
+        if self.routed:
+            line += " / 구독 채널: " + ", ".join(f"{c} {n}건" for c, n in self.routed.items())
+        return line
+
+
+@dataclass
+class PipelineStats:
+    """실행 요약"""
+    scraped: Dict[str, int] = field(default_factory=dict)  # 출처별 수집 건수
+    errors: Dict[str, str] = field(default_factory=dict)  # 출처별 오류
+    skipped: Dict[str, str] = field(default_factory=dict)  # 서킷 브레이커/시간 부족으로 건너뛴 출처와 사유
+    partial: Dict[str, str] = field(default_factory=dict)  # 시간 예산을 다 써서 중간까지만 수집한 출처
+    new: int = 0
+    merged: int = 0
+    changes: int = 0
+    tenants: Dict[str, TenantStats] = field(default_factory=dict)
+    hosts: Dict[str, dict] = field(default_factory=dict)  # 호스트별 속도 제한 상태
+    health: Dict[str, str] = field(default_factory=dict)  # 정상이 아닌 출처의 헬스 상태
+    fallbacks: Dict[str, str] = field(default_factory=dict)  # 기억한 경로/셀렉터/프레임이 바뀐 출처 (사이트 개편 의심)
+
+    @property
+    def sent(self) -> int:
+        return sum(t.sent for t in self.tenants.values())
+
+    @property
+    def failed(self) -> int:
+        return sum(t.failed for t in self.tenants.values())
+
+    def summary(self) -> str:
+        scraped = ", ".join(f"{name} {count}건" for name, count in self.scraped.items())
+        lines = [
+            f"수집: {scraped or '없음'}",
+            f"새 공고 {self.new}건 (중복 병합 {self.merged}건), 변경 {self.changes}건",
+        ]
+        for name, tenant in self.tenants.items():
+            lines.append(f"[{name}] {tenant.summary()}")
+        for name, error in self.errors.items():
+            lines.append(f"오류 [{name}] {error}")
+        for name, reason in self.partial.items():
+            lines.append(f"부분 수집 [{name}] {reason} ({self.scraped.get(name, 0)}건)")
+        for name, reason in self.skipped.items():
+            if name not in self.health:
+                lines.append(f"건너뜀 [{name}] {reason}")
+        for name, state in self.health.items():
+            skipped = " (이번 실행 건너뜀)" if name in self.skipped else ""
+            lines.append(f"헬스 [{name}] {state}{skipped}")
+        for key, change in self.fallbacks.items():
+            lines.append(f"경로 변경 [{key}] {change}")
+        for host, h in self.hosts.items():
+            line = f"호스트 {host}: 요청 {h['requests']}회, 대기 {h['waited']}초, 제한 {h['throttled']}회"
+            if h["backoff_remaining"]:
+                line += f" (백오프 {h['backoff_remaining']}초 남음)"
+            lines.append(line)
+        return "\n".join(lines)
+
+
+@dataclass
+class _Scraped:
+    """수집 단계 출력 (출처 하나의 배치)"""
+    source: str
+    announcements: List[Announcement]
+    rows: List[int] = field(default_factory=list)  # 이 배치와 함께 넘어온 목록 행 지문
+
+
+@dataclass
+class _RowBatch:
+    """배치 하나와 함께 넘어온 목록 행 지문 (모든 테넌트에 발송이 끝나야 기록)"""
+    source: str
+    fingerprints: List[int]
+    waiting: int  # 아직 발송이 안 끝난 테넌트 수
+    failed: bool = False  # 발송에 실패한 테넌트가 있으면 기록하지 않음 (다음 실행에서 다시 읽음)
+
+
+@dataclass
+class _Enriched:
+    """enrich 단계 출력 (테넌트 하나분)"""
+    send: List[Announcement] = field(default_factory=list)
+    digest: List[Announcement] = field(default_factory=list)
+    quiet_ids: Set[str] = field(default_factory=set)  # 알리지 않고 본 것으로만 처리할 ID (중복/관련도 낮음)
+    rows: List[_RowBatch] = field(default_factory=list)  # 이 버퍼에 공고가 들어온 배치
+
+    def extend(self, other: "_Enriched"):
+        self.send.extend(other.send)
+        self.digest.extend(other.digest)
+        self.quiet_ids |= other.quiet_ids
+        self.rows.extend(other.rows)
+
+    def __len__(self):
+        return len(self.send) + len(self.digest)
+
+
+class _TenantRun:
+    """실행 중 테넌트 하나의 상태 (seen 목록, 관련도 점수기, 발송 버퍼)"""
+
+    def __init__(self, tenant: Tenant, client: httpx.AsyncClient, corpus: List[str], state: StateStore):
+        self.tenant = tenant
+        self.client = client
+        self.state = state
+        self.seen_ids = tenant.load_seen(state)
+        self.notifier = TeamsNotifier(tenant.webhook_url, client=client)
+        self.scorer = None
+        if tenant.profile:
+            # 저장된 이력 + 프로필로 실행당 한 번만 학습 (이력이 비어도 점수 매길 배치로 학습하지 않음)
+            self.scorer = RelevanceScorer(tenant.profile).fit(corpus)
+        self.channel_notifiers: Dict[str, TeamsNotifier] = {}
+        self.pending = _Enriched()
+        self.changes: List[ChangeEvent] = []
+        self.stats = TenantStats()
+        # 이번 실행에서 이 테넌트에 넘긴 공고 (앞 배치 공고의 다른 출처 중복 판단용)
+        self.delivered: Set[str] = set()
+
+    def adopt_legacy_ids(self, batch: List[Announcement]) -> Set[str]:
+        """ID 규칙이 바뀐 출처의 공고가 예전 ID로 seen 목록에 있으면 새 ID도 본 것으로 기록 (다시 알리지 않음)
+
+        Returns:
+            새로 기록한 ID
+        """
+        adopted = set()
+        for a in batch:
+            legacy = LEGACY_IDS.get(a.source)
+            if legacy and a.id not in self.seen_ids and legacy(a) in self.seen_ids:
+                adopted.add(a.id)
+        if adopted:
+            self.seen_ids = self.tenant.save_seen(self.state, self.seen_ids | adopted)
+        return adopted
+
+    def accepts(self, a: Announcement) -> bool:
+        """출처 필터 (다른 출처 중복을 합친 공고는 합쳐진 출처 중 하나라도 받으면 통과)"""
+        return self.tenant.accepts(a.source) or any(self.tenant.accepts(link["source"]) for link in a.links)
+
+    def enrich(
+        self,
+        canonical: List[Announcement],
+        merged_ids: Set[str],
+        matches: Dict[str, List[str]],
+    ) -> _Enriched:
+        """출처 필터 + 이미 알린 공고 제외 (이 테넌트에 알린 다른 출처 같은 사업 포함) + 관련도 분류"""
+        notified = self.seen_ids | self.delivered
+        quiet = set(merged_ids)
+        candidates = []
+        for a in canonical:
+            if a.id in self.seen_ids or not self.accepts(a):
+                continue
+            if any(other_id in notified for other_id in matches.get(a.id, ())):
+                quiet.add(a.id)
+                continue
+            candidates.append(a)
+        self.delivered.update(a.id for a in candidates)
+        if not self.scorer or not candidates:
+            return _Enriched(candidates, [], quiet)
+        result = self.scorer.partition(candidates)
+        self.stats.dropped += len(result.drop)
+        return _Enriched(result.send, result.digest, quiet | {a.id for a in result.drop})
+
+
+class ObserverPipeline:
+    """공고 수집/알림 파이프라인
+
+    Args:
+        scrapers: 출처 이름 → 스크래퍼 클래스
+        store: 공고 이력 저장소
+        tenants: 알림 받을 테넌트 목록
+        reminders: 마감 리마인더 저장소 (대표 테넌트에 프로필이 있으면 발송 공고를 관심 공고로 등록)
+        health: 출처별 서킷 브레이커 (없으면 항상 수집)
+        queue_size: 단계 사이 큐 크기 (배치 단위)
+        max_browsers: 동시에 띄울 브라우저 수
+        flush_size: 테넌트별로 이 건수가 모이면 중간 발송
+        max_connections: 테넌트 발송이 공유하는 HTTP 연결 수
+        budget: 실행 시간 예산 (없으면 제한 없음, 있으면 남은 수집 시간을 출처에 나눠 줌)
+        seen_rows: 이번 실행의 목록 행 지문 (스크래퍼에 넘김, 없으면 이미 본 행을 거르지 않음)
+        state: 이번 실행의 상태 저장소 (테넌트 seen 목록, 없으면 새로 만듦)
+    """
+
+    def __init__(
+        self,
+        scrapers: Dict[str, Type[BaseScraper]],
+        store: AnnouncementStore,
+        tenants: List[Tenant],
+        reminders: Optional[ReminderStore] = None,
+        health: Optional[CircuitBreaker] = None,
+        queue_size: int = 8,
+        max_browsers: int = 2,
+        flush_size: int = 20,
+        max_connections: int = 10,
+        budget: Optional[RunBudget] = None,
+        seen_rows: Optional[SeenRows] = None,
+        state: Optional[StateStore] = None,
+    ):
+        self.scrapers = scrapers
+        self.store = store
+        self.tenants = tenants
+        self.reminders = reminders
+        self.health = health
+        self.queue_size = queue_size
+        self.flush_size = flush_size
+        self.max_connections = max_connections
+        self.max_browsers = max_browsers
+        self.browsers = asyncio.Semaphore(max_browsers)
+        self.budget = budget
+        self.seen_rows = seen_rows
+        self.state = state or shared_state.scope()
+        self._waiting = len(scrapers)  # 아직 수집을 시작하지 않은 출처 수 (시간 배분용)
+
+        self.tracker = ChangeTracker(store.conn)
+        self.deduplicator = Deduplicator(store.conn)
+        # 겹쳐 도는 다른 실행과 같은 공고를 두 번 알리지 않도록 발송 전에 선점
+        self.run_id = uuid.uuid4().hex
+        self.claims = NotificationClaims(store.conn, self.run_id)
+        self.store.conn.executescript(_DELIVERIES_SCHEMA)
+
+        self.stats = PipelineStats()
+        self.runs: List[_TenantRun] = []
+        self.client: Optional[httpx.AsyncClient] = None
+        # 이번 실행에서 알림 대상으로 넘긴 공고 (다른 출처 중복 링크 연결용)
+        self.emitted: Dict[str, Announcement] = {}
+
+    async def run(self) -> PipelineStats:
+        """전체 파이프라인 실행"""
+        run_at = datetime.now()
+        traffic = politeness.track()
+        limits = httpx.Limits(max_connections=self.max_connections)
+        async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+            self.client = client
+            corpus = self.store.recent_texts() if any(t.profile for t in self.tenants) else []
+            self.runs = [_TenantRun(tenant, client, corpus, self.state) for tenant in self.tenants]
+            for run in self.runs:
+                self.stats.tenants[run.tenant.name] = run.stats
+
+            scraped = asyncio.Queue(self.queue_size)
+            fingerprinted = asyncio.Queue(self.queue_size)
+            deduped = asyncio.Queue(self.queue_size)
+            enriched = asyncio.Queue(self.queue_size)
+
+            await asyncio.gather(
+                self._scrape_all(scraped),
+                self._stage(scraped, fingerprinted, self._fingerprint),
+                self._stage(fingerprinted, deduped, self._dedupe),
+                self._stage(deduped, enriched, self._enrich),
+                self._notify(enriched),
+            )
+
+        self.stats.hosts = politeness.snapshot(traffic)
+        if self.health:
+            self.stats.health = self.health.snapshot()
+        self.stats.fallbacks = navigation_cache.fallbacks_since(run_at)
+        self._record_deliveries(run_at)
+        self.claims.prune()
+        return self.stats
+
+    async def _stage(self, inbox: asyncio.Queue, outbox: asyncio.Queue, func):
+        """inbox 배치를 func로 처리해 outbox로 넘김 (결과가 None이면 건너뜀)"""
+        while True:
+            item = await inbox.get()
+            if item is _DONE:
+                await outbox.put(_DONE)
+                return
+            result = func(item)
+            if result is not None:
+                await outbox.put(result)
+
+    async def _scrape_all(self, outbox: asyncio.Queue):
+        await asyncio.gather(*(
+            self._scrape(name, scraper_cls, outbox)
+            for name, scraper_cls in self.scrapers.items()
+        ))
+        await outbox.put(_DONE)
+
+    async def _scrape(self, name: str, scraper_cls: Type[BaseScraper], outbox: asyncio.Queue):
+        if self.health:
+            reason = await self.health.admit(name, scraper_cls.BASE_URL, self.client)
+            if reason:
+                self.stats.skipped[name] = reason
+                print(f"{name} 건너뜀: {reason}")
+                self._waiting -= 1
+                return
+
+        async with self.browsers:
+            allotted = None
+            if self.budget:
+                allotted = self.budget.allocate(self._waiting, self.max_browsers)
+            self._waiting -= 1
+            if allotted is not None and allotted < MIN_SOURCE_SECONDS:
+                self.stats.skipped[name] = "실행 시간 부족"
+                print(f"{name} 건너뜀: 실행 시간 부족 ({allotted:.0f}초)")
+                return
+
+            print(f"{name} 수집 중..." + (f" (예산 {allotted:.0f}초)" if allotted is not None else ""))
+            self.stats.scraped[name] = 0
+            scraper = None
+            timed_out = False
+            try:
+                scraper = scraper_cls()
+                scraper.seen_rows = self.seen_rows
+                if allotted is not None:
+                    scraper.deadline = time.monotonic() + allotted
+                # 스크래퍼가 예산을 못 지키고 멈춰 있어도 여유 시간 뒤에는 끊음 (이미 넘긴 배치는 그대로 처리)
+                hard_limit = allotted + SCRAPE_GRACE_SECONDS if allotted is not None else None
+                await asyncio.wait_for(self._collect(name, scraper, outbox), hard_limit)
+            except asyncio.TimeoutError:
+                timed_out = True
+            except Exception as e:
+                self.stats.errors[name] = str(e)[:200]
+                print(f"  → {name} 오류: {e}")
+
+            if timed_out or (scraper and scraper.out_of_time()):
+                # 시간 예산 소진: 모은 게 있으면 부분 수집, 하나도 없으면 오류
+                reason = "시간 예산 소진"
+                if self.stats.scraped[name]:
+                    self.stats.partial[name] = reason
+                    self.stats.errors.pop(name, None)
+                else:
+                    self.stats.errors[name] = reason
+                print(f"  → {name} {reason} ({self.stats.scraped[name]}건까지)")
+            elif name not in self.stats.errors:
+                print(f"  → {name} {self.stats.scraped[name]}건 수집")
+
+        if self.health:
+            if name in self.stats.errors:
+                self.health.record_failure(name, self.stats.errors[name])
+            else:
+                self.health.record_success(name)
+
+    async def _collect(self, name: str, scraper: BaseScraper, outbox: asyncio.Queue):
+        """스크래퍼 배치를 받는 대로 다음 단계로 넘김"""
+        async with scraper:
+            async for batch in scraper.stream_announcements():
+                self.stats.scraped[name] += len(batch)
+                # 행 지문은 배치와 함께 넘김 (넘기다 끊기면 배치와 함께 버려져 다음 실행에서 다시 읽음)
+                await outbox.put(_Scraped(name, batch, scraper.take_rows()))
+            # 공고가 하나도 안 나온 페이지의 행은 넘길 배치가 없으므로 바로 기록
+            self._observe_rows(name, scraper.take_rows())
+            if scraper.error:
+                self.stats.errors[name] = scraper.error[:200]
+
+    def _observe_rows(self, source: str, fingerprints: List[int]):
+        """처리가 끝난 배치의 목록 행 지문 기록 (commit 전까지는 필터에 반영 안 됨)"""
+        if self.seen_rows and fingerprints:
+            self.seen_rows.observe(source, fingerprints)
+
+    def _settle_rows(self, rows: List[_RowBatch], delivered: bool):
+        """테넌트 하나의 발송 결과를 배치별로 반영 (모든 테넌트에 발송이 끝난 배치의 행만 기록)"""
+        for batch in rows:
+            batch.waiting -= 1
+            batch.failed |= not delivered
+            if batch.waiting == 0 and not batch.failed:
+                self._observe_rows(batch.source, batch.fingerprints)
+
+    def _fingerprint(self, item: _Scraped) -> Optional[tuple]:
+        """변경 감지 + 이력 저장 + 새 공고 선별 (어느 테넌트에게라도 새 공고면 통과)"""
+        batch = item.announcements
+        for run in self.runs:
+            run.adopt_legacy_ids(batch)
+        events = self.tracker.detect(batch)
+        for run in self.runs:
+            run.changes.extend(e for e in events if e.announcement.id in run.seen_ids)
+        self.stats.changes += len(events)
+        if self.reminders:
+            # 마감이 연장된 관심 공고는 리마인더를 새 마감일로 다시 예약
+            extended = [
+                e.announcement for e in events
+                if e.field == "deadline" and self.reminders.is_watched(e.announcement.id)
+            ]
+            self.reminders.watch(extended)
+        self.store.upsert_many(batch)
+
+        new = [
+            a for a in batch
+            if a.id not in self.emitted and any(
+                a.id not in run.seen_ids and run.accepts(a) for run in self.runs
+            )
+        ]
+        self.stats.new += len(new)
+        if not new:
+            # 알릴 공고가 없는 배치는 이력 저장으로 처리 끝
+            self._observe_rows(item.source, item.rows)
+            return None
+        return new, _RowBatch(item.source, item.rows, len(self.runs))
+
+    def _dedupe(self, item: tuple) -> tuple:
+        """출처 간 중복 병합
+
+        배치 안의 같은 사업은 대표 공고 하나로 합치고, 과거 공고와 같은 사업인지는 matches로만 넘김
+        (테넌트마다 알린 공고가 다르므로 과거 공고 기준 제외는 _enrich에서 테넌트별로 판단)
+        """
+        batch, rows = item
+        result = self.deduplicator.merge(batch, set())
+        for a in result.canonical:
+            # 앞 배치에서 넘긴 공고와 같은 사업이면 그 공고에도 링크 추가 (아직 발송 전이면 카드에 반영)
+            for other_id in result.matches.get(a.id, ()):
+                target = self.emitted.get(other_id)
+                if target is not None:
+                    target.links.append({"source": a.source, "url": a.url})
+        self.deduplicator.index(batch)
+        for a in result.canonical:
+            self.emitted[a.id] = a
+        self.stats.merged += len(result.merged) + len(result.matches)
+        return result.canonical, set(result.merged), result.matches, rows
+
+    def _enrich(self, item: tuple) -> Dict[str, _Enriched]:
+        """테넌트별 필터 + 관련도 분류"""
+        canonical, merged_ids, matches, rows = item
+        result = {}
+        for run in self.runs:
+            enriched = run.enrich(canonical, merged_ids, matches)
+            enriched.rows.append(rows)
+            result[run.tenant.name] = enriched
+        return result
+
+    async def _notify(self, inbox: asyncio.Queue):
+        runs = {run.tenant.name: run for run in self.runs}
+        while True:
+            item = await inbox.get()
+            if item is _DONE:
+                break
+            # 수집 시간이 끝나 정리 시간에 들어왔으면 모으지 않고 바로 발송
+            flush_size = 1 if self.budget and not self.budget.scrape_remaining() else self.flush_size
+            ready = []
+            for name, enriched in item.items():
+                run = runs[name]
+                run.pending.extend(enriched)
+                if len(run.pending) >= flush_size:
+                    ready.append(run)
+            if ready:
+                await asyncio.gather(*(self._flush(run) for run in ready))
+
+        # 남은 공고와 변경 알림을 테넌트별로 동시에 발송
+        await asyncio.gather(*(self._finish(run) for run in self.runs))
+
+    async def _finish(self, run: _TenantRun):
+        await self._flush(run)
+        run.tenant.flush_seen(run.state)
+        if run.changes:
+            start = time.monotonic()
+            run.stats.requests += 1
+            if await run.notifier.send_changes(run.changes):
+                run.stats.changes = len(run.changes)
+                print(f"[{run.tenant.name}] 변경 알림 발송 완료!")
+            else:
+                print(f"[{run.tenant.name}] 변경 알림 발송 실패!")
+            run.stats.seconds += time.monotonic() - start
+
+    async def _flush(self, run: _TenantRun):
+        """테넌트 버퍼 발송 후 성공하면 본 것으로 기록 (seen 목록은 _finish에서 한 번에 저장)"""
+        pending, run.pending = run.pending, _Enriched()
+        send, digest = pending.send, pending.digest
+        if not send and not digest and not pending.quiet_ids:
+            self._settle_rows(pending.rows, delivered=True)
+            return
+
+        claimed = self.claims.claim(run.tenant.name, [a.id for a in send + digest])
+        skipped = len(send) + len(digest) - len(claimed)
+        if skipped:
+            print(f"[{run.tenant.name}] 다른 실행이 이미 알렸거나 발송 중인 공고 {skipped}건 제외")
+            send = [a for a in send if a.id in claimed]
+            digest = [a for a in digest if a.id in claimed]
+
+        start = time.monotonic()
+        run.stats.requests += 1 if send else 0
+        if not await run.notifier.send_new_announcements(send):
+            run.stats.seconds += time.monotonic() - start
+            print(f"[{run.tenant.name}] Teams 알림 발송 실패!")
+            run.stats.failed += len(send) + len(digest)
+            self.claims.release(run.tenant.name, claimed)
+            self._settle_rows(pending.rows, delivered=False)
+            return
+        # 카드는 이미 나갔으므로 요약 발송이 실패해도 카드 공고는 보낸 것으로 기록 (다시 보내면 중복)
+        self.claims.complete(run.tenant.name, [a.id for a in send])
+
+        run.stats.requests += 1 if digest else 0
+        delivered = await run.notifier.send_digest(digest)
+        if not delivered:
+            print(f"[{run.tenant.name}] Teams 요약 발송 실패!")
+            run.stats.failed += len(digest)
+            self.claims.release(run.tenant.name, [a.id for a in digest])
+            digest = []
+        else:
+            self.claims.complete(run.tenant.name, [a.id for a in digest])
+        run.stats.seconds += time.monotonic() - start
+
+        if send or digest:
+            print(f"[{run.tenant.name}] Teams 알림 발송 완료! ({len(send) + len(digest)}건)")
+        # 요약 발송이 실패한 배치의 행은 다음 실행에서 다시 읽어 요약 공고를 다시 보냄
+        self._settle_rows(pending.rows, delivered)
+        run.stats.sent += len(send)
+        run.stats.digest += len(digest)
+        run.seen_ids |= {a.id for a in send} | {a.id for a in digest} | pending.quiet_ids
+        run.seen_ids = run.tenant.save_seen(run.state, run.seen_ids)
+
+        if self.reminders and run.tenant.primary and run.scorer:
+            self.reminders.watch(send)
+        if run.tenant.watchlist:
+            await self._route(run, send + digest)
+
+    async def _route(self, run: _TenantRun, announcements: List[Announcement]):
+        """구독 채널별 발송 (실패해도 기본 채널 발송 결과에는 영향 없음)"""
+        watchlist = run.tenant.watchlist
+        for channel, items in watchlist.route(announcements).items():
+            notifier = run.channel_notifiers.get(channel)
+            if notifier is None:
+                notifier = TeamsNotifier(watchlist.channels[channel], client=run.client)
+                run.channel_notifiers[channel] = notifier
+            start = time.monotonic()
+            run.stats.requests += 1
+            if await notifier.send_new_announcements(items):
+                run.stats.routed[channel] = run.stats.routed.get(channel, 0) + len(items)
+            else:
+                print(f"[{run.tenant.name}] 구독 채널 발송 실패: {channel}")
+            run.stats.seconds += time.monotonic() - start
+
+    def _record_deliveries(self, run_at: datetime):
+        """테넌트별 발송 지표 기록"""
+        with self.store.conn:
+            self.store.conn.executemany(
+                """
+                INSERT INTO tenant_deliveries (
+                    run_at, tenant, sent, digest, dropped, failed, changes, routed, requests, seconds
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        run_at.isoformat(), name, s.sent, s.digest, s.dropped, s.failed,
+                        s.changes, sum(s.routed.values()), s.requests, round(s.seconds, 3),
+                    )
+                    for name, s in self.stats.tenants.items()
+                ],
+            )
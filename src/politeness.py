@@ -0,0 +1,224 @@
+"""
+호스트별 요청 속도 제한 (정부 포털 과부하/차단 방지)
+- 토큰 버킷으로 초당 요청 수 제한
+- 호스트별 동시 요청 수 제한
+- 429/5xx/타임아웃이 나면 지수 백오프
+Playwright 페이지 이동과 httpx 요청이 같은 스케줄러(politeness)를 공유함
+Teams Webhook은 수집 대상이 아니므로 따로(webhooks), 호스트가 아닌 Webhook URL마다 제한
+속도 제한 상태는 프로세스 전체가 공유하고, 요청/대기 횟수는 실행(track)마다 따로 집계
+"""
+import asyncio
+import os
+import random
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+# 백오프 대상 HTTP 상태 코드
+BACKOFF_STATUSES = {429, 500, 502, 503, 504}
+
+
+@dataclass
+class HostPolicy:
+    """호스트별 제한 설정"""
+    rate: float = 1.0  # 초당 요청 수
+    burst: int = 3  # 한 번에 몰아 쓸 수 있는 요청 수
+    concurrency: int = 2  # 동시 요청 수
+    base_backoff: float = 2.0  # 첫 백오프 (초)
+    max_backoff: float = 60.0  # 최대 백오프 (초)
+
+    @classmethod
+    def from_env(cls, prefix: str = "RNDO_HOST", **defaults) -> "HostPolicy":
+        """<prefix>_RATE, <prefix>_BURST, <prefix>_CONCURRENCY (없으면 defaults, 그다음 기본값)"""
+        base = cls(**defaults)
+        base.rate = float(os.environ.get(f"{prefix}_RATE", base.rate))
+        base.burst = int(os.environ.get(f"{prefix}_BURST", base.burst))
+        base.concurrency = int(os.environ.get(f"{prefix}_CONCURRENCY", base.concurrency))
+        return base
+
+
+@dataclass
+class HostTraffic:
+    """실행 한 번의 호스트별 요청 집계 (실행 요약에 표시)"""
+    requests: int = 0
+    throttled: int = 0  # 429/5xx/타임아웃 횟수
+    waited: float = 0.0  # 대기한 총 시간 (초)
+
+
+@dataclass
+class HostState:
+    """호스트별 현재 상태 (프로세스 전체 공유)"""
+    policy: HostPolicy
+    tokens: float = 0.0
+    updated: float = field(default_factory=time.monotonic)
+    failures: int = 0  # 연속 실패 횟수
+    blocked_until: float = 0.0  # 백오프 끝나는 시각 (monotonic)
+    in_flight: int = 0
+    loop: Optional[asyncio.AbstractEventLoop] = None
+    lock: Optional[asyncio.Lock] = None
+    slots: Optional[asyncio.Semaphore] = None
+
+    def __post_init__(self):
+        self.tokens = float(self.policy.burst)
+
+    def bind(self):
+        """현재 이벤트 루프용 동기화 객체 준비 (실행마다 루프가 바뀌어도 상태는 유지)"""
+        loop = asyncio.get_running_loop()
+        if self.loop is not loop:
+            self.loop = loop
+            self.lock = asyncio.Lock()
+            self.slots = asyncio.Semaphore(self.policy.concurrency)
+            self.in_flight = 0
+
+
+class RequestSlot:
+    """요청 한 건의 허가 (async with로 사용)
+
+    with 블록 안에서 status에 응답 코드를 넣으면 백오프 판단에 사용
+    예외(타임아웃 등)로 끝나도 실패로 기록
+    """
+
+    def __init__(self, scheduler: "PolitenessScheduler", host: str):
+        self.scheduler = scheduler
+        self.host = host
+        self.status: Optional[int] = None
+
+    async def __aenter__(self) -> "RequestSlot":
+        await self.scheduler._acquire(self.host)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        failed = self.status in BACKOFF_STATUSES or (
+            exc_type is not None and "timeout" in exc_type.__name__.lower()
+        )
+        self.scheduler._release(self.host, failed)
+        return False
+
+
+class PolitenessScheduler:
+    """호스트별 요청 스케줄러
+
+    Args:
+        default_policy: 기본 제한 (없으면 RNDO_HOST_* 환경변수)
+        policies: 호스트별 제한
+        per_url: True면 호스트가 아닌 URL마다 따로 제한 (Webhook처럼 같은 호스트에 URL마다 한도가 따로인 경우)
+    """
+
+    def __init__(self, default_policy: HostPolicy = None, policies: Dict[str, HostPolicy] = None, per_url: bool = False):
+        self.default_policy = default_policy or HostPolicy.from_env()
+        self.policies = policies or {}
+        self.per_url = per_url
+        self.hosts: Dict[str, HostState] = {}
+        # 지금 태스크가 속한 실행의 집계 (track()에서 설정, 하위 태스크는 생성 시점 값을 물려받음)
+        self._run_traffic: ContextVar[Optional[Dict[str, HostTraffic]]] = ContextVar(
+            f"politeness_run_traffic_{id(self)}", default=None
+        )
+
+    def request(self, url: str) -> RequestSlot:
+        """url 호스트(per_url이면 url)에 대한 요청 허가"""
+        return RequestSlot(self, url if self.per_url else urlparse(url).hostname or url)
+
+    def track(self) -> Dict[str, HostTraffic]:
+        """이번 실행의 요청 집계 시작
+
+        현재 태스크와 이후 여기서 만든 태스크의 요청만 세므로
+        같은 프로세스에서 겹쳐 도는 다른 실행의 요청은 섞이지 않음
+
+        Returns:
+            호스트 → 집계 (snapshot()에 넘김)
+        """
+        traffic: Dict[str, HostTraffic] = {}
+        self._run_traffic.set(traffic)
+        return traffic
+
+    def _traffic(self, host: str) -> HostTraffic:
+        traffic = self._run_traffic.get()
+        if traffic is None:
+            return HostTraffic()  # 집계 중인 실행 밖의 요청
+        return traffic.setdefault(host, HostTraffic())
+
+    def _state(self, host: str) -> HostState:
+        state = self.hosts.get(host)
+        if state is None:
+            state = HostState(self.policies.get(host, self.default_policy))
+            self.hosts[host] = state
+        state.bind()
+        return state
+
+    async def _acquire(self, host: str):
+        state = self._state(host)
+        start = time.monotonic()
+        await state.slots.acquire()
+        try:
+            async with state.lock:
+                # 백오프 중이면 끝날 때까지 대기
+                delay = state.blocked_until - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                # 토큰 버킷
+                while True:
+                    now = time.monotonic()
+                    state.tokens = min(
+                        state.policy.burst,
+                        state.tokens + (now - state.updated) * state.policy.rate,
+                    )
+                    state.updated = now
+                    if state.tokens >= 1:
+                        state.tokens -= 1
+                        break
+                    await asyncio.sleep((1 - state.tokens) / state.policy.rate)
+        except BaseException:
+            state.slots.release()
+            raise
+
+        traffic = self._traffic(host)
+        traffic.requests += 1
+        traffic.waited += time.monotonic() - start
+        state.in_flight += 1
+
+    def _release(self, host: str, failed: bool):
+        state = self.hosts[host]
+        state.in_flight -= 1
+        state.slots.release()
+        if failed:
+            state.failures += 1
+            self._traffic(host).throttled += 1
+            backoff = min(
+                state.policy.max_backoff,
+                state.policy.base_backoff * (2 ** (state.failures - 1)),
+            )
+            # 여러 요청이 동시에 재시도하지 않도록 지터 추가
+            backoff *= random.uniform(0.8, 1.2)
+            state.blocked_until = max(state.blocked_until, time.monotonic() + backoff)
+        else:
+            state.failures = 0
+
+    def snapshot(self, traffic: Dict[str, HostTraffic]) -> Dict[str, dict]:
+        """실행 한 번의 호스트별 요약 (집계는 그 실행 것, 연속 실패/백오프는 현재 호스트 상태)
+
+        Args:
+            traffic: track()이 돌려준 집계
+        """
+        now = time.monotonic()
+        summary = {}
+        for host, counts in traffic.items():
+            state = self.hosts.get(host)
+            summary[host] = {
+                "requests": counts.requests,
+                "throttled": counts.throttled,
+                "failures": state.failures if state else 0,
+                "backoff_remaining": round(max(0.0, state.blocked_until - now), 1) if state else 0.0,
+                "waited": round(counts.waited, 1),
+            }
+        return summary
+
+
+# 프로세스 전체에서 공유하는 스케줄러 (수집 대상 사이트)
+politeness = PolitenessScheduler()
+
+# Teams Webhook용 (수집 제한과 별개, Webhook마다 따로 제한해 테넌트별 발송이 서로 기다리지 않음)
+webhooks = PolitenessScheduler(HostPolicy.from_env("RNDO_WEBHOOK", rate=4.0, burst=4), per_url=True)
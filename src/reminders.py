@@ -0,0 +1,192 @@
+"""
+마감 리마인더 (D-14 / D-7 / D-1)
+관심 공고의 마감일로 알림 예정 시각을 미리 계산해 인덱스에 넣어두고,
+실행마다 예정 시각이 지난 것만 조회해 한 번에 발송
+"""
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+from typing import Iterable, List, Optional
+
+from src.models import Announcement
+
+
+# 마감 며칠 전에 알릴지
+DEFAULT_OFFSETS = (14, 7, 1)
+
+# 리마인더 발송 시각 (해당 날짜 오전 9시)
+REMIND_AT = time(9, 0)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reminders (
+    announcement_id TEXT NOT NULL,
+    offset_days INTEGER NOT NULL,
+    due_at TEXT NOT NULL,
+    deadline TEXT NOT NULL,
+    sent_at TEXT,
+    PRIMARY KEY (announcement_id, offset_days)
+);
+CREATE INDEX IF NOT EXISTS idx_reminders_pending ON reminders(due_at) WHERE sent_at IS NULL;
+"""
+
+
+@dataclass
+class Reminder:
+    """발송할 리마인더"""
+    announcement: Announcement
+    offset_days: int
+
+
+class ReminderStore:
+    """마감 리마인더 저장소
+
+    (공고 ID, D-n) 기본키에 발송 전에 sent_at을 기록(선점)하므로 같은 리마인더는 두 번 나가지 않음
+    미발송 건만 due_at 부분 인덱스에 올라 있어 조회 비용은 발송할 건수에 비례
+    """
+
+    def __init__(self, conn: sqlite3.Connection, offsets: Iterable[int] = DEFAULT_OFFSETS):
+        self.conn = conn
+        self.offsets = tuple(offsets)
+        self.conn.executescript(_SCHEMA)
+
+    def watch(self, announcements: Iterable[Announcement], now: datetime = None) -> int:
+        """관심 공고로 등록하고 리마인더 예약
+
+        이미 지난 D-n은 건너뜀. 마감일이 바뀐 공고를 다시 등록하면 미발송 건을 새 마감일로 갱신
+
+        Returns:
+            새로 예약하거나 새 마감일로 갱신한 리마인더 수 (이미 같은 마감일로 예약된 건은 세지 않음)
+        """
+        now = now or datetime.now()
+        count = 0
+        with self.conn:
+            for a in announcements:
+                if not a.deadline:
+                    continue
+                deadline = a.deadline.date()
+                for offset in self.offsets:
+                    due_at = datetime.combine(deadline - timedelta(days=offset), REMIND_AT)
+                    if due_at < now:
+                        continue
+                    cursor = self.conn.execute(
+                        """
+                        INSERT INTO reminders (announcement_id, offset_days, due_at, deadline)
+                        VALUES (?, ?, ?, ?)
+                        ON CONFLICT(announcement_id, offset_days) DO UPDATE SET
+                            due_at = excluded.due_at,
+                            deadline = excluded.deadline,
+                            sent_at = NULL
+                        WHERE reminders.deadline != excluded.deadline
+                        """,
+                        (a.id, offset, due_at.isoformat(), deadline.isoformat()),
+                    )
+                    count += cursor.rowcount
+        return count
+
+    def is_watched(self, announcement_id: str) -> bool:
+        row = self.conn.execute(
+            "SELECT 1 FROM reminders WHERE announcement_id = ? LIMIT 1", (announcement_id,)
+        ).fetchone()
+        return row is not None
+
+    def unwatch(self, announcement_id: str):
+        """관심 해제 (미발송 리마인더 삭제)"""
+        with self.conn:
+            self.conn.execute(
+                "DELETE FROM reminders WHERE announcement_id = ? AND sent_at IS NULL",
+                (announcement_id,),
+            )
+
+    def due(self, now: datetime = None, limit: int = 100) -> List[Reminder]:
+        """발송 시각이 지난 미발송 리마인더 (같은 공고는 가장 임박한 D-n 하나만)"""
+        now = now or datetime.now()
+        rows = self.conn.execute(
+            """
+            SELECT r.announcement_id, MIN(r.offset_days), a.source, a.title, a.url,
+                   a.organization, r.deadline, a.status
+            FROM reminders r
+            JOIN announcements a ON a.id = r.announcement_id
+            WHERE r.sent_at IS NULL AND r.due_at <= ? AND r.deadline >= ?
+            GROUP BY r.announcement_id
+            ORDER BY r.deadline
+            LIMIT ?
+            """,
+            (now.isoformat(), now.date().isoformat(), limit),
+        ).fetchall()
+        return [
+            Reminder(
+                announcement=Announcement(
+                    id=row[0],
+                    source=row[2],
+                    title=row[3],
+                    url=row[4],
+                    organization=row[5],
+                    deadline=datetime.fromisoformat(row[6]),
+                    status=row[7],
+                ),
+                offset_days=row[1],
+            )
+            for row in rows
+        ]
+
+    def claim_due(self, now: datetime = None, limit: int = 100) -> List[Reminder]:
+        """발송할 리마인더를 보내기 전에 선점
+
+        조회와 sent_at 기록을 한 쓰기 트랜잭션에서 하므로 겹쳐 도는 실행은 같은 리마인더를 가져가지 못함
+        같은 공고의 더 이른 D-n(발송 시각이 이미 지난 것)도 함께 처리해 뒤늦게 나가지 않게 함
+        발송 전에 실행이 죽으면 그 리마인더는 나가지 않음 (두 번 나가는 것보다 나음)
+
+        Args:
+            now: 선점 시각 (sent_at에 기록, release()에 같은 값을 넘김)
+        """
+        now = now or datetime.now()
+        claimed = []
+        with self.conn:
+            # 읽기 트랜잭션에서 쓰기로 올라가다 충돌하지 않게 처음부터 쓰기 잠금
+            self.conn.execute("BEGIN IMMEDIATE")
+            for reminder in self.due(now, limit):
+                cursor = self.conn.execute(
+                    """
+                    UPDATE reminders SET sent_at = ?
+                    WHERE announcement_id = ? AND offset_days >= ? AND sent_at IS NULL
+                    """,
+                    (now.isoformat(), reminder.announcement.id, reminder.offset_days),
+                )
+                if cursor.rowcount:
+                    claimed.append(reminder)
+        return claimed
+
+    def release(self, reminders: List[Reminder], now: datetime):
+        """발송 실패 → 선점 해제 (다음 실행에서 다시 시도)
+
+        Args:
+            now: claim_due()에 넘긴 선점 시각
+        """
+        with self.conn:
+            self.conn.executemany(
+                """
+                UPDATE reminders SET sent_at = NULL
+                WHERE announcement_id = ? AND offset_days >= ? AND sent_at = ?
+                """,
+                [(r.announcement.id, r.offset_days, now.isoformat()) for r in reminders],
+            )
+
+
+async def send_due_reminders(reminders: ReminderStore, notifier, now: datetime = None) -> int:
+    """예정 시각이 지난 리마인더를 한 번에 발송
+
+    발송 전에 선점하므로 겹쳐 도는 실행이 같은 리마인더를 또 보내지 않음
+
+    Returns:
+        발송한 리마인더 수 (실패 시 0, 선점을 풀어 다음 실행에서 다시 시도)
+    """
+    now = now or datetime.now()
+    due = reminders.claim_due(now)
+    if not due:
+        return 0
+    if not await notifier.send_reminders(due):
+        reminders.release(due, now)
+        print("리마인더 발송 실패!")
+        return 0
+    print(f"리마인더 {len(due)}건 발송 완료!")
+    return len(due)
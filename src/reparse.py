@@ -0,0 +1,175 @@
+"""
+보관된 원본 페이지 재파싱
+현재 파서로 원본 보관소(data/archive)의 목록 행을 다시 파싱해 저장된 공고와 비교
+- 파서를 고친 뒤 앞으로의 실행을 기다리지 않고 과거 페이지 전체로 바로 검증
+- --apply를 주면 재파싱 결과로 공고 이력/변경 이력/중복 지문을 갱신 (알림은 보내지 않음)
+페이지 단위로 프로세스 풀에 나눠 모든 코어를 사용
+
+사용법:
+    python -m src.reparse [--source ntis] [--since 2026-01-01] [--workers 8] [--apply]
+"""
+import argparse
+import json
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.filters import Deduplicator
+from src.models import Announcement
+from src.parsers import PARSERS
+from src.storage import AnnouncementStore, ChangeTracker, PageArchive
+from src.storage.changes import snapshot
+from src.storage.history import ORIGIN_REPARSE
+
+
+@dataclass
+class ReparseReport:
+    """재파싱 결과 비교"""
+    pages: int = 0
+    failed_pages: int = 0
+    announcements: int = 0
+    unchanged: int = 0
+    new: List[str] = field(default_factory=list)  # 저장된 적 없는 ID
+    changed: Dict[str, Dict[str, Tuple[Optional[str], Optional[str]]]] = field(default_factory=dict)
+    missing: List[str] = field(default_factory=list)  # 같은 기간에 저장됐지만 재파싱 결과에 없는 ID
+
+    def summary(self, limit: int = 20) -> str:
+        fields = Counter(name for diff in self.changed.values() for name in diff)
+        lines = [
+            f"페이지 {self.pages}개 (실패 {self.failed_pages}개), 공고 {self.announcements}건",
+            f"동일 {self.unchanged}건, 변경 {len(self.changed)}건, 신규 {len(self.new)}건, 누락 {len(self.missing)}건",
+        ]
+        if fields:
+            lines.append("변경 필드: " + ", ".join(f"{name} {count}건" for name, count in fields.most_common()))
+        for announcement_id, diff in list(self.changed.items())[:limit]:
+            for name, (old, new) in diff.items():
+                lines.append(f"  ~ {announcement_id} {name}: {old} → {new}")
+        for announcement_id in self.new[:limit]:
+            lines.append(f"  + {announcement_id}")
+        for announcement_id in self.missing[:limit]:
+            lines.append(f"  - {announcement_id}")
+        return "\n".join(lines)
+
+
+def _parse_page(task: Tuple[str, str, str, str]) -> Tuple[str, List[Announcement], Optional[str]]:
+    """워커: 원본 행 하나를 읽어 파싱 (프로세스 풀에서 실행)
+
+    Returns:
+        (출처, 공고 목록, 오류)
+    """
+    root, source, sha256, fetched_at = task
+    try:
+        rows_data = PageArchive(Path(root)).read_json(sha256)
+        announcements = PARSERS[source](rows_data, datetime.fromisoformat(fetched_at))
+        return source, announcements, None
+    except Exception as e:
+        return source, [], f"{sha256[:12]} {type(e).__name__}: {e}"
+
+
+def reparse(
+    archive: PageArchive,
+    store: AnnouncementStore,
+    sources: List[str] = None,
+    since: datetime = None,
+    workers: int = None,
+    apply: bool = False,
+) -> ReparseReport:
+    """보관된 목록 행을 현재 파서로 다시 파싱해 저장된 공고와 비교
+
+    Args:
+        sources: 대상 출처 (기본: 파서가 있는 전체)
+        since: 이 시각 이후 보관된 페이지만
+        workers: 프로세스 수 (기본: CPU 코어 수)
+        apply: True면 재파싱 결과를 저장소에 반영
+    """
+    sources = sources or list(PARSERS)
+    tasks = []
+    window: Dict[str, str] = {}  # 출처별 가장 오래된 보관 페이지 시각
+    for source in sources:
+        for page in archive.pages(source=source, kind="rows", since=since):
+            fetched_at = page.fetched_at.isoformat()
+            tasks.append((str(archive.root), source, page.sha256, fetched_at))
+            window.setdefault(source, fetched_at)
+
+    report = ReparseReport(pages=len(tasks))
+    latest: Dict[str, Announcement] = {}
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(tasks) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # 보관 시각순으로 결과를 받으므로 같은 ID는 가장 최근 페이지 결과가 남음
+        for source, announcements, error in pool.map(_parse_page, tasks, chunksize=chunksize):
+            if error:
+                report.failed_pages += 1
+                print(f"[실패] {source} {error}")
+            for a in announcements:
+                latest[a.id] = a
+    report.announcements = len(latest)
+
+    # 변경 감지에 저장된 마지막 스냅샷과 비교
+    tracker = ChangeTracker(store.conn)
+    ids = list(latest)
+    stored: Dict[str, dict] = {}
+    for start in range(0, len(ids), 500):
+        chunk = ids[start:start + 500]
+        placeholders = ",".join("?" * len(chunk))
+        for row in store.conn.execute(
+            f"SELECT id, snapshot FROM announcement_state WHERE id IN ({placeholders})", chunk
+        ):
+            stored[row[0]] = json.loads(row[1])
+
+    for announcement_id, a in latest.items():
+        old = stored.get(announcement_id)
+        if old is None:
+            report.new.append(announcement_id)
+            continue
+        diff = {
+            name: (old.get(name), value)
+            for name, value in snapshot(a).items()
+            if old.get(name) != value
+        }
+        if diff:
+            report.changed[announcement_id] = diff
+        else:
+            report.unchanged += 1
+
+    # 보관 기간 중에 수집된 적 있는데 재파싱 결과에 없는 공고
+    for source, first in window.items():
+        for row in store.conn.execute(
+            "SELECT id FROM announcements WHERE source = ? AND last_seen >= ?", (source, first)
+        ):
+            if row[0] not in latest:
+                report.missing.append(row[0])
+
+    if apply and latest:
+        announcements = list(latest.values())
+        store.upsert_many(announcements, origin=ORIGIN_REPARSE)
+        tracker.detect(announcements)
+        Deduplicator(store.conn).index(announcements)
+        print(f"[반영] {len(announcements)}건 저장")
+
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="보관된 원본 페이지를 현재 파서로 재파싱")
+    parser.add_argument("--source", action="append", choices=sorted(PARSERS), help="대상 출처 (여러 번 지정 가능)")
+    parser.add_argument("--since", type=datetime.fromisoformat, help="이 날짜 이후 보관된 페이지만")
+    parser.add_argument("--workers", type=int, help="프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--apply", action="store_true", help="재파싱 결과를 공고 이력에 반영")
+    args = parser.parse_args()
+
+    started = datetime.now()
+    archive = PageArchive()
+    with AnnouncementStore() as store:
+        report = reparse(archive, store, args.source, args.since, args.workers, args.apply)
+    archive.close()
+    print(report.summary())
+    print(f"소요 {(datetime.now() - started).total_seconds():.1f}초")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+출처별 적응형 수집 주기
+공고 이력(first_seen)에서 출처별 요일·시간대 게시 빈도를 학습해 (백필/재파싱으로 저장한 과거 공고는 제외)
+이번 타이머 실행에서 수집할 출처만 고름
+- 평일 낮에 자주 올라오는 게시판은 자주, 거의 안 바뀌는 게시판은 드물게
+"""
+import sqlite3
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from src.storage.history import ORIGIN_OBSERVE
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS source_runs (
+    source TEXT NOT NULL,
+    started_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_source_runs ON source_runs(source, started_at);
+CREATE INDEX IF NOT EXISTS idx_announcements_first_seen ON announcements(source, first_seen);
+"""
+
+HOURS_PER_WEEK = 7 * 24
+
+
+@dataclass
+class SchedulePolicy:
+    """수집 주기 설정"""
+    min_interval: timedelta = timedelta(hours=1)  # 이보다 자주는 수집 안 함
+    max_interval: timedelta = timedelta(hours=24)  # 이보다 오래 비우지는 않음
+    expected_new: float = 1.0  # 새 공고가 이만큼 쌓였을 것으로 예상되면 수집
+    lookback_weeks: int = 8  # 빈도 학습에 쓸 기간
+    smoothing: float = 0.05  # 한 번도 안 올라온 시간대의 기본 빈도 (건/시간)
+
+
+class AdaptiveScheduler:
+    """출처별 수집 시점 결정
+
+    시간대(요일×시각, 168칸)별 평균 신규 건수를 구하고,
+    마지막 수집 이후 시간대별 빈도를 더한 기대 신규 건수가
+    expected_new 이상이면 수집 대상으로 판단
+    """
+
+    def __init__(self, conn: sqlite3.Connection, policy: SchedulePolicy = None):
+        self.conn = conn
+        self.policy = policy or SchedulePolicy()
+        self.conn.executescript(_SCHEMA)
+
+    def last_run(self, source: str) -> Optional[datetime]:
+        row = self.conn.execute(
+            "SELECT MAX(started_at) FROM source_runs WHERE source = ?", (source,)
+        ).fetchone()
+        return datetime.fromisoformat(row[0]) if row and row[0] else None
+
+    def record_run(self, source: str, started_at: datetime = None):
+        """수집 실행 기록"""
+        started_at = started_at or datetime.now()
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO source_runs (source, started_at) VALUES (?, ?)",
+                (source, started_at.isoformat()),
+            )
+
+    def hourly_rates(self, source: str, now: datetime = None) -> List[float]:
+        """요일×시각 168칸별 시간당 평균 신규 공고 수"""
+        now = now or datetime.now()
+        since = now - timedelta(weeks=self.policy.lookback_weeks)
+
+        # 첫 수집 때 한꺼번에 들어온 기존 공고는 빈도 계산에서 제외
+        first = self.conn.execute(
+            "SELECT MIN(started_at) FROM source_runs WHERE source = ?", (source,)
+        ).fetchone()[0]
+        if first:
+            since = max(since, datetime.fromisoformat(first) + timedelta(minutes=30))
+
+        counts = Counter()
+        for (first_seen,) in self.conn.execute(
+            "SELECT first_seen FROM announcements WHERE source = ? AND first_seen >= ? AND origin = ?",
+            (source, since.isoformat(), ORIGIN_OBSERVE),
+        ):
+            seen = datetime.fromisoformat(first_seen)
+            counts[seen.weekday() * 24 + seen.hour] += 1
+
+        weeks = max((now - since).total_seconds() / (7 * 86400), 1.0)
+        return [counts[slot] / weeks + self.policy.smoothing for slot in range(HOURS_PER_WEEK)]
+
+    def expected_new(self, source: str, since: datetime, now: datetime = None) -> float:
+        """since 이후 올라왔을 것으로 예상되는 신규 공고 수"""
+        now = now or datetime.now()
+        rates = self.hourly_rates(source, now)
+        expected = 0.0
+        cursor = since
+        while cursor < now:
+            # 시간 경계까지 잘라가며 해당 시간대 빈도를 누적
+            next_hour = cursor.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+            step_end = min(next_hour, now)
+            fraction = (step_end - cursor).total_seconds() / 3600
+            expected += rates[cursor.weekday() * 24 + cursor.hour] * fraction
+            cursor = step_end
+        return expected
+
+    def due_sources(self, sources: List[str], now: datetime = None) -> Dict[str, str]:
+        """이번 실행에서 수집할 출처와 사유
+
+        Returns:
+            출처 이름 → 사유 (수집하지 않을 출처는 빠짐)
+        """
+        now = now or datetime.now()
+        due = {}
+        for source in sources:
+            last = self.last_run(source)
+            if last is None:
+                due[source] = "첫 수집"
+                continue
+            elapsed = now - last
+            if elapsed < self.policy.min_interval:
+                continue
+            if elapsed >= self.policy.max_interval:
+                due[source] = f"{elapsed.total_seconds() / 3600:.0f}시간 경과"
+                continue
+            expected = self.expected_new(source, last, now)
+            if expected >= self.policy.expected_new:
+                due[source] = f"예상 신규 {expected:.1f}건"
+        return due
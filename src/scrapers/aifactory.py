@@ -2,27 +2,41 @@
 aifactory.space 공모전 스크래퍼
 """
 import asyncio
-import re
 from datetime import datetime
 from typing import List, Optional
 from pathlib import Path
 from playwright.async_api import async_playwright
 
 from .base import BaseScraper
+from .capture import FieldMap
 from src.models import Announcement
+from src.parsers import aifactory as aifactory_parser
+from src.storage.paths import DATA_DIR
 
 
 class AifactoryScraper(BaseScraper):
     """aifactory.space 스크래퍼 (Playwright)"""
 
-    BASE_URL = "https://aifactory.space"
-    COMPETITIONS_URL = f"{BASE_URL}/competition"
+    BASE_URL = aifactory_parser.BASE_URL
+    COMPETITIONS_URL = aifactory_parser.LIST_URL
+    DETAIL_URL = aifactory_parser.DETAIL_URL
+
+    # 공모전 목록 API (페이지가 화면을 그리며 호출하는 응답)
+    API_PATTERN = r"/api/.*(task|competition)"
+    API_FIELDS = FieldMap(
+        id=("taskId", "task_id", "competitionId", "id"),
+        title=("taskName", "task_name", "title", "name"),
+        deadline=("endDate", "end_date", "endAt", "end_at", "closeDate", "deadline"),
+        status=("statusName", "status_name", "status", "state"),
+        organization=("hostName", "host_name", "organizer", "host", "company"),
+        prize=("totalPrize", "total_prize", "prize", "reward"),
+    )
 
     def __init__(self, output_dir: str = None):
         if output_dir:
             self.output_dir = Path(output_dir)
         else:
-            self.output_dir = Path("data/aifactory")
+            self.output_dir = DATA_DIR / "aifactory"
         self.output_dir.mkdir(parents=True, exist_ok=True)
         (self.output_dir / "screenshots").mkdir(exist_ok=True)
 
@@ -75,8 +89,20 @@ class AifactoryScraper(BaseScraper):
 
         try:
             print(f"[접속] {self.COMPETITIONS_URL}")
-            await self.page.goto(self.COMPETITIONS_URL, wait_until="networkidle", timeout=30000)
-            await self.page.wait_for_timeout(3000)
+            announcements = await self.capture_announcements(
+                self.COMPETITIONS_URL,
+                self.API_PATTERN,
+                self.API_FIELDS,
+                make_id=lambda task_id, title: aifactory_parser.make_id(task_id),
+                make_url=lambda task_id: self.DETAIL_URL.format(id=task_id),
+                wait_until="networkidle",
+                timeout=30000,
+            )
+            if announcements:
+                for a in announcements:
+                    print(f"  [{a.status or '?'}] {a.title[:50]}")
+                return announcements
+            print("[API] 목록 응답을 찾지 못해 화면에서 추출")
 
             await self.take_screenshot("competitions_page")
 
@@ -100,6 +126,10 @@ class AifactoryScraper(BaseScraper):
 
                         if (lines.length < 3) continue;
 
+                        // 카드 링크의 공모전 번호 (목록 API와 같은 ID를 쓰기 위해)
+                        const link = card.closest('a[href*="/task/"]') || card.querySelector('a[href*="/task/"]');
+                        const taskMatch = ((link && link.getAttribute('href')) || '').match(/\\/task\\/(\\d+)/);
+
                         // 구조 파악:
                         // lines[0]: 상태 (모집 대기중, 진행중, 종료 등)
                         // lines[1] or [2]: 제목
@@ -167,6 +197,7 @@ class AifactoryScraper(BaseScraper):
 
                         if (title) {
                             results.push({
+                                taskId: taskMatch ? taskMatch[1] : null,
                                 title,
                                 status,
                                 organization,
@@ -182,70 +213,20 @@ class AifactoryScraper(BaseScraper):
             """)
 
             print(f"[수집] {len(cards_data)}건 발견")
+            await self.archive_page(cards_data)
 
-            for idx, data in enumerate(cards_data):
-                try:
-                    title = data.get('title', '')
-                    if not title:
-                        continue
-
-                    # ID 생성 (제목 기반 해시)
-                    competition_id = title[:30].replace(' ', '_')
-
-                    # 마감일 파싱
-                    deadline = self._parse_date(data.get('dateText', ''))
-
-                    announcement = Announcement(
-                        id=f"aifactory_{competition_id}",
-                        source=self.source_name,
-                        title=title,
-                        url=self.COMPETITIONS_URL,  # 개별 URL은 클릭해야 알 수 있음
-                        organization=data.get('organization'),
-                        deadline=deadline,
-                        status=data.get('status'),
-                        prize=data.get('prize'),
-                    )
-                    announcements.append(announcement)
-
-                    print(f"  [{data.get('status', '?')}] {title[:50]}")
-
-                except Exception as e:
-                    print(f"  [파싱 오류] {e}")
-                    continue
+            announcements = aifactory_parser.parse(cards_data, datetime.now())
+            for a in announcements:
+                print(f"  [{a.status or '?'}] {a.title[:50]}")
 
         except Exception as e:
+            self.error = str(e)
             print(f"[오류] 수집 실패: {e}")
             import traceback
             traceback.print_exc()
 
         return announcements
 
-    def _parse_date(self, date_text: str) -> Optional[datetime]:
-        """날짜 문자열 파싱 - 마지막 날짜(마감일) 추출"""
-        if not date_text:
-            return None
-
-        # 모든 날짜 패턴 찾기
-        patterns = [
-            r"(\d{4})-(\d{2})-(\d{2})",
-            r"(\d{4})\.(\d{2})\.(\d{2})",
-        ]
-
-        dates = []
-        for pattern in patterns:
-            for match in re.finditer(pattern, date_text):
-                try:
-                    y, m, d = match.groups()
-                    dates.append(datetime(int(y), int(m), int(d)))
-                except ValueError:
-                    continue
-
-        # 마지막 날짜 반환 (보통 마감일)
-        if dates:
-            return max(dates)
-
-        return None
-
     async def fetch_detail(self, announcement_id: str) -> dict:
         """공고 상세 정보 수집 (추후 구현)"""
         return {}
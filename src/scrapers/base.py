@@ -1,11 +1,30 @@
+import time
 from abc import ABC, abstractmethod
-from typing import List
+from typing import AsyncIterator, Dict, List, Optional
+from src.budget import BudgetExceeded
 from src.models import Announcement
+from src.politeness import politeness
+from src.storage import page_archive
+from .capture import FieldMap, ResponseCapture, fetch_more_pages, find_records, to_announcements
+from .navigation import PageCheck, PathOpener, navigation_cache, open_first
+from .rowfilter import SeenRows
 
 
 class BaseScraper(ABC):
     """스크래퍼 베이스 클래스"""
 
+    # 수집 실패 사유 (스크래퍼는 예외를 삼키고 빈 목록을 돌려주므로 헬스 체크는 이 값으로 판단)
+    error: Optional[str] = None
+
+    # 이 출처에 배정된 수집 마감 시각 (time.monotonic 기준, 파이프라인이 설정, None이면 제한 없음)
+    deadline: Optional[float] = None
+
+    # 이번 실행의 목록 행 지문 (파이프라인이 설정, None이면 이미 본 행을 거르지 않음)
+    seen_rows: Optional[SeenRows] = None
+
+    # 다음 배치와 함께 넘길 목록 행 지문 (stage_rows로 쌓고 파이프라인이 take_rows로 꺼냄)
+    _staged_rows: Optional[List[int]] = None
+
     @property
     @abstractmethod
     def source_name(self) -> str:
@@ -17,6 +36,165 @@ class BaseScraper(ABC):
         """공고 목록 수집"""
         pass
 
+    async def stream_announcements(self, **kwargs) -> AsyncIterator[List[Announcement]]:
+        """공고를 페이지(배치) 단위로 수집
+
+        기본 구현은 fetch_announcements() 결과를 한 배치로 넘김
+        페이지가 여러 개인 스크래퍼는 재정의해서 페이지마다 yield
+        """
+        announcements = await self.fetch_announcements(**kwargs)
+        if announcements:
+            yield announcements
+
+    def stage_rows(self, fingerprints: List[int]):
+        """페이지에서 넘긴 목록 행 지문을 쌓아 둠
+
+        바로 seen_rows에 기록하지 않고, 파이프라인이 다음 배치와 함께 꺼내
+        그 배치 처리가 끝났을 때 기록 (넘기기 전에 끊긴 배치의 행은 다음 실행에서 다시 읽음)
+        """
+        if self._staged_rows is None:
+            self._staged_rows = []
+        self._staged_rows.extend(fingerprints)
+
+    def take_rows(self) -> List[int]:
+        """쌓아 둔 목록 행 지문을 꺼냄"""
+        rows, self._staged_rows = self._staged_rows or [], None
+        return rows
+
+    def time_left(self) -> Optional[float]:
+        """배정된 시간 중 남은 초 (제한 없으면 None)"""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def out_of_time(self) -> bool:
+        """배정된 시간을 다 썼는지 (여러 페이지를 도는 스크래퍼는 다음 페이지 전에 확인)"""
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    async def goto(self, url: str, page=None, **kwargs):
+        """호스트별 속도 제한을 지키며 페이지 이동 (page.goto 인자 그대로 사용, page 생략 시 self.page)
+
+        배정된 시간이 있으면 timeout을 남은 시간 안으로 줄이고, 다 썼으면 BudgetExceeded
+        """
+        page = page or self.page
+        left = self.time_left()
+        if left is not None:
+            if left <= 0:
+                raise BudgetExceeded("수집 시간 예산 소진")
+            kwargs["timeout"] = min(kwargs.get("timeout", 30000), max(1000, int(left * 1000)))
+        async with politeness.request(url) as slot:
+            response = await page.goto(url, **kwargs)
+            slot.status = response.status if response else None
+        return response
+
+    async def capture_announcements(
+        self,
+        url: str,
+        pattern: str,
+        fields: FieldMap,
+        make_id,
+        make_url,
+        max_pages: int = 5,
+        wait_ms: int = 3000,
+        **kwargs,
+    ) -> List[Announcement]:
+        """url로 이동하면서 목록 API 응답(JSON)을 잡아 공고로 변환
+
+        Args:
+            pattern: 목록 API URL 정규식
+            fields: API 레코드 필드 후보
+            make_id: (레코드 ID, 제목) → 공고 ID
+            make_url: 레코드 ID → 상세 URL
+            max_pages: API로 직접 넘겨 볼 최대 페이지 수
+
+        Returns:
+            공고 목록 (응답을 못 잡으면 빈 목록, 페이지는 이동한 상태로 남음)
+        """
+        async with ResponseCapture(self.page, pattern) as capture:
+            await self.goto(url, **kwargs)
+            await self.page.wait_for_timeout(wait_ms)
+
+        # 레코드가 가장 많은 응답을 목록 API로 판단
+        best_url, records = None, []
+        for response_url, payload in capture.responses:
+            self._archive_payload(response_url, payload)
+            found = find_records(payload, fields)
+            if len(found) > len(records):
+                best_url, records = response_url, found
+        if not records:
+            return []
+        print(f"  [API] {best_url[:80]} ({len(records)}건)")
+
+        records += await fetch_more_pages(
+            self.page, best_url, records, fields, max_pages,
+            on_payload=self._archive_payload, deadline=self.deadline,
+        )
+        announcements = {}
+        for a in to_announcements(records, self.source_name, fields, make_id, make_url):
+            announcements.setdefault(a.id, a)
+        return list(announcements.values())
+
+    async def archive_page(self, rows=None, kind: str = "list", page=None):
+        """페이지 HTML과 페이지에서 뽑은 원본 행을 보관소에 저장 (실패해도 수집은 계속)
+
+        Args:
+            rows: page.evaluate로 뽑은 원본 행 (재파싱용, 없으면 HTML만)
+            kind: list 또는 detail
+            page: Page 또는 Frame (생략 시 self.page)
+        """
+        page = page or self.page
+        try:
+            page_archive.put(self.source_name, page.url, kind, await page.content())
+            if rows is not None:
+                page_archive.put(self.source_name, page.url, "rows", rows)
+        except Exception as e:
+            print(f"  [보관 스킵] {str(e)[:50]}")
+
+    def _archive_payload(self, url: str, payload):
+        try:
+            page_archive.put(self.source_name, url, "api", payload)
+        except Exception as e:
+            print(f"  [보관 스킵] {str(e)[:50]}")
+
+    def learned(self, kind: str) -> Optional[str]:
+        """지난번에 목록을 뽑아낸 값 (entry/selector/frame)"""
+        return navigation_cache.get(self.source_name, kind)
+
+    def learn(self, kind: str, value: str):
+        """목록을 뽑아낸 값 기록 (다음 실행에서 먼저 시도)"""
+        navigation_cache.remember(self.source_name, kind, value)
+
+    async def navigate(
+        self, paths: Dict[str, PathOpener], is_valid: PageCheck, hedge_delay: float = 2.0
+    ) -> Optional[str]:
+        """후보 경로를 동시에 열어 먼저 유효한 탭을 self.page로 사용
+
+        지난번에 성공한 경로를 먼저 시도하고, 성공한 경로는 출처별로 기억
+
+        Returns:
+            채택한 경로 이름 (모두 실패하면 None, self.page는 그대로)
+        """
+        preferred = self.learned("entry")
+        name, page = await open_first(self.context, paths, is_valid, preferred, hedge_delay)
+        if page is None:
+            return None
+        if name != preferred:
+            print(f"  [경로] {name}")
+        previous, self.page = self.page, page
+        await previous.close()
+        self.learn("entry", name)
+        return name
+
+    async def click_and_wait(self, target, url: str, wait_ms: int, page=None):
+        """페이지 이동을 일으키는 클릭 (target: 셀렉터 문자열 또는 요소)"""
+        page = page or self.page
+        async with politeness.request(url):
+            if isinstance(target, str):
+                await page.click(target)
+            else:
+                await target.click()
+            await page.wait_for_timeout(wait_ms)
+
     @abstractmethod
     async def fetch_detail(self, announcement_id: str) -> dict:
         """공고 상세 정보 수집"""
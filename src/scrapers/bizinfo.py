@@ -3,28 +3,88 @@
 중소벤처기업부·지자체·부처 전체의 공모·사업 공고 통합 포털
 """
 import asyncio
-import re
 from datetime import datetime
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from pathlib import Path
 from playwright.async_api import async_playwright
 
 from .base import BaseScraper
+from .rowfilter import ROW_FILTER_JS, build_filters
 from src.models import Announcement
+from src.parsers import bizinfo as bizinfo_parser
+from src.storage.paths import DATA_DIR
+
+
+# 목록 행 추출 (page.evaluate, 재파싱/백필과 같은 원본 형식)
+# 인자: rowfilter.build_filters() 결과 (연도/마감/이미 본 행은 페이지 안에서 걸러서 넘김)
+_ROWS_JS = "(filters) => {" + ROW_FILTER_JS + r"""
+        const rowFilter = makeRowFilter(filters);
+        const results = [];
+        const rows = document.querySelectorAll('table tbody tr');
+        let total = 0;
+
+        for (let row of rows) {
+            const cells = row.querySelectorAll('td');
+            if (cells.length < 5) continue;
+            total++;
+
+            const link = row.querySelector('a');
+            const href = link ? link.getAttribute('href') : '';
+
+            const cellTexts = [];
+            for (let cell of cells) {
+                cellTexts.push((cell.innerText || '').trim());
+            }
+
+            // 테이블 구조: [번호, 지원분야, 지원사업명, 신청기간, 소관부처, 사업수행기관, 등록일, 조회수]
+            const item = {
+                no: cellTexts[0] || '',
+                category: cellTexts[1] || '',
+                title: cellTexts[2] || '',
+                period: cellTexts[3] || '',
+                department: cellTexts[4] || '',
+                agency: cellTexts[5] || '',
+                regDate: cellTexts[6] || '',
+                views: cellTexts[7] || '',
+                href: href
+            };
+
+            // 파서(src/parsers/bizinfo.py)와 같은 기준: 신청기간의 마지막 날짜가 마감일
+            let deadline = null;
+            if (item.period.includes('~')) {
+                const dates = [...item.period.matchAll(/(\d{4})-(\d{2})-(\d{2})/g)];
+                if (dates.length) {
+                    const [, y, m, d] = dates[dates.length - 1];
+                    deadline = new Date(+y, +m - 1, +d);
+                }
+            }
+            // 조회수는 매번 바뀌므로 지문에서 제외
+            const fp = rowFilter.fingerprint(cellTexts.slice(0, 7).concat([href]).join('\u001f'));
+
+            if (rowFilter.otherYear(item.title)) continue;
+            if (rowFilter.closedBy(deadline)) continue;
+            if (rowFilter.seen(fp)) continue;
+            item.fp = fp;
+            results.push(item);
+        }
+
+        return {rows: results, total, filtered: rowFilter.counts, seenHits: rowFilter.hits};
+    }
+"""
 
 
 class BizinfoScraper(BaseScraper):
     """기업마당 공고 스크래퍼 (Playwright)"""
 
-    BASE_URL = "https://www.bizinfo.go.kr"
+    BASE_URL = bizinfo_parser.BASE_URL
     # 지원사업 공고 목록
-    ANNOUNCEMENTS_URL = f"{BASE_URL}/web/lay1/bbs/S1T122C128/AS/74/list.do"
+    ANNOUNCEMENTS_URL = bizinfo_parser.LIST_URL
 
     def __init__(self, output_dir: str = None):
         if output_dir:
             self.output_dir = Path(output_dir)
         else:
-            self.output_dir = Path("data/bizinfo")
+            self.output_dir = DATA_DIR / "bizinfo"
         self.output_dir.mkdir(parents=True, exist_ok=True)
         (self.output_dir / "screenshots").mkdir(exist_ok=True)
 
@@ -71,9 +131,29 @@ class BizinfoScraper(BaseScraper):
             print(f"  [screenshot skip] {name} - {str(e)[:50]}")
             return None
 
+    async def extract_rows(self, page, filters: dict = None) -> dict:
+        """목록 페이지에서 원본 행 추출
+
+        Args:
+            filters: 페이지 안에서 거를 조건 (rowfilter.build_filters, 없으면 전체 행)
+        """
+        return await page.evaluate(_ROWS_JS, filters)
+
     async def fetch_announcements(self, year: int = None, max_pages: int = 3) -> List[Announcement]:
         """지원사업 공고 목록 수집
 
+        Args:
+            year: 특정 연도 공고만 필터링 (기본: 올해)
+            max_pages: 최대 페이지 수 (기본: 3)
+        """
+        announcements = []
+        async for batch in self.stream_announcements(year=year, max_pages=max_pages):
+            announcements.extend(batch)
+        return announcements
+
+    async def stream_announcements(self, year: int = None, max_pages: int = 3) -> AsyncIterator[List[Announcement]]:
+        """지원사업 공고를 페이지 단위로 수집
+
         Args:
             year: 특정 연도 공고만 필터링 (기본: 올해)
             max_pages: 최대 페이지 수 (기본: 3)
@@ -81,13 +161,11 @@ class BizinfoScraper(BaseScraper):
         if year is None:
             year = datetime.now().year
 
-        announcements = []
-
         try:
             print(f"[access] {self.ANNOUNCEMENTS_URL}")
             print(f"[filter] year = {year}, max_pages = {max_pages}")
 
-            await self.page.goto(self.ANNOUNCEMENTS_URL, wait_until="networkidle", timeout=60000)
+            await self.goto(self.ANNOUNCEMENTS_URL, wait_until="networkidle", timeout=60000)
             await self.page.wait_for_timeout(2000)
 
             await self.take_screenshot("bizinfo_list_page")
@@ -95,128 +173,44 @@ class BizinfoScraper(BaseScraper):
             # 페이지별 수집
             for page_num in range(1, max_pages + 1):
                 if page_num > 1:
+                    # 배정된 시간을 다 쓰면 앞 페이지까지만 (이미 넘긴 배치는 그대로 유효)
+                    if self.out_of_time():
+                        print(f"[budget] out of time, stopping before page {page_num}")
+                        break
                     # 페이지 이동
                     try:
-                        await self.page.click(f'a:has-text("{page_num}")')
-                        await self.page.wait_for_timeout(2000)
+                        await self.click_and_wait(f'a:has-text("{page_num}")', self.BASE_URL, 2000)
                     except:
                         print(f"[warning] page {page_num} not found")
                         break
 
                 print(f"[page {page_num}] fetching...")
 
-                # 테이블에서 공고 데이터 추출
-                rows_data = await self.page.evaluate("""
-                    () => {
-                        const results = [];
-                        const rows = document.querySelectorAll('table tbody tr');
-
-                        for (let row of rows) {
-                            const cells = row.querySelectorAll('td');
-                            if (cells.length < 5) continue;
-
-                            const link = row.querySelector('a');
-                            const href = link ? link.getAttribute('href') : '';
-
-                            const cellTexts = [];
-                            for (let cell of cells) {
-                                cellTexts.push((cell.innerText || '').trim());
-                            }
-
-                            // 테이블 구조: [번호, 지원분야, 지원사업명, 신청기간, 소관부처, 사업수행기관, 등록일, 조회수]
-                            results.push({
-                                no: cellTexts[0] || '',
-                                category: cellTexts[1] || '',
-                                title: cellTexts[2] || '',
-                                period: cellTexts[3] || '',
-                                department: cellTexts[4] || '',
-                                agency: cellTexts[5] || '',
-                                regDate: cellTexts[6] || '',
-                                views: cellTexts[7] || '',
-                                href: href
-                            });
-                        }
-
-                        return results;
-                    }
-                """)
-
-                print(f"  [found] {len(rows_data)} rows")
-
-                for row in rows_data:
-                    try:
-                        title = row.get('title', '')
-                        if not title or len(title) < 5:
-                            continue
-
-                        # 연도 필터링
-                        title_year_match = re.search(r'(20\d{2})년?', title)
-                        if title_year_match:
-                            title_year = int(title_year_match.group(1))
-                            if title_year != year:
-                                continue
-
-                        # 신청기간에서 마감일 추출
-                        period = row.get('period', '')
-                        deadline = None
-                        if '~' in period:
-                            dates = re.findall(r'(\d{4})-(\d{2})-(\d{2})', period)
-                            if dates:
-                                try:
-                                    last_date = dates[-1]
-                                    deadline = datetime(int(last_date[0]), int(last_date[1]), int(last_date[2]))
-                                except:
-                                    pass
-
-                        # URL 생성
-                        href = row.get('href', '')
-                        url = self.ANNOUNCEMENTS_URL
-                        if href:
-                            if href.startswith('http'):
-                                url = href
-                            elif href.startswith('/'):
-                                url = f"{self.BASE_URL}{href}"
-                            elif 'pblancId' in href:
-                                url = f"{self.BASE_URL}/web/lay1/bbs/S1T122C128/AS/74/{href}"
-
-                        # 상태 판단
-                        status = None
-                        if deadline:
-                            if deadline >= datetime.now():
-                                status = "접수중"
-                            else:
-                                status = "마감"
-
-                        # ID 생성
-                        no = row.get('no', '')
-                        announcement_id = f"bizinfo_{no}_{title[:15].replace(' ', '_')}"
-
-                        announcement = Announcement(
-                            id=announcement_id,
-                            source=self.source_name,
-                            title=title.strip()[:200],
-                            url=url,
-                            organization=row.get('department') or row.get('agency') or None,
-                            deadline=deadline,
-                            status=status,
-                        )
-                        announcements.append(announcement)
-
-                        safe_title = title[:40].encode('ascii', 'replace').decode('ascii')
-                        print(f"    [{status or '?'}] {safe_title}")
-
-                    except Exception as e:
-                        print(f"    [parse error] {e}")
-                        continue
+                # 테이블에서 공고 데이터 추출 (연도/마감/이미 본 행은 페이지에서 거름)
+                now = datetime.now()
+                rows_data = await self.extract_rows(self.page, build_filters(self.source_name, year, now, seen_rows=self.seen_rows))
+                rows = rows_data['rows']
+
+                print(f"  [found] {len(rows)}/{rows_data['total']} rows (filtered: {rows_data['filtered']})")
+                await self.archive_page(rows_data)
+                if self.seen_rows:
+                    self.stage_rows([row['fp'] for row in rows] + rows_data['seenHits'])
+
+                announcements = bizinfo_parser.parse(rows_data, now, year)
+                for a in announcements:
+                    safe_title = a.title[:40].encode('ascii', 'replace').decode('ascii')
+                    print(f"    [{a.status or '?'}] {safe_title}")
+
+                if announcements:
+                    yield announcements
 
         except Exception as e:
+            self.error = str(e)
             print(f"[error] fetch failed: {e}")
             import traceback
             traceback.print_exc()
             await self.take_screenshot("error_page")
 
-        return announcements
-
     async def fetch_detail(self, announcement_id: str) -> dict:
         """공고 상세 정보 수집 (추후 구현)"""
         return {}
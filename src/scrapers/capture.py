@@ -0,0 +1,214 @@
+"""
+SPA 목록 API 응답 수집
+화면을 그리려고 페이지가 이미 호출하는 목록 API(XHR/fetch)의 JSON을 가로채 바로 파싱
+- 화면 텍스트를 추측해서 나누는 것보다 정확하고, 실제 ID와 상세 URL을 얻을 수 있음
+- 응답 URL에 페이지 번호 파라미터가 있으면 같은 API로 다음 페이지를 직접 요청
+응답을 못 잡으면 스크래퍼는 기존 화면(DOM) 추출로 돌아감
+"""
+import asyncio
+import re
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+from src.models import Announcement
+from src.politeness import politeness
+
+
+# 페이지 번호로 쓰이는 쿼리 파라미터
+PAGE_PARAMS = ("page", "pageNo", "pageIndex", "cpage", "currentPage", "pageNum")
+
+_DATE_RE = re.compile(r"(\d{4})[-./]?(\d{2})[-./]?(\d{2})")
+
+
+@dataclass
+class FieldMap:
+    """API 레코드 → Announcement 필드 (필드마다 후보 키, 앞에서부터 값이 있는 것 사용)"""
+    id: Tuple[str, ...]
+    title: Tuple[str, ...]
+    deadline: Tuple[str, ...] = ()
+    status: Tuple[str, ...] = ()
+    organization: Tuple[str, ...] = ()
+    prize: Tuple[str, ...] = ()
+
+
+class ResponseCapture:
+    """페이지가 받는 JSON 응답 수집 (async with 블록 안에서 페이지 이동)
+
+    Args:
+        page: Playwright Page
+        pattern: 수집할 응답 URL 정규식
+    """
+
+    def __init__(self, page, pattern: str):
+        self.page = page
+        self.pattern = re.compile(pattern)
+        self.responses: List[Tuple[str, Any]] = []  # (URL, JSON)
+        self._pending: List[asyncio.Task] = []
+
+    async def __aenter__(self) -> "ResponseCapture":
+        self.page.on("response", self._on_response)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.page.remove_listener("response", self._on_response)
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
+    def _on_response(self, response):
+        if response.request.resource_type not in ("xhr", "fetch"):
+            return
+        if not self.pattern.search(response.url):
+            return
+        self._pending.append(asyncio.create_task(self._read(response)))
+
+    async def _read(self, response):
+        if "json" not in (response.headers.get("content-type") or ""):
+            return
+        try:
+            self.responses.append((response.url, await response.json()))
+        except Exception as e:
+            print(f"  [API 응답 스킵] {response.url[:60]} - {str(e)[:50]}")
+
+
+def find_records(payload: Any, fields: FieldMap) -> List[dict]:
+    """JSON 안에서 ID와 제목을 가진 레코드가 가장 많은 목록 (응답 구조가 바뀌어도 찾을 수 있게)"""
+    best: List[dict] = []
+    best_count = 0
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            records = [item for item in node if isinstance(item, dict)]
+            count = sum(
+                1 for r in records
+                if _pick(r, fields.id) is not None and _pick(r, fields.title)
+            )
+            if count > best_count:
+                best, best_count = records, count
+            stack.extend(records)
+    return best
+
+
+def _pick(record: dict, keys: Tuple[str, ...]) -> Any:
+    """후보 키 중 처음으로 값(문자열/숫자)이 있는 것"""
+    for key in keys:
+        value = record.get(key)
+        if value not in (None, "") and not isinstance(value, (dict, list)):
+            return value
+    return None
+
+
+def _text(value: Any) -> Optional[str]:
+    return str(value).strip() if value is not None else None
+
+
+def parse_api_date(value: Any) -> Optional[datetime]:
+    """API 날짜 값 파싱 (ISO 문자열, YYYYMMDD, epoch 밀리초)"""
+    if value in (None, ""):
+        return None
+    if isinstance(value, (int, float)):
+        seconds = value / 1000 if value > 10 ** 11 else value
+        return datetime.fromtimestamp(seconds)
+    match = _DATE_RE.search(str(value))
+    if not match:
+        return None
+    try:
+        return datetime(*(int(g) for g in match.groups()))
+    except ValueError:
+        return None
+
+
+def to_announcements(
+    records: List[dict],
+    source: str,
+    fields: FieldMap,
+    make_id,
+    make_url,
+) -> List[Announcement]:
+    """API 레코드를 공고로 변환
+
+    Args:
+        make_id: (레코드 ID, 제목) → 공고 ID
+        make_url: 레코드 ID → 상세 URL
+    """
+    announcements = []
+    for record in records:
+        record_id = _pick(record, fields.id)
+        title = _pick(record, fields.title)
+        if record_id is None or not title:
+            continue
+        title = str(title).strip()
+        announcements.append(
+            Announcement(
+                id=make_id(str(record_id), title),
+                source=source,
+                title=title[:200],
+                url=make_url(str(record_id)),
+                organization=_text(_pick(record, fields.organization)),
+                deadline=parse_api_date(_pick(record, fields.deadline)),
+                status=_text(_pick(record, fields.status)),
+                prize=_text(_pick(record, fields.prize)),
+            )
+        )
+    return announcements
+
+
+def next_page_url(url: str) -> Optional[str]:
+    """페이지 번호 파라미터를 1 올린 URL (파라미터가 없으면 None)"""
+    parts = urlparse(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    for i, (key, value) in enumerate(query):
+        if key in PAGE_PARAMS and value.isdigit():
+            query[i] = (key, str(int(value) + 1))
+            return urlunparse(parts._replace(query=urlencode(query)))
+    return None
+
+
+async def fetch_more_pages(
+    page,
+    url: str,
+    first_page: List[dict],
+    fields: FieldMap,
+    max_pages: int,
+    on_payload=None,
+    deadline: Optional[float] = None,
+) -> List[dict]:
+    """캡처한 목록 API로 다음 페이지들을 직접 요청 (새 레코드가 안 나오면 중단)
+
+    page.request는 브라우저 쿠키를 공유하므로 세션이 필요한 API도 그대로 호출 가능
+    on_payload(url, JSON)가 있으면 받은 응답마다 호출 (원본 보관용)
+    deadline(time.monotonic 기준)이 지나거나 페이지 요청이 실패하면 그때까지 받은 레코드만 반환
+    """
+    records: List[dict] = []
+    seen_first = first_page[0] if first_page else None
+    for _ in range(max_pages - 1):
+        url = next_page_url(url)
+        if url is None:
+            break
+        if deadline is not None and time.monotonic() >= deadline:
+            print(f"  [API] 시간 예산 소진, {len(records)}건까지만 추가")
+            break
+        try:
+            async with politeness.request(url) as slot:
+                response = await page.request.get(url)
+                slot.status = response.status
+            if not response.ok:
+                break
+            payload = await response.json()
+        except Exception as e:
+            print(f"  [API 다음 페이지 실패] {url[:60]} - {str(e)[:50]}")
+            break
+        if on_payload:
+            on_payload(url, payload)
+        batch = find_records(payload, fields)
+        # 마지막 페이지 뒤에 같은 페이지를 돌려주는 API 대비
+        if not batch or batch[0] == seen_first:
+            break
+        seen_first = batch[0]
+        records.extend(batch)
+    return records
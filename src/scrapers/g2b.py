@@ -3,7 +3,7 @@
 https://www.g2b.go.kr
 """
 import asyncio
-import re
+from functools import partial
 from datetime import datetime
 from typing import List, Optional
 from pathlib import Path
@@ -11,12 +11,19 @@ from playwright.async_api import async_playwright
 
 from .base import BaseScraper
 from src.models import Announcement
+from src.parsers import g2b as g2b_parser
+from src.storage.paths import DATA_DIR
 
 
 class G2BScraper(BaseScraper):
     """나라장터 입찰공고 스크래퍼 (Playwright)"""
 
-    BASE_URL = "https://www.g2b.go.kr"
+    BASE_URL = g2b_parser.BASE_URL
+    # 입찰공고 목록 직접 접근 URL
+    BID_URLS = [
+        "https://www.g2b.go.kr:8101/ep/tbid/tbidList.do?taskClCds=5",  # 용역
+        "https://www.g2b.go.kr:8101/ep/tbid/tbidList.do",  # 전체
+    ]
     # 입찰공고 검색 페이지 - 용역 (R&D 포함)
     ANNOUNCEMENTS_URL = f"{BASE_URL}/pt/menu/selectSubFrame.do?framesrc=/pt/menu/frameTgong.do?url=https://www.g2b.go.kr:8101/ep/tbid/tbidList.do?taskClCds=5"
 
@@ -24,7 +31,7 @@ class G2BScraper(BaseScraper):
         if output_dir:
             self.output_dir = Path(output_dir)
         else:
-            self.output_dir = Path("data/g2b")
+            self.output_dir = DATA_DIR / "g2b"
         self.output_dir.mkdir(parents=True, exist_ok=True)
         (self.output_dir / "screenshots").mkdir(exist_ok=True)
 
@@ -71,58 +78,44 @@ class G2BScraper(BaseScraper):
             print(f"  [screenshot skip] {name} - {str(e)[:50]}")
             return None
 
+    async def _open_url(self, url: str, page):
+        print(f"[try] {url}")
+        await self.goto(url, page=page, wait_until="networkidle", timeout=30000)
+        await page.wait_for_timeout(3000)
+
+    async def _open_via_menu(self, page):
+        """나라장터 메인 페이지에서 입찰공고 메뉴 클릭"""
+        print(f"[access] {self.BASE_URL}")
+        await self.goto(self.BASE_URL, page=page, wait_until="networkidle", timeout=60000)
+        await page.wait_for_timeout(2000)
+
+        menu_selectors = [
+            'a:has-text("입찰공고")',
+            'a:has-text("입찰정보")',
+            'a[href*="tbid"]',
+        ]
+        for selector in menu_selectors:
+            link = await page.query_selector(selector)
+            if link:
+                await self.click_and_wait(link, self.BASE_URL, 3000, page=page)
+                return
+        raise RuntimeError("bid menu not found")
+
+    async def _is_list_page(self, page) -> bool:
+        content = await page.content()
+        return len(content) > 10000 and 'tbid' in content.lower()
+
     async def fetch_announcements(self) -> List[Announcement]:
         """입찰공고 목록 수집"""
         announcements = []
 
         try:
-            # 나라장터 메인 페이지 먼저 접속
-            print(f"[access] {self.BASE_URL}")
-            await self.page.goto(self.BASE_URL, wait_until="networkidle", timeout=60000)
-            await self.page.wait_for_timeout(2000)
-
-            # 입찰정보 > 입찰공고 메뉴 찾기
-            print("[navigate] finding bid announcement menu...")
-
-            # 여러 방법으로 입찰공고 페이지 접근 시도
-            navigated = False
-
-            # 방법 1: 직접 URL 접근
-            bid_urls = [
-                "https://www.g2b.go.kr:8101/ep/tbid/tbidList.do?taskClCds=5",  # 용역
-                "https://www.g2b.go.kr:8101/ep/tbid/tbidList.do",  # 전체
-            ]
-
-            for url in bid_urls:
-                try:
-                    print(f"[try] {url}")
-                    await self.page.goto(url, wait_until="networkidle", timeout=30000)
-                    await self.page.wait_for_timeout(3000)
-                    content = await self.page.content()
-                    if len(content) > 10000 and 'tbid' in content.lower():
-                        navigated = True
-                        break
-                except Exception as e:
-                    print(f"  [failed] {str(e)[:50]}")
-                    continue
-
-            if not navigated:
-                # 방법 2: 메뉴 클릭
-                try:
-                    menu_selectors = [
-                        'a:has-text("입찰공고")',
-                        'a:has-text("입찰정보")',
-                        'a[href*="tbid"]',
-                    ]
-                    for selector in menu_selectors:
-                        link = await self.page.query_selector(selector)
-                        if link:
-                            await link.click()
-                            await self.page.wait_for_timeout(3000)
-                            navigated = True
-                            break
-                except:
-                    pass
+            # 직접 URL과 메뉴 클릭을 탭 여러 개에서 동시에 시도
+            print("[navigate] finding bid announcement list...")
+            paths = {url: partial(self._open_url, url) for url in self.BID_URLS}
+            paths["menu"] = self._open_via_menu
+            if not await self.navigate(paths, self._is_list_page):
+                print("[warning] bid announcement list not reached")
 
             await self.take_screenshot("g2b_list_page")
 
@@ -134,11 +127,17 @@ class G2BScraper(BaseScraper):
             frames = self.page.frames
             print(f"[frames] found {len(frames)} frames")
 
+            # 지난번에 목록이 있던 프레임부터 확인 (URL에서 쿼리 제외한 부분으로 비교)
+            learned_frame = self.learned("frame")
+            frames = sorted(frames, key=lambda f: f.url.split("?")[0] != learned_frame)
+
             target_frame = self.page
+            frame_pattern = None
             for frame in frames:
                 frame_content = await frame.content()
                 if 'tbid' in frame_content.lower() or 'bidNm' in frame_content:
                     target_frame = frame
+                    frame_pattern = frame.url.split("?")[0]
                     print(f"[frame] using frame: {frame.url[:50]}")
                     break
 
@@ -199,96 +198,28 @@ class G2BScraper(BaseScraper):
             """)
 
             print(f"[analyze] type: {rows_data.get('type', 'unknown')}")
+            await self.archive_page(rows_data, page=target_frame)
 
             if rows_data.get('type') == 'no_table':
                 print(f"[warning] no table found. tables: {rows_data.get('tableCount')}")
                 safe_text = rows_data.get('pageText', '')[:500].encode('ascii', 'replace').decode('ascii')
                 print(f"page text: {safe_text}")
+                self.error = "목록을 찾지 못함"
                 return []
 
             rows = rows_data.get('rows', [])
             print(f"[found] {len(rows)} rows")
 
-            for idx, row in enumerate(rows):
-                try:
-                    cell_texts = row.get('cellTexts', [])
-
-                    if len(cell_texts) < 3:
-                        continue
-
-                    # 헤더 행 스킵
-                    if any(kw in str(cell_texts) for kw in ['업종', '공고번호', '번호', '순번']):
-                        continue
-
-                    # 공고 정보 추출
-                    # 나라장터 구조: [업종, 공고번호-차수, 공고명, 공고기관, 수요기관, 계약방법, 입력일시, 입찰마감일시]
-                    title = ''
-                    organization = ''
-                    deadline = None
-                    bid_no = ''
-
-                    for i, text in enumerate(cell_texts):
-                        if not text:
-                            continue
-
-                        # 공고번호 (숫자-숫자 패턴)
-                        if re.match(r'^\d+-\d+', text):
-                            bid_no = text
-
-                        # 공고명 (가장 긴 텍스트)
-                        if len(text) > len(title) and len(text) > 10:
-                            if not re.match(r'^\d', text) and '기관' not in text:
-                                title = text
-
-                        # 기관명
-                        if any(kw in text for kw in ['청', '부', '원', '처', '시', '군', '구', '대학', '공사', '공단']):
-                            if len(text) < 30 and text != title:
-                                organization = text
-
-                        # 마감일시 (YYYY/MM/DD 또는 YYYY-MM-DD)
-                        date_match = re.search(r'(\d{4})[/-](\d{2})[/-](\d{2})', text)
-                        if date_match:
-                            try:
-                                y, m, d = date_match.groups()
-                                parsed_date = datetime(int(y), int(m), int(d))
-                                if deadline is None or parsed_date > deadline:
-                                    deadline = parsed_date
-                            except:
-                                pass
-
-                    if not title or len(title) < 5:
-                        continue
-
-                    # URL 생성
-                    onclick = row.get('onclick', '')
-                    url = self.BASE_URL
-
-                    if onclick and 'bidNm' in onclick:
-                        # onclick에서 공고번호 추출
-                        url = f"{self.BASE_URL}/ep/tbid/tbidDetail.do"
-
-                    # ID 생성
-                    announcement_id = f"g2b_{bid_no or idx}_{title[:15].replace(' ', '_')}"
-
-                    announcement = Announcement(
-                        id=announcement_id,
-                        source=self.source_name,
-                        title=title.strip()[:200],
-                        url=url,
-                        organization=organization or None,
-                        deadline=deadline,
-                        status="입찰중" if deadline and deadline > datetime.now() else None,
-                    )
-                    announcements.append(announcement)
-
-                    safe_title = title[:40].encode('ascii', 'replace').decode('ascii')
-                    print(f"  [{bid_no or idx}] {safe_title}")
-
-                except Exception as e:
-                    print(f"  [parse error] {e}")
-                    continue
+            announcements = g2b_parser.parse(rows_data, datetime.now())
+            for a in announcements:
+                safe_title = a.title[:40].encode('ascii', 'replace').decode('ascii')
+                print(f"  [{a.status or '?'}] {safe_title}")
+
+            if announcements and frame_pattern:
+                self.learn("frame", frame_pattern)
 
         except Exception as e:
+            self.error = str(e)
             print(f"[error] fetch failed: {e}")
             import traceback
             traceback.print_exc()
@@ -3,7 +3,7 @@ IRIS (범부처통합연구지원시스템) R&D 과제공고 스크래퍼
 https://www.iris.go.kr
 """
 import asyncio
-import re
+from functools import partial
 from datetime import datetime
 from typing import List, Optional
 from pathlib import Path
@@ -11,12 +11,14 @@ from playwright.async_api import async_playwright
 
 from .base import BaseScraper
 from src.models import Announcement
+from src.parsers import iris as iris_parser
+from src.storage.paths import DATA_DIR
 
 
 class IrisScraper(BaseScraper):
     """IRIS 과제공고 스크래퍼 (Playwright)"""
 
-    BASE_URL = "https://www.iris.go.kr"
+    BASE_URL = iris_parser.BASE_URL
     # 과제공고 목록 페이지 - 여러 URL 패턴 시도
     ANNOUNCEMENTS_URLS = [
         f"{BASE_URL}/anmt/anmtList.do",  # 공고목록
@@ -29,7 +31,7 @@ class IrisScraper(BaseScraper):
         if output_dir:
             self.output_dir = Path(output_dir)
         else:
-            self.output_dir = Path("data/iris")
+            self.output_dir = DATA_DIR / "iris"
         self.output_dir.mkdir(parents=True, exist_ok=True)
         (self.output_dir / "screenshots").mkdir(exist_ok=True)
 
@@ -76,56 +78,51 @@ class IrisScraper(BaseScraper):
             print(f"  [스크린샷 스킵] {name} - {str(e)[:50]}")
             return None
 
+    async def _open_via_menu(self, page):
+        """메인 페이지에서 과제공고 메뉴 클릭"""
+        print(f"[접속] {self.BASE_URL}/main.do")
+        await self.goto(f"{self.BASE_URL}/main.do", page=page, wait_until="networkidle", timeout=60000)
+        await page.wait_for_timeout(2000)
+
+        # 여러 패턴으로 공고 링크 찾기
+        link_selectors = [
+            'a:has-text("과제공고")',
+            'a:has-text("사업공고")',
+            'a:has-text("공고")',
+            'a[href*="anmt"]',
+            'a[href*="ancm"]',
+            'a[href*="Ancm"]',
+        ]
+        for selector in link_selectors:
+            link = await page.query_selector(selector)
+            if link:
+                print(f"  [발견] {selector}")
+                await self.click_and_wait(link, self.BASE_URL, 3000, page=page)
+                return
+        raise RuntimeError("과제공고 메뉴를 찾지 못함")
+
+    async def _open_url(self, url: str, page):
+        print(f"[시도] {url}")
+        await self.goto(url, page=page, wait_until="networkidle", timeout=30000)
+        await page.wait_for_timeout(2000)
+
+    async def _is_list_page(self, page) -> bool:
+        """에러 페이지가 아닌지 확인"""
+        content = await page.content()
+        return "장애" not in content and len(content) > 5000
+
     async def fetch_announcements(self) -> List[Announcement]:
         """진행중인 과제공고 목록 수집"""
         announcements = []
 
         try:
-            # 먼저 메인 페이지 접속
-            print(f"[접속] {self.BASE_URL}/main.do")
-            await self.page.goto(f"{self.BASE_URL}/main.do", wait_until="networkidle", timeout=60000)
-            await self.page.wait_for_timeout(2000)
-            await self.take_screenshot("iris_main")
-
-            # 과제공고 메뉴 찾기 및 클릭
-            print("[탐색] 과제공고 메뉴 찾는 중...")
-
-            # 여러 패턴으로 공고 링크 찾기
-            link_selectors = [
-                'a:has-text("과제공고")',
-                'a:has-text("사업공고")',
-                'a:has-text("공고")',
-                'a[href*="anmt"]',
-                'a[href*="ancm"]',
-                'a[href*="Ancm"]',
-            ]
-
-            clicked = False
-            for selector in link_selectors:
-                try:
-                    link = await self.page.query_selector(selector)
-                    if link:
-                        print(f"  [발견] {selector}")
-                        await link.click()
-                        await self.page.wait_for_timeout(3000)
-                        clicked = True
-                        break
-                except:
-                    continue
-
-            if not clicked:
-                # 직접 URL 시도
-                for url in self.ANNOUNCEMENTS_URLS:
-                    try:
-                        print(f"[시도] {url}")
-                        await self.page.goto(url, wait_until="networkidle", timeout=30000)
-                        await self.page.wait_for_timeout(2000)
-                        # 에러 페이지가 아닌지 확인
-                        content = await self.page.content()
-                        if "장애" not in content and len(content) > 5000:
-                            break
-                    except:
-                        continue
+            # 메뉴 클릭과 직접 URL을 탭 여러 개에서 동시에 시도
+            print("[탐색] 과제공고 목록 찾는 중...")
+            paths = {"menu": self._open_via_menu}
+            for url in self.ANNOUNCEMENTS_URLS:
+                paths[url] = partial(self._open_url, url)
+            if not await self.navigate(paths, self._is_list_page):
+                print("[경고] 과제공고 목록 진입 실패")
 
             await self.take_screenshot("iris_list_page")
 
@@ -135,12 +132,12 @@ class IrisScraper(BaseScraper):
 
             # 테이블 또는 리스트 형태의 공고 목록 찾기
             # IRIS는 보통 테이블 형태로 공고를 표시함
+            # 지난번에 목록을 뽑아낸 셀렉터를 먼저 시도
+            preferred = self.learned("selector")
             rows_data = await self.page.evaluate("""
-                () => {
-                    const results = [];
-
+                (preferred) => {
                     // 테이블 행 찾기 (여러 패턴 시도)
-                    const selectors = [
+                    let selectors = [
                         'table tbody tr',
                         '.board-list tbody tr',
                         '.list-table tbody tr',
@@ -150,55 +147,61 @@ class IrisScraper(BaseScraper):
                         '.announcement-item',
                         '.ancm-list li'
                     ];
+                    if (preferred) {
+                        selectors = [preferred, ...selectors.filter(s => s !== preferred)];
+                    }
+
+                    const extract = (rows) => {
+                        const results = [];
+                        for (let row of rows) {
+                            const cells = row.querySelectorAll('td');
+                            if (cells.length < 2) continue;
+
+                            const rowText = row.innerText;
+                            const link = row.querySelector('a');
+                            const href = link ? link.getAttribute('href') : '';
+                            const onclick = row.getAttribute('onclick') || '';
+
+                            // 각 셀의 텍스트 추출
+                            const cellTexts = [];
+                            for (let cell of cells) {
+                                cellTexts.push(cell.innerText.trim());
+                            }
+
+                            results.push({
+                                cellTexts,
+                                href,
+                                onclick,
+                                rowText: rowText.substring(0, 500)
+                            });
+                        }
+                        return results;
+                    };
 
-                    let rows = [];
+                    // 행이 실제로 뽑히는 첫 셀렉터 사용
                     for (let selector of selectors) {
                         const found = document.querySelectorAll(selector);
-                        if (found.length > 0) {
-                            rows = found;
-                            console.log('Found rows with selector:', selector, found.length);
-                            break;
+                        if (found.length === 0) continue;
+                        const results = extract(found);
+                        if (results.length > 0) {
+                            console.log('Found rows with selector:', selector, results.length);
+                            return {
+                                type: 'table',
+                                rows: results,
+                                selector
+                            };
                         }
                     }
 
                     // 테이블이 없으면 페이지 전체 텍스트 분석
-                    if (rows.length === 0) {
-                        return {
-                            type: 'no_table',
-                            pageText: document.body.innerText.substring(0, 5000),
-                            html: document.body.innerHTML.substring(0, 10000)
-                        };
-                    }
-
-                    for (let row of rows) {
-                        const cells = row.querySelectorAll('td');
-                        if (cells.length < 2) continue;
-
-                        const rowText = row.innerText;
-                        const link = row.querySelector('a');
-                        const href = link ? link.getAttribute('href') : '';
-                        const onclick = row.getAttribute('onclick') || '';
-
-                        // 각 셀의 텍스트 추출
-                        const cellTexts = [];
-                        for (let cell of cells) {
-                            cellTexts.push(cell.innerText.trim());
-                        }
-
-                        results.push({
-                            cellTexts,
-                            href,
-                            onclick,
-                            rowText: rowText.substring(0, 500)
-                        });
-                    }
-
                     return {
-                        type: 'table',
-                        rows: results
+                        type: 'no_table',
+                        pageText: document.body.innerText.substring(0, 5000),
+                        html: document.body.innerHTML.substring(0, 10000)
                     };
                 }
-            """)
+            """, preferred)
+            await self.archive_page(rows_data)
 
             print(f"[분석] 결과 타입: {rows_data.get('type', 'unknown')}")
 
@@ -209,86 +212,21 @@ class IrisScraper(BaseScraper):
                 html_path = self.output_dir / "page_structure.html"
                 html_path.write_text(rows_data.get('html', ''), encoding='utf-8')
                 print(f"[저장] HTML 구조 → {html_path}")
+                self.error = "목록을 찾지 못함"
                 return []
 
             rows = rows_data.get('rows', [])
             print(f"[수집] {len(rows)}건 발견")
 
-            for idx, row in enumerate(rows):
-                try:
-                    cell_texts = row.get('cellTexts', [])
-                    if len(cell_texts) < 2:
-                        continue
-
-                    # 공고 정보 추출 (IRIS 테이블 구조에 맞게 조정 필요)
-                    # 일반적인 구조: [번호, 부처, 공고명, 접수기간, 상태 등]
-                    title = ''
-                    organization = ''
-                    deadline = None
-                    status = ''
-
-                    for i, text in enumerate(cell_texts):
-                        # 제목 찾기 (가장 긴 텍스트)
-                        if len(text) > len(title) and not text.isdigit():
-                            if not any(kw in text for kw in ['접수', '마감', '진행', '종료']):
-                                title = text
-
-                        # 부처/기관 찾기
-                        if any(kw in text for kw in ['부', '청', '원', '처', '위원회', '재단', '진흥']):
-                            if len(text) < 30:
-                                organization = text
-
-                        # 상태 찾기
-                        if any(kw in text for kw in ['접수중', '접수예정', '마감', '진행중', '종료']):
-                            status = text
-
-                        # 날짜 찾기
-                        date_match = re.search(r'(\d{4})[.-](\d{2})[.-](\d{2})', text)
-                        if date_match:
-                            try:
-                                y, m, d = date_match.groups()
-                                deadline = datetime(int(y), int(m), int(d))
-                            except:
-                                pass
-
-                    if not title or len(title) < 5:
-                        continue
-
-                    # URL 생성
-                    href = row.get('href', '')
-                    onclick = row.get('onclick', '')
-
-                    url = self.ANNOUNCEMENTS_URL
-                    if href and href.startswith('http'):
-                        url = href
-                    elif href and href.startswith('/'):
-                        url = f"{self.BASE_URL}{href}"
-                    elif 'ancmId' in onclick:
-                        # onclick에서 ancmId 추출
-                        ancm_match = re.search(r"ancmId['\"]?\s*[,:=]\s*['\"]?(\w+)", onclick)
-                        if ancm_match:
-                            url = f"{self.BASE_URL}/contents/retrieveBsnsAncmView.do?ancmId={ancm_match.group(1)}"
-
-                    # ID 생성
-                    announcement_id = f"iris_{title[:30].replace(' ', '_')}_{idx}"
-
-                    announcement = Announcement(
-                        id=announcement_id,
-                        source=self.source_name,
-                        title=title.strip(),
-                        url=url,
-                        organization=organization or None,
-                        deadline=deadline,
-                        status=status or None,
-                    )
-                    announcements.append(announcement)
-                    print(f"  [{status or '?'}] {title[:50]}")
-
-                except Exception as e:
-                    print(f"  [파싱 오류] {e}")
-                    continue
+            announcements = iris_parser.parse(rows_data, datetime.now())
+            for a in announcements:
+                print(f"  [{a.status or '?'}] {a.title[:50]}")
+
+            if announcements:
+                self.learn("selector", rows_data["selector"])
 
         except Exception as e:
+            self.error = str(e)
             print(f"[오류] 수집 실패: {e}")
             import traceback
             traceback.print_exc()
@@ -3,28 +3,40 @@ K-Startup 창업/R&D 공고 스크래퍼
 https://www.k-startup.go.kr
 """
 import asyncio
-import re
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List, Optional
 from pathlib import Path
 from playwright.async_api import async_playwright
 
 from .base import BaseScraper
+from .capture import FieldMap
 from src.models import Announcement
+from src.parsers import kstartup as kstartup_parser
+from src.storage.paths import DATA_DIR
 
 
 class KStartupScraper(BaseScraper):
     """K-Startup 공고 스크래퍼 (Playwright)"""
 
-    BASE_URL = "https://www.k-startup.go.kr"
+    BASE_URL = kstartup_parser.BASE_URL
     # 진행중인 사업공고 페이지
-    ANNOUNCEMENTS_URL = f"{BASE_URL}/web/contents/bizpbanc-ongoing.do"
+    ANNOUNCEMENTS_URL = kstartup_parser.LIST_URL
+    DETAIL_URL = kstartup_parser.DETAIL_URL
+
+    # 사업공고 목록 API (스크롤 시 추가 로드하는 응답)
+    API_PATTERN = r"bizpbanc"
+    API_FIELDS = FieldMap(
+        id=("pbancSn", "pbanc_sn"),
+        title=("bizPbancNm", "biz_pbanc_nm", "pbancNm", "title"),
+        deadline=("pbancRcptEndDt", "pbanc_rcpt_end_dt", "rcptEndDt", "endDt"),
+        organization=("pbancNtrpNm", "pbanc_ntrp_nm", "sprvInstNm", "orgNm"),
+    )
 
     def __init__(self, output_dir: str = None):
         if output_dir:
             self.output_dir = Path(output_dir)
         else:
-            self.output_dir = Path("data/kstartup")
+            self.output_dir = DATA_DIR / "kstartup"
         self.output_dir.mkdir(parents=True, exist_ok=True)
         (self.output_dir / "screenshots").mkdir(exist_ok=True)
 
@@ -86,8 +98,20 @@ class KStartupScraper(BaseScraper):
             print(f"[access] {self.ANNOUNCEMENTS_URL}")
             print(f"[filter] year = {year}")
 
-            await self.page.goto(self.ANNOUNCEMENTS_URL, wait_until="networkidle", timeout=60000)
-            await self.page.wait_for_timeout(3000)
+            captured = await self.capture_announcements(
+                self.ANNOUNCEMENTS_URL,
+                self.API_PATTERN,
+                self.API_FIELDS,
+                make_id=lambda sn, title: f"kstartup_{sn}_{title[:15].replace(' ', '_')}",
+                make_url=lambda sn: self.DETAIL_URL.format(id=sn),
+                wait_until="networkidle",
+                timeout=60000,
+            )
+            if captured:
+                announcements = kstartup_parser.filter_captured(captured, datetime.now(), year)
+                self._print(announcements)
+                return announcements
+            print("[API] list response not captured, falling back to DOM")
 
             # 스크롤해서 더 많은 데이터 로드 (Lazy Loading 대응)
             for _ in range(3):
@@ -173,87 +197,23 @@ class KStartupScraper(BaseScraper):
             """)
 
             print(f"[analyze] type: {items_data.get('type', 'unknown')}")
+            await self.archive_page(items_data)
 
             if items_data.get('type') == 'no_items':
                 print("[warning] no items found")
                 safe_text = items_data.get('pageText', '')[:500].encode('ascii', 'replace').decode('ascii')
                 print(f"page text: {safe_text}")
+                self.error = "목록을 찾지 못함"
                 return []
 
             items = items_data.get('items', [])
             print(f"[found] {len(items)} items (selector: {items_data.get('selector', '?')})")
 
-            for idx, item in enumerate(items):
-                try:
-                    text = item.get('text', '')
-                    lines = [l.strip() for l in text.split('\n') if l.strip()]
-
-                    if len(lines) < 2:
-                        continue
-
-                    # 공고 정보 추출
-                    title = ''
-                    organization = ''
-                    deadline = None
-                    d_day = ''
-
-                    for line in lines:
-                        # D-day 찾기
-                        d_match = re.search(r'D-(\d+)', line)
-                        if d_match:
-                            d_day = f"D-{d_match.group(1)}"
-                            days = int(d_match.group(1))
-                            deadline = datetime.now() + timedelta(days=days)
-
-                        # 제목 (가장 긴 라인)
-                        if len(line) > len(title) and len(line) > 10:
-                            if not re.match(r'^D-\d+$', line) and not line.isdigit():
-                                if '조회' not in line and '스크랩' not in line:
-                                    title = line
-
-                        # 기관명 (짧은 텍스트 중 기관 키워드 포함)
-                        if any(kw in line for kw in ['부', '청', '원', '처', '진흥', '재단', '센터']):
-                            if len(line) < 30 and line != title:
-                                organization = line
-
-                    if not title or len(title) < 5:
-                        continue
-
-                    # 연도 필터링
-                    title_year_match = re.search(r'(20\d{2})년?', title)
-                    if title_year_match:
-                        title_year = int(title_year_match.group(1))
-                        if title_year != year:
-                            continue
-
-                    # URL 생성
-                    pbancSn = item.get('pbancSn', '')
-                    url = self.ANNOUNCEMENTS_URL
-                    if pbancSn:
-                        url = f"{self.BASE_URL}/web/contents/bizpbanc-detail.do?pbancSn={pbancSn}"
-
-                    # ID 생성
-                    announcement_id = f"kstartup_{pbancSn or idx}_{title[:15].replace(' ', '_')}"
-
-                    announcement = Announcement(
-                        id=announcement_id,
-                        source=self.source_name,
-                        title=title.strip()[:200],
-                        url=url,
-                        organization=organization or None,
-                        deadline=deadline,
-                        status=d_day or "진행중",
-                    )
-                    announcements.append(announcement)
-
-                    safe_title = title[:40].encode('ascii', 'replace').decode('ascii')
-                    print(f"  [{d_day or '?'}] {safe_title}")
-
-                except Exception as e:
-                    print(f"  [parse error] {e}")
-                    continue
+            announcements = kstartup_parser.parse(items_data, datetime.now(), year)
+            self._print(announcements)
 
         except Exception as e:
+            self.error = str(e)
             print(f"[error] fetch failed: {e}")
             import traceback
             traceback.print_exc()
@@ -261,6 +221,11 @@ class KStartupScraper(BaseScraper):
 
         return announcements
 
+    def _print(self, announcements: List[Announcement]):
+        for a in announcements:
+            safe_title = a.title[:40].encode('ascii', 'replace').decode('ascii')
+            print(f"  [{a.status}] {safe_title}")
+
     async def fetch_detail(self, announcement_id: str) -> dict:
         """공고 상세 정보 수집 (추후 구현)"""
         return {}
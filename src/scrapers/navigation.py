@@ -0,0 +1,178 @@
+"""
+목록 페이지 진입 경로 탐색
+후보 경로(직접 URL, 메뉴 클릭)를 탭 여러 개에서 동시에 열어 먼저 유효한 페이지가 나온 것을 채택하고 나머지는 취소
+- 지난번에 성공한 경로를 먼저 열고, hedge_delay 안에 안 끝나면 나머지 후보를 함께 시작
+- 최악의 탐색 시간이 후보별 타임아웃의 합에서 타임아웃 한 번 정도로 줄어듦
+"""
+import asyncio
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from src.storage.paths import DATA_DIR
+from src.storage.statefile import locked, write_json_atomic
+
+
+# 출처별로 기억한 경로 (RNDO 실행 사이에 유지)
+CACHE_FILE = DATA_DIR / "navigation.json"
+
+# 경로 이름 → 새 탭(page)을 목록 페이지까지 이동시키는 함수
+PathOpener = Callable[[object], Awaitable[None]]
+
+# 이동한 탭이 목록 페이지가 맞는지 확인하는 함수
+PageCheck = Callable[[object], Awaitable[bool]]
+
+
+class NavigationCache:
+    """출처별로 마지막에 성공한 경로/셀렉터/프레임 기록
+
+    {출처: {종류: {"value": 값, "updated": 시각, "fallbacks": 횟수, "last_fallback": {...}}}} 형태의 JSON 파일
+    종류: entry(목록 진입 경로), selector(목록 행 셀렉터), frame(목록이 있는 프레임 URL)
+    기억한 값이 안 통해서 다른 값으로 바뀌면 fallback으로 기록 (사이트 개편 감지용)
+    워커 여러 개가 같은 파일을 쓰므로 저장할 때 파일을 다시 읽어 이 프로세스가 바꾼 항목만 덮어씀
+    """
+
+    def __init__(self, path: Path = CACHE_FILE):
+        self.path = path
+        self._data: Optional[Dict[str, Dict[str, dict]]] = None
+        self._changed: Set[Tuple[str, str]] = set()
+
+    def _read(self) -> Dict[str, Dict[str, dict]]:
+        if not self.path.exists():
+            return {}
+        with open(self.path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    @property
+    def data(self) -> Dict[str, Dict[str, dict]]:
+        """처음 쓸 때 파일 로드"""
+        if self._data is None:
+            self._data = self._read()
+        return self._data
+
+    def get(self, source: str, kind: str) -> Optional[str]:
+        entry = self.data.get(source, {}).get(kind)
+        return entry["value"] if entry else None
+
+    def remember(self, source: str, kind: str, value: str):
+        """성공한 값 기록 (기억한 값과 다르면 fallback 기록)"""
+        entry = self.data.setdefault(source, {}).get(kind)
+        if entry and entry["value"] == value:
+            return
+        now = datetime.now().isoformat()
+        new_entry = {"value": value, "updated": now, "fallbacks": 0}
+        if entry:
+            print(f"  [경로 변경] {source} {kind}: {entry['value']} → {value}")
+            new_entry["fallbacks"] = entry.get("fallbacks", 0) + 1
+            new_entry["last_fallback"] = {"at": now, "from": entry["value"]}
+        self.data[source][kind] = new_entry
+        self._changed.add((source, kind))
+        self.save()
+
+    def fallbacks_since(self, since: datetime) -> Dict[str, str]:
+        """since 이후 기억한 값이 바뀐 항목 ("출처 종류" → "이전 → 현재")"""
+        changed = {}
+        for source, kinds in self.data.items():
+            for kind, entry in kinds.items():
+                last = entry.get("last_fallback")
+                if last and datetime.fromisoformat(last["at"]) >= since:
+                    changed[f"{source} {kind}"] = f"{last['from']} → {entry['value']}"
+        return changed
+
+    def save(self):
+        """파일의 최신 내용에 이 프로세스가 바꾼 항목을 합쳐 원자적으로 저장"""
+        with locked(self.path):
+            merged = self._read()
+            for source, kind in self._changed:
+                merged.setdefault(source, {})[kind] = self.data[source][kind]
+            write_json_atomic(self.path, merged, ensure_ascii=False, indent=2)
+        # 다른 워커가 기억한 값도 이후 조회에 반영
+        self._data = merged
+        self._changed = set()
+
+
+async def open_first(
+    context,
+    paths: Dict[str, PathOpener],
+    is_valid: PageCheck,
+    preferred: Optional[str] = None,
+    hedge_delay: float = 2.0,
+):
+    """후보 경로를 새 탭에서 동시에 열어 먼저 유효해진 탭 채택
+
+    Args:
+        context: Playwright BrowserContext
+        paths: 경로 이름 → 탭 이동 함수
+        is_valid: 이동한 탭 확인 함수
+        preferred: 먼저 시도할 경로 이름 (지난번 성공 경로)
+        hedge_delay: preferred만 단독으로 기다려 줄 시간 (초)
+
+    Returns:
+        (경로 이름, page) - 모두 실패하면 (None, None)
+    """
+    names = list(paths)
+    if preferred in paths:
+        names.remove(preferred)
+        names.insert(0, preferred)
+
+    async def attempt(name: str):
+        page = await context.new_page()
+        valid = False
+        try:
+            await paths[name](page)
+            valid = await is_valid(page)
+        except asyncio.CancelledError:
+            await page.close()
+            raise
+        except Exception as e:
+            print(f"  [경로 실패] {name} - {str(e)[:50]}")
+        if valid:
+            return page
+        await page.close()
+        return None
+
+    tasks: Dict[asyncio.Task, str] = {}
+    waiting = names[:]
+    winner = None
+    try:
+        if preferred in paths:
+            name = waiting.pop(0)
+            tasks[asyncio.create_task(attempt(name))] = name
+            done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+            for task in done:
+                name = tasks.pop(task)
+                if task.result() is not None:
+                    winner = (name, task.result())
+
+        if winner is None:
+            for name in waiting:
+                tasks[asyncio.create_task(attempt(name))] = name
+        while winner is None and tasks:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                name = tasks.pop(task)
+                page = task.result()
+                if page is None:
+                    continue
+                if winner is None:
+                    winner = (name, page)
+                else:
+                    await page.close()
+    finally:
+        # 나머지 탭은 취소 (취소 직전에 끝난 탭은 닫기)
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                page = await task
+            except asyncio.CancelledError:
+                continue
+            if page is not None:
+                await page.close()
+
+    return winner or (None, None)
+
+
+# 프로세스 전체가 공유하는 캐시 (출처별 스크래퍼가 같은 파일을 덮어쓰지 않게)
+navigation_cache = NavigationCache()
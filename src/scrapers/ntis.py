@@ -3,28 +3,145 @@ NTIS (국가과학기술지식정보서비스) R&D 과제공고 스크래퍼
 https://www.ntis.go.kr
 """
 import asyncio
-import re
 from datetime import datetime
 from typing import List, Optional
 from pathlib import Path
 from playwright.async_api import async_playwright
 
 from .base import BaseScraper
+from .rowfilter import ROW_FILTER_JS, build_filters
 from src.models import Announcement
+from src.parsers import ntis as ntis_parser
+from src.storage.paths import DATA_DIR
+
+
+# 목록 행 추출 (page.evaluate, 재파싱/백필과 같은 원본 형식)
+# 인자: {preferred: 지난번 셀렉터, filters: rowfilter.build_filters() 결과}
+# 연도/마감/이미 본 행은 페이지 안에서 걸러서 넘김 (idx는 원래 행 위치, 공고 ID에 쓰임)
+_ROWS_JS = "({preferred, filters}) => {" + ROW_FILTER_JS + r"""
+        // 여러 테이블 셀렉터 시도
+        let selectors = [
+            'table tbody tr',
+            '.board-list tbody tr',
+            '.list-table tbody tr',
+            'table.list tr',
+            '.tb_list tr',
+            'tr[onclick]',
+            '.data-list li',
+            '.announcement-item',
+            'ul.list li',
+            'div.list-item'
+        ];
+        if (preferred) {
+            selectors = [preferred, ...selectors.filter(s => s !== preferred)];
+        }
+
+        const extract = (rows, selector) => {
+            const results = [];
+            for (let row of rows) {
+                const cells = row.querySelectorAll('td, div.cell');
+                const rowText = row.innerText || '';
+                const link = row.querySelector('a');
+                const href = link ? link.getAttribute('href') : '';
+                const onclick = row.getAttribute('onclick') || (link ? link.getAttribute('onclick') : '');
+
+                const cellTexts = [];
+                for (let cell of cells) {
+                    cellTexts.push((cell.innerText || '').trim());
+                }
+
+                if (cellTexts.length > 0 || rowText.length > 10) {
+                    results.push({
+                        cellTexts,
+                        href,
+                        onclick,
+                        rowText: rowText.substring(0, 500),
+                        selector
+                    });
+                }
+            }
+            return results;
+        };
+
+        // 파서(src/parsers/ntis.py)와 같은 기준으로 제목/상태 추정
+        const titleOf = (cellTexts) => {
+            let title = '';
+            for (let text of cellTexts) {
+                if (text.length > title.length && text.length > 10 &&
+                    !['접수', '마감', '종료', '부', '청', '원'].some(kw => text.includes(kw)) &&
+                    !/^\d+$/.test(text)) {
+                    title = text;
+                }
+            }
+            return title;
+        };
+        const statusOf = (cellTexts) => {
+            let status = '';
+            for (let text of cellTexts) {
+                if (['접수중', '접수예정', '마감', '진행', '종료', '공고중'].some(kw => text.includes(kw))) {
+                    status = text;
+                }
+            }
+            return status;
+        };
+
+        const rowFilter = makeRowFilter(filters);
+        const keep = (rows) => {
+            const kept = [];
+            rows.forEach((row, idx) => {
+                // 조회수/게시 번호처럼 숫자만 있는 칸은 지문에서 제외
+                const stable = row.cellTexts.filter(t => !/^[\d,]+$/.test(t));
+                const fp = rowFilter.fingerprint(
+                    [idx, ...(stable.length ? stable : [row.rowText]), row.href || ''].join('\u001f')
+                );
+                if (rowFilter.otherYear(titleOf(row.cellTexts))) return;
+                if (rowFilter.closed(statusOf(row.cellTexts))) return;
+                if (rowFilter.seen(fp)) return;
+                kept.push({...row, idx, fp});
+            });
+            return kept;
+        };
+
+        // 행이 실제로 뽑히는 첫 셀렉터 사용 (필터 전 행 기준)
+        for (let selector of selectors) {
+            const found = document.querySelectorAll(selector);
+            if (found.length === 0) continue;
+            const results = extract(found, selector);
+            if (results.length > 0) {
+                return {
+                    type: 'table',
+                    rows: keep(results),
+                    total: results.length,
+                    filtered: rowFilter.counts,
+                    seenHits: rowFilter.hits,
+                    selector
+                };
+            }
+        }
+
+        // 테이블이 없으면 페이지 구조 반환
+        return {
+            type: 'no_table',
+            pageText: document.body.innerText.substring(0, 3000),
+            tables: document.querySelectorAll('table').length,
+            divs: document.querySelectorAll('div').length
+        };
+    }
+"""
 
 
 class NtisScraper(BaseScraper):
     """NTIS 과제공고 스크래퍼 (Playwright)"""
 
-    BASE_URL = "https://www.ntis.go.kr"
+    BASE_URL = ntis_parser.BASE_URL
     # 국가R&D 통합공고 페이지
-    ANNOUNCEMENTS_URL = f"{BASE_URL}/rndgate/eg/un/ra/mng.do"
+    ANNOUNCEMENTS_URL = ntis_parser.LIST_URL
 
     def __init__(self, output_dir: str = None):
         if output_dir:
             self.output_dir = Path(output_dir)
         else:
-            self.output_dir = Path("data/ntis")
+            self.output_dir = DATA_DIR / "ntis"
         self.output_dir.mkdir(parents=True, exist_ok=True)
         (self.output_dir / "screenshots").mkdir(exist_ok=True)
 
@@ -71,6 +188,14 @@ class NtisScraper(BaseScraper):
             print(f"  [screenshot skip] {name} - {str(e)[:50]}")
             return None
 
+    async def extract_rows(self, page, filters: dict = None) -> dict:
+        """목록 페이지에서 원본 행 추출 (지난번에 목록을 뽑아낸 셀렉터를 먼저 시도)
+
+        Args:
+            filters: 페이지 안에서 거를 조건 (rowfilter.build_filters, 없으면 전체 행)
+        """
+        return await page.evaluate(_ROWS_JS, {"preferred": self.learned("selector"), "filters": filters})
+
     async def fetch_announcements(self, year: int = None) -> List[Announcement]:
         """진행중인 과제공고 목록 수집
 
@@ -85,7 +210,7 @@ class NtisScraper(BaseScraper):
         try:
             print(f"[access] {self.ANNOUNCEMENTS_URL}")
             print(f"[filter] year = {year}")
-            await self.page.goto(self.ANNOUNCEMENTS_URL, wait_until="networkidle", timeout=60000)
+            await self.goto(self.ANNOUNCEMENTS_URL, wait_until="networkidle", timeout=60000)
             await self.page.wait_for_timeout(3000)
 
             await self.take_screenshot("ntis_list_page")
@@ -94,76 +219,10 @@ class NtisScraper(BaseScraper):
             content = await self.page.content()
             print(f"[loaded] content length: {len(content)}")
 
-            # 테이블 또는 리스트에서 공고 데이터 추출
-            rows_data = await self.page.evaluate("""
-                () => {
-                    const results = [];
-
-                    // 여러 테이블 셀렉터 시도
-                    const selectors = [
-                        'table tbody tr',
-                        '.board-list tbody tr',
-                        '.list-table tbody tr',
-                        'table.list tr',
-                        '.tb_list tr',
-                        'tr[onclick]',
-                        '.data-list li',
-                        '.announcement-item',
-                        'ul.list li',
-                        'div.list-item'
-                    ];
-
-                    let rows = [];
-                    let usedSelector = '';
-                    for (let selector of selectors) {
-                        const found = document.querySelectorAll(selector);
-                        if (found.length > 0) {
-                            rows = found;
-                            usedSelector = selector;
-                            break;
-                        }
-                    }
-
-                    if (rows.length === 0) {
-                        // 테이블이 없으면 페이지 구조 반환
-                        return {
-                            type: 'no_table',
-                            pageText: document.body.innerText.substring(0, 3000),
-                            tables: document.querySelectorAll('table').length,
-                            divs: document.querySelectorAll('div').length
-                        };
-                    }
-
-                    for (let row of rows) {
-                        const cells = row.querySelectorAll('td, div.cell');
-                        const rowText = row.innerText || '';
-                        const link = row.querySelector('a');
-                        const href = link ? link.getAttribute('href') : '';
-                        const onclick = row.getAttribute('onclick') || (link ? link.getAttribute('onclick') : '');
-
-                        const cellTexts = [];
-                        for (let cell of cells) {
-                            cellTexts.push((cell.innerText || '').trim());
-                        }
-
-                        if (cellTexts.length > 0 || rowText.length > 10) {
-                            results.push({
-                                cellTexts,
-                                href,
-                                onclick,
-                                rowText: rowText.substring(0, 500),
-                                selector: usedSelector
-                            });
-                        }
-                    }
-
-                    return {
-                        type: 'table',
-                        rows: results,
-                        selector: usedSelector
-                    };
-                }
-            """)
+            # 테이블 또는 리스트에서 공고 데이터 추출 (연도/마감/이미 본 행은 페이지에서 거름)
+            now = datetime.now()
+            rows_data = await self.extract_rows(self.page, build_filters(self.source_name, year, now, seen_rows=self.seen_rows))
+            await self.archive_page(rows_data)
 
             print(f"[analyze] type: {rows_data.get('type', 'unknown')}")
 
@@ -173,110 +232,25 @@ class NtisScraper(BaseScraper):
                 page_text = rows_data.get('pageText', '')
                 safe_text = page_text.encode('ascii', 'replace').decode('ascii')[:500]
                 print(f"page text sample: {safe_text}")
+                self.error = "목록을 찾지 못함"
                 return []
 
             rows = rows_data.get('rows', [])
-            print(f"[found] {len(rows)} rows (selector: {rows_data.get('selector', '?')})")
-
-            for idx, row in enumerate(rows):
-                try:
-                    cell_texts = row.get('cellTexts', [])
-                    row_text = row.get('rowText', '')
-
-                    # 헤더 행 스킵
-                    if not cell_texts and not row_text:
-                        continue
-                    if any(kw in str(cell_texts) for kw in ['번호', '제목', '공고명', 'No', '순번']):
-                        continue
-
-                    # 공고 정보 추출
-                    title = ''
-                    organization = ''
-                    deadline = None
-                    status = ''
-                    period = ''
-
-                    # 셀 텍스트에서 정보 추출
-                    all_text = ' '.join(cell_texts) if cell_texts else row_text
-
-                    for text in cell_texts:
-                        if not text:
-                            continue
-
-                        # 제목 (가장 긴 텍스트)
-                        if len(text) > len(title) and len(text) > 10:
-                            if not any(kw in text for kw in ['접수', '마감', '종료', '부', '청', '원']):
-                                if not re.match(r'^\d+$', text):  # 숫자만 있는 건 스킵
-                                    title = text
-
-                        # 부처/기관
-                        if any(kw in text for kw in ['부', '청', '원', '처', '위원회', '재단', '진흥', '연구']):
-                            if len(text) < 50 and not title == text:
-                                organization = text
-
-                        # 상태
-                        if any(kw in text for kw in ['접수중', '접수예정', '마감', '진행', '종료', '공고중']):
-                            status = text
-
-                        # 기간 (날짜 범위)
-                        if '~' in text or '-' in text:
-                            date_match = re.search(r'(\d{4}[.-]\d{2}[.-]\d{2})', text)
-                            if date_match:
-                                period = text
-
-                    # 마감일 추출
-                    if period:
-                        dates = re.findall(r'(\d{4})[.-](\d{2})[.-](\d{2})', period)
-                        if dates:
-                            try:
-                                last_date = dates[-1]
-                                deadline = datetime(int(last_date[0]), int(last_date[1]), int(last_date[2]))
-                            except:
-                                pass
-
-                    if not title or len(title) < 5:
-                        continue
-
-                    # 연도 필터링 - 제목에 연도가 있으면 체크
-                    title_year_match = re.search(r'(20\d{2})년?', title)
-                    if title_year_match:
-                        title_year = int(title_year_match.group(1))
-                        if title_year != year:
-                            continue  # 다른 연도 공고 스킵
-
-                    # URL 생성
-                    href = row.get('href', '')
-                    onclick = row.get('onclick', '')
-
-                    url = self.ANNOUNCEMENTS_URL
-                    if href and href.startswith('http'):
-                        url = href
-                    elif href and href.startswith('/'):
-                        url = f"{self.BASE_URL}{href}"
-
-                    # ID 생성
-                    announcement_id = f"ntis_{idx}_{title[:20].replace(' ', '_')}"
-
-                    announcement = Announcement(
-                        id=announcement_id,
-                        source=self.source_name,
-                        title=title.strip()[:200],
-                        url=url,
-                        organization=organization or None,
-                        deadline=deadline,
-                        status=status or None,
-                    )
-                    announcements.append(announcement)
-
-                    # 출력 (인코딩 안전하게)
-                    safe_title = title[:40].encode('ascii', 'replace').decode('ascii')
-                    print(f"  [{status or '?'}] {safe_title}")
-
-                except Exception as e:
-                    print(f"  [parse error] {e}")
-                    continue
+            print(f"[found] {len(rows)}/{rows_data.get('total')} rows (selector: {rows_data.get('selector', '?')}, filtered: {rows_data.get('filtered')})")
+            if self.seen_rows:
+                self.stage_rows([row['fp'] for row in rows] + rows_data.get('seenHits', []))
+
+            announcements = ntis_parser.parse(rows_data, now, year)
+            for a in announcements:
+                # 출력 (인코딩 안전하게)
+                safe_title = a.title[:40].encode('ascii', 'replace').decode('ascii')
+                print(f"  [{a.status or '?'}] {safe_title}")
+
+            if announcements:
+                self.learn("selector", rows_data["selector"])
 
         except Exception as e:
+            self.error = str(e)
             print(f"[error] fetch failed: {e}")
             import traceback
             traceback.print_exc()
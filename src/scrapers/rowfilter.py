@@ -0,0 +1,155 @@
+"""
+목록 행 사전 필터 (페이지 안에서 걸러서 필요한 행만 CDP로 넘김)
+- 연도: 제목의 연도가 다른 공고 (파서의 연도 필터와 같은 기준)
+- 상태: 마감/종료 공고
+- 이미 본 행: 지난 실행에서 끝까지 처리한 행의 원본 지문(FNV-1a 32비트) 집합
+  공고 ID가 아니라 행 내용의 지문이므로 마감일/기관 등이 바뀐 행은 다시 넘어와 변경 감지가 그대로 동작
+  블룸 필터는 오탐이면 새 공고가 조용히 사라지므로 정확한 지문 집합 사용
+
+지문은 실행 중에는 모아 두기만 하고, 발송 실패 없이 실행이 끝난 뒤 commit()으로 반영
+(중간에 실패하면 다음 실행에서 같은 행을 다시 처리)
+실행마다 SeenRows를 따로 만들어 스크래퍼에 넘기므로 겹쳐 도는 실행이 서로의 지문을 반영하거나 버리지 않음
+"""
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from src.storage.changes import QUIET_STATUSES
+from src.storage.state import StateStore
+
+
+# 출처별로 처리한 행 지문 (RNDO 실행 사이에 유지, 상태 저장소 키)
+SEEN_ROWS_KEY = "seen_rows.json"
+
+# 이 기간 동안 목록에서 안 보인 지문은 정리
+MAX_AGE_DAYS = 60
+
+# 페이지 안에서 쓰는 필터 함수 (목록 추출 스크립트 앞에 붙여서 사용)
+# makeRowFilter(filters) → {fingerprint, otherYear, closed, seen, counts, hits}
+ROW_FILTER_JS = r"""
+    const makeRowFilter = (filters) => {
+        filters = filters || {};
+        const seenSet = new Set(filters.seen || []);
+        const skipStatuses = filters.skipStatuses || [];
+        const counts = {year: 0, status: 0, seen: 0};
+        const hits = [];
+
+        // FNV-1a 32비트 (UTF-16 코드 단위)
+        const fingerprint = (text) => {
+            let h = 0x811c9dc5;
+            for (let i = 0; i < text.length; i++) {
+                h ^= text.charCodeAt(i);
+                h = Math.imul(h, 0x01000193) >>> 0;
+            }
+            return h;
+        };
+
+        const otherYear = (title) => {
+            if (!filters.year) return false;
+            const m = (title || '').match(/(20\d{2})년?/);
+            const skip = !!m && parseInt(m[1], 10) !== filters.year;
+            if (skip) counts.year++;
+            return skip;
+        };
+
+        // 상태 칸이 마감/종료와 정확히 같을 때만 (QUIET_STATUSES와 같은 기준, '마감임박' 같은 값은 통과)
+        const closed = (status) => {
+            const skip = !!status && skipStatuses.includes(status.trim());
+            if (skip) counts.status++;
+            return skip;
+        };
+
+        const closedBy = (deadline) => {
+            // 마감일 다음 날 자정 <= 수집 시각이면 마감 (마감 당일은 접수중, 파서의 접수중/마감 판단과 같은 기준)
+            if (!deadline) return false;
+            const end = new Date(deadline.getFullYear(), deadline.getMonth(), deadline.getDate() + 1);
+            const skip = !!filters.now && skipStatuses.length > 0 && end.getTime() <= filters.now;
+            if (skip) counts.status++;
+            return skip;
+        };
+
+        const seen = (fp) => {
+            const skip = seenSet.has(fp);
+            if (skip) {
+                counts.seen++;
+                hits.push(fp);
+            }
+            return skip;
+        };
+
+        return {fingerprint, otherYear, closed, closedBy, seen, counts, hits};
+    };
+"""
+
+
+def build_filters(
+    source: str,
+    year: Optional[int] = None,
+    now: datetime = None,
+    skip_closed: bool = True,
+    seen_rows: Optional["SeenRows"] = None,
+) -> dict:
+    """페이지 추출 스크립트에 넘길 필터 인자
+
+    Args:
+        year: 이 연도 공고만 (None이면 연도 필터 없음)
+        now: 수집 시각 (마감일 기준 상태 판단용)
+        skip_closed: 마감/종료 공고 제외
+        seen_rows: 이번 실행의 행 지문 (None이면 이미 본 행을 거르지 않음)
+    """
+    now = now or datetime.now()
+    return {
+        "year": year,
+        "skipStatuses": sorted(QUIET_STATUSES) if skip_closed else [],
+        "now": int(now.timestamp() * 1000),
+        "seen": seen_rows.fingerprints(source) if seen_rows else [],
+    }
+
+
+class SeenRows:
+    """출처별 처리한 행 지문 (실행마다 하나)
+
+    {출처: {지문: 마지막으로 본 날짜}} 형태의 JSON (상태 저장소)
+
+    Args:
+        state: 이번 실행의 상태 저장소
+    """
+
+    def __init__(self, state: StateStore, key: str = SEEN_ROWS_KEY, max_age_days: int = MAX_AGE_DAYS):
+        self.state = state
+        self.key = key
+        self.max_age_days = max_age_days
+        self._pending: Dict[str, set] = {}
+
+    def fingerprints(self, source: str) -> List[int]:
+        return [int(fp) for fp in self.state.read(self.key, {}).get(source, {})]
+
+    def observe(self, source: str, fingerprints: Iterable[int]):
+        """이번 실행에서 발송까지 끝낸 행 지문 (commit 전까지는 필터에 반영 안 됨)"""
+        self._pending.setdefault(source, set()).update(fingerprints)
+
+    def commit(self, now: datetime = None) -> int:
+        """이번 실행에서 발송까지 끝낸 지문 반영 + 오래된 지문 정리
+
+        겹쳐 도는 다른 실행/인스턴스가 그사이 저장한 지문과 합쳐서 저장
+
+        Returns:
+            반영한 지문 수
+        """
+        now = now or datetime.now()
+        today = now.date().isoformat()
+        cutoff = (now - timedelta(days=self.max_age_days)).date().isoformat()
+        pending, self._pending = self._pending, {}
+
+        def merge(current: Dict[str, Dict[str, str]]) -> Dict[str, Dict[str, str]]:
+            for source, fingerprints in pending.items():
+                entries = current.setdefault(source, {})
+                for fp in fingerprints:
+                    entries[str(fp)] = today
+            return {
+                source: {fp: day for fp, day in entries.items() if day >= cutoff}
+                for source, entries in current.items()
+            }
+
+        self.state.update(self.key, merge, default={})
+        self.state.flush([self.key])
+        return sum(len(fingerprints) for fingerprints in pending.values())
@@ -0,0 +1,18 @@
+from .archive import ArchivedPage, PageArchive, page_archive
+from .changes import ChangeEvent, ChangeTracker
+from .claims import NotificationClaims
+from .history import AnnouncementStore
+from .state import StateConflict, StateStore, state
+
+__all__ = [
+    "AnnouncementStore",
+    "ArchivedPage",
+    "ChangeEvent",
+    "ChangeTracker",
+    "NotificationClaims",
+    "PageArchive",
+    "StateConflict",
+    "StateStore",
+    "page_archive",
+    "state",
+]
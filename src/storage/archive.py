@@ -0,0 +1,214 @@
+"""
+원본 페이지 보관소 (zlib 압축 + 내용 해시 주소)
+수집한 목록/상세 페이지 HTML과 페이지에서 뽑은 원본 행(JSON)을 그대로 보관
+- 내용은 sha256으로 주소를 매겨 한 번만 저장 (같은 페이지가 매 실행 와도 용량은 그대로)
+- 인덱스(SQLite)에는 출처/URL/종류/시각 → 해시를 실행마다 기록
+- 보관 기간이 지난 인덱스와 더 이상 참조되지 않는 내용은 prune()으로 정리
+파서 디버깅, 재파싱, 변경 감지의 원본 데이터로 사용
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Union
+
+from .paths import DATA_DIR
+
+
+# 기본 보관 위치
+DEFAULT_ROOT = DATA_DIR / "archive"
+
+# 기본 보관 기간 (RNDO_ARCHIVE_DAYS 환경변수로 변경)
+DEFAULT_RETENTION_DAYS = 90
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    url TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,
+    sha256 TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_pages_source ON pages(source, kind, fetched_at);
+CREATE INDEX IF NOT EXISTS idx_pages_url ON pages(url, fetched_at);
+CREATE INDEX IF NOT EXISTS idx_pages_sha ON pages(sha256);
+CREATE TABLE IF NOT EXISTS blobs (
+    sha256 TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    stored INTEGER NOT NULL
+);
+"""
+
+
+@dataclass
+class ArchivedPage:
+    """보관된 페이지 한 건 (인덱스 정보)"""
+    id: int
+    source: str
+    url: str
+    kind: str  # list, detail, rows(페이지에서 뽑은 행 JSON), api(목록 API 응답)
+    fetched_at: datetime
+    sha256: str
+
+
+class PageArchive:
+    """원본 페이지 보관소
+
+    Args:
+        root: 보관 폴더 (index.db + objects/<해시 앞 2자리>/<해시>.z)
+        retention_days: prune()에서 남길 기간
+    """
+
+    def __init__(self, root: Path = None, retention_days: int = None):
+        self.root = Path(root) if root else DEFAULT_ROOT
+        self.retention_days = retention_days or int(
+            os.environ.get("RNDO_ARCHIVE_DAYS", DEFAULT_RETENTION_DAYS)
+        )
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """처음 쓸 때 인덱스 DB 연결"""
+        if self._conn is None:
+            self.root.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.root / "index.db")
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _path(self, sha256: str) -> Path:
+        return self.root / "objects" / sha256[:2] / f"{sha256}.z"
+
+    def put(
+        self,
+        source: str,
+        url: str,
+        kind: str,
+        content: Union[str, bytes, Any],
+        fetched_at: datetime = None,
+    ) -> str:
+        """페이지 보관 (str/bytes는 그대로, 그 외는 JSON으로 직렬화)
+
+        Returns:
+            내용 해시
+        """
+        if isinstance(content, str):
+            data = content.encode("utf-8")
+        elif isinstance(content, bytes):
+            data = content
+        else:
+            data = json.dumps(content, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        sha256 = hashlib.sha256(data).hexdigest()
+        fetched_at = fetched_at or datetime.now()
+
+        with self.conn:
+            exists = self.conn.execute(
+                "SELECT 1 FROM blobs WHERE sha256 = ?", (sha256,)
+            ).fetchone()
+            if not exists:
+                compressed = zlib.compress(data, 6)
+                path = self._path(sha256)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_suffix(".tmp")
+                tmp.write_bytes(compressed)
+                tmp.replace(path)
+                self.conn.execute(
+                    "INSERT INTO blobs (sha256, size, stored) VALUES (?, ?, ?)",
+                    (sha256, len(data), len(compressed)),
+                )
+            self.conn.execute(
+                "INSERT INTO pages (source, url, kind, fetched_at, sha256) VALUES (?, ?, ?, ?, ?)",
+                (source, url, kind, fetched_at.isoformat(), sha256),
+            )
+        return sha256
+
+    def read(self, sha256: str) -> bytes:
+        """내용 원본 (압축 해제)"""
+        return zlib.decompress(self._path(sha256).read_bytes())
+
+    def read_text(self, sha256: str) -> str:
+        return self.read(sha256).decode("utf-8")
+
+    def read_json(self, sha256: str) -> Any:
+        return json.loads(self.read(sha256))
+
+    def pages(
+        self,
+        source: str = None,
+        kind: str = None,
+        since: datetime = None,
+        until: datetime = None,
+        url: str = None,
+    ) -> Iterator[ArchivedPage]:
+        """조건에 맞는 보관 페이지 (시각순)"""
+        clauses, params = [], []
+        for column, value in (("source", source), ("kind", kind), ("url", url)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append("fetched_at >= ?")
+            params.append(since.isoformat())
+        if until is not None:
+            clauses.append("fetched_at < ?")
+            params.append(until.isoformat())
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        for row in self.conn.execute(
+            f"SELECT id, source, url, kind, fetched_at, sha256 FROM pages {where} ORDER BY fetched_at, id",
+            params,
+        ):
+            yield ArchivedPage(row[0], row[1], row[2], row[3], datetime.fromisoformat(row[4]), row[5])
+
+    def latest(self, source: str, kind: str) -> Optional[ArchivedPage]:
+        row = self.conn.execute(
+            """
+            SELECT id, source, url, kind, fetched_at, sha256 FROM pages
+            WHERE source = ? AND kind = ? ORDER BY fetched_at DESC, id DESC LIMIT 1
+            """,
+            (source, kind),
+        ).fetchone()
+        if row is None:
+            return None
+        return ArchivedPage(row[0], row[1], row[2], row[3], datetime.fromisoformat(row[4]), row[5])
+
+    def prune(self, now: datetime = None) -> int:
+        """보관 기간이 지난 인덱스 삭제 후 참조가 없는 내용 파일 삭제
+
+        Returns:
+            삭제한 내용 파일 수
+        """
+        now = now or datetime.now()
+        cutoff = (now - timedelta(days=self.retention_days)).isoformat()
+        with self.conn:
+            self.conn.execute("DELETE FROM pages WHERE fetched_at < ?", (cutoff,))
+            orphans: List[str] = [
+                row[0] for row in self.conn.execute(
+                    "SELECT sha256 FROM blobs WHERE sha256 NOT IN (SELECT sha256 FROM pages)"
+                )
+            ]
+            self.conn.executemany("DELETE FROM blobs WHERE sha256 = ?", [(s,) for s in orphans])
+        for sha256 in orphans:
+            self._path(sha256).unlink(missing_ok=True)
+        return len(orphans)
+
+    def stats(self) -> dict:
+        """보관 현황 (페이지 수, 내용 수, 원본/압축 바이트)"""
+        pages = self.conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+        blobs, size, stored = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(stored), 0) FROM blobs"
+        ).fetchone()
+        return {"pages": pages, "blobs": blobs, "size": size, "stored": stored}
+
+
+# 프로세스 전체가 공유하는 보관소 (스크래퍼가 페이지를 넣음)
+page_archive = PageArchive()
@@ -0,0 +1,173 @@
+"""
+공고 변경 추적 (마감 연장, 상태 변경, 정정공고 등)
+공고 ID별 필드 해시를 버전으로 저장하고, 매 실행마다 ID로 조회해 바뀐 필드만 찾음
+"""
+import hashlib
+import json
+import re
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from src.models import Announcement
+
+
+# 변경을 추적할 필드
+TRACKED_FIELDS = ["title", "organization", "deadline", "status", "prize"]
+
+# 이 상태로 바뀌는 건 알릴 필요 없음 (마감일이 지나면 저절로 바뀜)
+QUIET_STATUSES = {"마감", "종료"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS announcement_state (
+    id TEXT PRIMARY KEY,
+    version INTEGER NOT NULL,
+    record_hash TEXT NOT NULL,
+    field_hashes TEXT NOT NULL,
+    snapshot TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS announcement_versions (
+    id TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    field_hashes TEXT NOT NULL,
+    snapshot TEXT NOT NULL,
+    recorded_at TEXT NOT NULL,
+    PRIMARY KEY (id, version)
+);
+"""
+
+
+@dataclass
+class ChangeEvent:
+    """공고 필드 변경 이벤트"""
+    announcement: Announcement
+    field: str
+    old: Optional[str]
+    new: Optional[str]
+
+    @property
+    def is_correction(self) -> bool:
+        """정정공고 여부 (제목에 '정정'이 새로 붙은 경우)"""
+        return self.field == "title" and "정정" in (self.new or "") and "정정" not in (self.old or "")
+
+
+def _field_value(a: Announcement, name: str) -> Optional[str]:
+    """비교용 필드 값 (실행 시각에 따라 달라지는 부분은 제거)"""
+    value = getattr(a, name)
+    if value is None:
+        return None
+    if name == "deadline":
+        # K-Startup은 D-day로 마감일을 계산하므로 시각은 버리고 날짜만 비교
+        return value.date().isoformat()
+    if name == "status":
+        # D-12 → D-11처럼 매일 줄어드는 표시는 같은 상태로 취급
+        return re.sub(r"D-\d+", "D-n", value)
+    return str(value)
+
+
+def snapshot(a: Announcement) -> Dict[str, Optional[str]]:
+    """변경 감지에 쓰는 필드 값 (재파싱 결과 비교에도 사용)"""
+    return {name: _field_value(a, name) for name in TRACKED_FIELDS}
+
+
+def _hash(value: Optional[str]) -> str:
+    return hashlib.blake2b((value or "").encode("utf-8"), digest_size=8).hexdigest()
+
+
+class ChangeTracker:
+    """공고 버전 이력 관리
+
+    - announcement_state: 공고별 최신 버전 (id 기본키로 바로 조회)
+    - announcement_versions: 바뀔 때마다 쌓이는 버전 이력
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.conn.executescript(_SCHEMA)
+
+    def _load_states(self, ids: List[str]) -> Dict[str, sqlite3.Row]:
+        states = {}
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for row in self.conn.execute(
+                f"SELECT id, version, record_hash, field_hashes, snapshot "
+                f"FROM announcement_state WHERE id IN ({placeholders})",
+                chunk,
+            ):
+                states[row[0]] = row
+        return states
+
+    def detect(self, announcements: Iterable[Announcement]) -> List[ChangeEvent]:
+        """변경 감지 후 새 버전 기록
+
+        처음 보는 공고는 버전 1로 기록만 하고 이벤트는 만들지 않음
+
+        Returns:
+            기존 버전과 달라진 필드별 변경 이벤트
+        """
+        announcements = list(announcements)
+        states = self._load_states([a.id for a in announcements])
+        now = datetime.now().isoformat()
+        events: List[ChangeEvent] = []
+
+        with self.conn:
+            for a in announcements:
+                values = snapshot(a)
+                field_hashes = {name: _hash(value) for name, value in values.items()}
+                record_hash = _hash("|".join(field_hashes[name] for name in TRACKED_FIELDS))
+
+                state = states.get(a.id)
+                if state is not None and state[2] == record_hash:
+                    continue  # 변경 없음 (대부분 여기서 끝남)
+
+                version = 1
+                if state is not None:
+                    version = state[1] + 1
+                    old_hashes = json.loads(state[3])
+                    old_snapshot = json.loads(state[4])
+                    for name in TRACKED_FIELDS:
+                        if old_hashes.get(name) == field_hashes[name]:
+                            continue
+                        if name == "status" and values[name] in QUIET_STATUSES:
+                            continue
+                        events.append(ChangeEvent(a, name, old_snapshot.get(name), values[name]))
+
+                hashes_json = json.dumps(field_hashes)
+                snapshot_json = json.dumps(values, ensure_ascii=False)
+                self.conn.execute(
+                    """
+                    INSERT INTO announcement_state (id, version, record_hash, field_hashes, snapshot, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(id) DO UPDATE SET
+                        version = excluded.version,
+                        record_hash = excluded.record_hash,
+                        field_hashes = excluded.field_hashes,
+                        snapshot = excluded.snapshot,
+                        updated_at = excluded.updated_at
+                    """,
+                    (a.id, version, record_hash, hashes_json, snapshot_json, now),
+                )
+                self.conn.execute(
+                    "INSERT INTO announcement_versions (id, version, field_hashes, snapshot, recorded_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (a.id, version, hashes_json, snapshot_json, now),
+                )
+                # 같은 배치에 같은 ID가 또 나오면 방금 기록한 버전과 비교
+                states[a.id] = (a.id, version, record_hash, hashes_json, snapshot_json)
+
+        return events
+
+    def history(self, announcement_id: str) -> List[dict]:
+        """공고의 버전별 스냅샷 목록 (오래된 순)"""
+        rows = self.conn.execute(
+            "SELECT version, snapshot, recorded_at FROM announcement_versions "
+            "WHERE id = ? ORDER BY version",
+            (announcement_id,),
+        ).fetchall()
+        return [
+            {"version": version, "recorded_at": recorded_at, **json.loads(values)}
+            for version, values, recorded_at in rows
+        ]
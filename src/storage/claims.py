@@ -0,0 +1,126 @@
+"""
+알림 선점 (겹쳐 도는 실행 사이에서 공고 하나는 한 실행만 알림)
+타이머 실행과 수동 실행이 동시에 돌면 둘 다 seen 목록을 실행 시작 때 읽으므로 같은 공고를 각자 새 공고로 봄
+발송 직전에 (테넌트, 공고 ID)를 SQLite에 먼저 기록한 실행만 발송하고
+- 발송 성공: sent로 바꿔 다른 실행이 다시 선점하지 못하게 함
+- 발송 실패: 선점을 풀어 다음 실행(또는 겹쳐 도는 실행)이 다시 시도
+- 실행이 중간에 죽어 풀리지 않은 선점은 CLAIM_TTL이 지나면 다른 실행이 가져감
+"""
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Iterable, List, Set
+
+
+# 이 시간이 지나도 sent가 안 된 선점은 버려진 것으로 봄 (실행 시간 예산보다 넉넉하게)
+CLAIM_TTL = timedelta(minutes=15)
+
+# sent 기록 보관 기간 (그 뒤로는 테넌트 seen 목록이 중복 알림을 막음)
+SENT_RETENTION = timedelta(days=7)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS notification_claims (
+    tenant TEXT NOT NULL,
+    announcement_id TEXT NOT NULL,
+    run_id TEXT NOT NULL,
+    state TEXT NOT NULL,
+    claimed_at TEXT NOT NULL,
+    PRIMARY KEY (tenant, announcement_id)
+);
+"""
+
+
+def _chunks(ids: List[str], size: int = 500):
+    for start in range(0, len(ids), size):
+        yield ids[start:start + size]
+
+
+class NotificationClaims:
+    """테넌트별 공고 알림 선점
+
+    Args:
+        conn: 공고 이력 DB 연결 (실행마다 따로 연결해도 같은 파일이면 SQLite 잠금으로 직렬화)
+        run_id: 이 실행의 ID
+    """
+
+    def __init__(self, conn: sqlite3.Connection, run_id: str, ttl: timedelta = CLAIM_TTL):
+        self.conn = conn
+        self.run_id = run_id
+        self.ttl = ttl
+        self.conn.executescript(_SCHEMA)
+
+    def claim(self, tenant: str, ids: Iterable[str], now: datetime = None) -> Set[str]:
+        """선점 시도
+
+        Returns:
+            이 실행이 선점한 공고 ID (다른 실행이 선점 중이거나 이미 보낸 공고는 빠짐)
+        """
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return set()
+        now = now or datetime.now()
+        stale = (now - self.ttl).isoformat()
+        claimed: Set[str] = set()
+        with self.conn:
+            # 읽기 트랜잭션에서 쓰기로 올라가다 충돌하지 않게 처음부터 쓰기 잠금
+            self.conn.execute("BEGIN IMMEDIATE")
+            for chunk in _chunks(ids):
+                placeholders = ",".join("?" * len(chunk))
+                self.conn.execute(
+                    f"DELETE FROM notification_claims "
+                    f"WHERE tenant = ? AND state = 'claimed' AND claimed_at < ? "
+                    f"AND announcement_id IN ({placeholders})",
+                    [tenant, stale, *chunk],
+                )
+            self.conn.executemany(
+                """
+                INSERT OR IGNORE INTO notification_claims (tenant, announcement_id, run_id, state, claimed_at)
+                VALUES (?, ?, ?, 'claimed', ?)
+                """,
+                [(tenant, announcement_id, self.run_id, now.isoformat()) for announcement_id in ids],
+            )
+            for chunk in _chunks(ids):
+                placeholders = ",".join("?" * len(chunk))
+                for row in self.conn.execute(
+                    f"SELECT announcement_id FROM notification_claims "
+                    f"WHERE tenant = ? AND run_id = ? AND state = 'claimed' "
+                    f"AND announcement_id IN ({placeholders})",
+                    [tenant, self.run_id, *chunk],
+                ):
+                    claimed.add(row[0])
+        return claimed
+
+    def complete(self, tenant: str, ids: Iterable[str]):
+        """발송 성공 → sent (다시 선점 불가)"""
+        with self.conn:
+            self.conn.executemany(
+                """
+                UPDATE notification_claims SET state = 'sent'
+                WHERE tenant = ? AND announcement_id = ? AND run_id = ?
+                """,
+                [(tenant, announcement_id, self.run_id) for announcement_id in ids],
+            )
+
+    def release(self, tenant: str, ids: Iterable[str]):
+        """발송 실패 → 선점 해제"""
+        with self.conn:
+            self.conn.executemany(
+                """
+                DELETE FROM notification_claims
+                WHERE tenant = ? AND announcement_id = ? AND run_id = ? AND state = 'claimed'
+                """,
+                [(tenant, announcement_id, self.run_id) for announcement_id in ids],
+            )
+
+    def prune(self, now: datetime = None) -> int:
+        """오래된 sent 기록 정리
+
+        Returns:
+            지운 행 수
+        """
+        now = now or datetime.now()
+        with self.conn:
+            cursor = self.conn.execute(
+                "DELETE FROM notification_claims WHERE state = 'sent' AND claimed_at < ?",
+                ((now - SENT_RETENTION).isoformat(),),
+            )
+        return cursor.rowcount
@@ -0,0 +1,234 @@
+"""
+공고 이력 저장소 (SQLite + FTS5)
+수집한 공고를 영구 보관하고 키워드/출처/마감일/상태로 검색
+"""
+import sqlite3
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from src.models import Announcement
+from src.text import to_bigrams, tokenize
+
+from .paths import DATA_DIR
+
+
+# 기본 DB 위치 (데이터 폴더, RNDO_DATA_DIR)
+DEFAULT_DB = DATA_DIR / "announcements.db"
+
+# 공고를 처음 저장한 경로 (평소 수집만 새로 올라온 공고로 보고 게시 빈도 학습에 씀)
+ORIGIN_OBSERVE = "observe"
+ORIGIN_BACKFILL = "backfill"
+ORIGIN_REPARSE = "reparse"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS announcements (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    source TEXT NOT NULL,
+    title TEXT NOT NULL,
+    url TEXT NOT NULL,
+    organization TEXT,
+    deadline TEXT,
+    status TEXT,
+    prize TEXT,
+    scraped_at TEXT,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    origin TEXT NOT NULL DEFAULT 'observe'
+);
+CREATE INDEX IF NOT EXISTS idx_announcements_source ON announcements(source, deadline);
+CREATE INDEX IF NOT EXISTS idx_announcements_deadline ON announcements(deadline);
+CREATE INDEX IF NOT EXISTS idx_announcements_status ON announcements(status);
+CREATE VIRTUAL TABLE IF NOT EXISTS announcements_fts USING fts5(grams, tokenize='unicode61');
+"""
+
+
+def _to_iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _from_iso(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _day(value: date) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+class AnnouncementStore:
+    """공고 이력 저장소
+
+    - announcements: 공고 원본 (id 기준 upsert)
+    - announcements_fts: 제목/주최 바이그램 전문 검색 인덱스
+    """
+
+    def __init__(self, db_path: Path = None):
+        self.db_path = Path(db_path) if db_path else DEFAULT_DB
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def upsert_many(self, announcements: Iterable[Announcement], origin: str = ORIGIN_OBSERVE) -> int:
+        """공고 저장 (이미 있으면 최신 값으로 갱신)
+
+        Args:
+            origin: 처음 저장할 때 기록할 경로 (백필/재파싱으로 들어온 과거 공고는 first_seen이
+                게시 시각이 아니므로 게시 빈도 학습에서 뺌, 이미 있는 공고는 바꾸지 않음)
+
+        Returns:
+            저장한 건수
+        """
+        now = datetime.now().isoformat()
+        count = 0
+        with self.conn:
+            for a in announcements:
+                self.conn.execute(
+                    """
+                    INSERT INTO announcements (
+                        id, source, title, url, organization, deadline,
+                        status, prize, scraped_at, first_seen, last_seen, origin
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(id) DO UPDATE SET
+                        title = excluded.title,
+                        url = excluded.url,
+                        organization = excluded.organization,
+                        deadline = excluded.deadline,
+                        status = excluded.status,
+                        prize = excluded.prize,
+                        scraped_at = excluded.scraped_at,
+                        last_seen = excluded.last_seen
+                    """,
+                    (
+                        a.id, a.source, a.title, a.url, a.organization,
+                        _to_iso(a.deadline), a.status, a.prize,
+                        _to_iso(a.scraped_at), now, now, origin,
+                    ),
+                )
+                rowid = self.conn.execute(
+                    "SELECT rowid FROM announcements WHERE id = ?", (a.id,)
+                ).fetchone()[0]
+                grams = " ".join(to_bigrams(f"{a.title} {a.organization or ''}"))
+                self.conn.execute("DELETE FROM announcements_fts WHERE rowid = ?", (rowid,))
+                self.conn.execute(
+                    "INSERT INTO announcements_fts (rowid, grams) VALUES (?, ?)",
+                    (rowid, grams),
+                )
+                count += 1
+        return count
+
+    def get(self, announcement_id: str) -> Optional[Announcement]:
+        """ID로 공고 조회"""
+        row = self.conn.execute(
+            "SELECT * FROM announcements WHERE id = ?", (announcement_id,)
+        ).fetchone()
+        return self._row_to_announcement(row) if row else None
+
+    def recent_texts(self, limit: int = 5000) -> List[str]:
+        """최근 공고의 '제목 주최' 문자열 (관련도 IDF 계산용)"""
+        rows = self.conn.execute(
+            "SELECT title, organization FROM announcements ORDER BY last_seen DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+        return [f"{title} {organization or ''}" for title, organization in rows]
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM announcements").fetchone()[0]
+
+    def search(
+        self,
+        keyword: str = None,
+        source: str = None,
+        deadline_from: date = None,
+        deadline_to: date = None,
+        status: str = None,
+        limit: int = 50,
+    ) -> List[Announcement]:
+        """공고 검색
+
+        Args:
+            keyword: 제목/주최 검색어 (공백 구분 시 모두 포함)
+            source: 출처 (ntis, bizinfo 등)
+            deadline_from: 마감일 시작 (날짜 단위, 포함)
+            deadline_to: 마감일 끝 (날짜 단위, 포함, datetime이면 시각은 무시)
+            status: 상태 (접수중, 마감 등)
+            limit: 최대 건수
+        """
+        where = []
+        params = []
+        join = ""
+        order = "a.last_seen DESC"
+
+        if keyword:
+            match, likes = self._build_match(keyword)
+            if match:
+                join = "JOIN announcements_fts f ON f.rowid = a.rowid"
+                where.append("announcements_fts MATCH ?")
+                params.append(match)
+                order = "bm25(announcements_fts), a.deadline"
+            for like in likes:
+                # 한 글자 검색어는 바이그램 인덱스로 못 찾으므로 LIKE로 보완
+                where.append("(a.title LIKE ? OR a.organization LIKE ?)")
+                params.extend([like, like])
+
+        if source:
+            where.append("a.source = ?")
+            params.append(source)
+        # 마감일은 ISO 문자열이라 날짜 경계로 비교 (끝 날짜는 다음 날 0시 미만, 인덱스 그대로 사용)
+        if deadline_from:
+            where.append("a.deadline >= ?")
+            params.append(_day(deadline_from).isoformat())
+        if deadline_to:
+            where.append("a.deadline < ?")
+            params.append((_day(deadline_to) + timedelta(days=1)).isoformat())
+        if status:
+            where.append("a.status = ?")
+            params.append(status)
+
+        sql = f"SELECT a.* FROM announcements a {join}"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY {order} LIMIT ?"
+        params.append(limit)
+
+        rows = self.conn.execute(sql, params).fetchall()
+        return [self._row_to_announcement(row) for row in rows]
+
+    @staticmethod
+    def _build_match(keyword: str):
+        """검색어 → FTS5 MATCH 식 + LIKE 패턴 목록"""
+        phrases = []
+        likes = []
+        for token in tokenize(keyword):
+            if len(token) == 1:
+                likes.append(f"%{token}%")
+                continue
+            grams = to_bigrams(token)
+            # 어절의 바이그램을 연속 구문으로 찾아야 부분 문자열 검색과 같아짐
+            phrases.append('"' + " ".join(grams) + '"')
+        return " AND ".join(phrases), likes
+
+    @staticmethod
+    def _row_to_announcement(row: sqlite3.Row) -> Announcement:
+        return Announcement(
+            id=row["id"],
+            source=row["source"],
+            title=row["title"],
+            url=row["url"],
+            organization=row["organization"],
+            deadline=_from_iso(row["deadline"]),
+            status=row["status"],
+            prize=row["prize"],
+            scraped_at=_from_iso(row["scraped_at"]),
+        )
@@ -0,0 +1,11 @@
+"""
+쓰기 가능한 데이터 폴더
+배포 패키지 폴더(data/)는 Azure Functions에서 읽기 전용이거나 인스턴스마다 따로라서
+RNDO_DATA_DIR로 쓰기 가능한 위치를 지정 (공고 이력 DB, 원본 보관소, 작업 큐, 백필 진행 상황, 경로 캐시, 스크린샷)
+지정하지 않으면 프로젝트의 data/
+"""
+import os
+from pathlib import Path
+
+
+DATA_DIR = Path(os.environ.get("RNDO_DATA_DIR") or Path(__file__).parent.parent.parent / "data")
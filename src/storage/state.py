@@ -0,0 +1,238 @@
+"""
+실행 사이에 유지하는 상태 저장소 (테넌트 seen 목록, 목록 행 지문)
+배포 패키지 폴더(data/)는 Azure Functions에서 읽기 전용이거나 인스턴스마다 따로라서
+스케일 아웃하면 인스턴스끼리 seen 목록을 공유하지 못해 같은 공고를 또 알림
+- local: 데이터 폴더(RNDO_DATA_DIR, 기본 data/) 아래 JSON 파일 (로컬 개발, 단일 인스턴스)
+- blob: Azure Blob Storage 컨테이너 (인스턴스 간 공유, RNDO_STATE_BACKEND=blob)
+
+실행마다 state.scope()로 따로 만든 StateStore가 실행 동안 (겹쳐 도는 실행끼리 캐시/예약한 변경을 공유하지 않음)
+- 읽기는 키별로 한 번만 백엔드에서 가져와 메모리에 캐시 (read-through)
+- 쓰기는 바로 하지 않고 병합 함수로 모았다가 flush()에서 키당 한 번만 저장
+- 저장은 읽을 때 받은 ETag가 그대로일 때만 성공 (조건부 쓰기), 그사이 다른 인스턴스가 썼으면
+  최신 내용을 다시 읽어 모아 둔 병합을 다시 적용한 뒤 재시도 → 병합 함수는 합집합처럼 여러 번 적용해도 같아야 함
+
+사용 예:
+    run_state = state.scope()
+    seen = set(run_state.read("seen_announcements.json", []))
+    run_state.update("seen_announcements.json", lambda current: sorted(set(current) | new_ids), default=[])
+    run_state.flush()
+"""
+import copy
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .paths import DATA_DIR
+from .statefile import locked, write_json_atomic
+
+# Blob 백엔드 기본 컨테이너
+DEFAULT_CONTAINER = "rndo-state"
+
+
+class StateConflict(Exception):
+    """조건부 쓰기 실패 (읽은 뒤 다른 실행이 먼저 씀)"""
+
+
+class StateBackend:
+    """키 → JSON 값 저장소 (ETag 조건부 쓰기)"""
+
+    def get(self, key: str) -> Tuple[Any, Optional[str]]:
+        """(값, ETag) 반환, 없으면 (None, None)"""
+        raise NotImplementedError
+
+    def put(self, key: str, value: Any, etag: Optional[str]) -> str:
+        """etag가 현재 ETag와 같을 때만 저장 (None이면 키가 없을 때만)
+
+        Returns:
+            새 ETag
+
+        Raises:
+            StateConflict: 그사이 다른 실행이 저장함
+        """
+        raise NotImplementedError
+
+
+def _dumps(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+
+class LocalStateBackend(StateBackend):
+    """데이터 폴더 아래 JSON 파일 (ETag는 내용 해시, 같은 호스트 안에서는 파일 잠금으로 직렬화)"""
+
+    def __init__(self, root: Path = DATA_DIR):
+        self.root = Path(root)
+
+    def _path(self, key: str) -> Path:
+        return self.root / key
+
+    @staticmethod
+    def _etag(data: bytes) -> str:
+        return hashlib.sha1(data).hexdigest()
+
+    def get(self, key: str) -> Tuple[Any, Optional[str]]:
+        path = self._path(key)
+        if not path.exists():
+            return None, None
+        data = path.read_bytes()
+        return json.loads(data.decode("utf-8")), self._etag(data)
+
+    def put(self, key: str, value: Any, etag: Optional[str]) -> str:
+        path = self._path(key)
+        with locked(path):
+            current = self._etag(path.read_bytes()) if path.exists() else None
+            if current != etag:
+                raise StateConflict(key)
+            write_json_atomic(path, value, ensure_ascii=False)
+            return self._etag(path.read_bytes())
+
+
+class BlobStateBackend(StateBackend):
+    """Azure Blob Storage (키 = Blob 이름)
+
+    Args:
+        connection_string: 스토리지 연결 문자열 (Azurite 포함)
+        container: 컨테이너 이름 (없으면 처음 쓸 때 생성)
+    """
+
+    def __init__(self, connection_string: str, container: str = DEFAULT_CONTAINER):
+        try:
+            from azure.storage.blob import BlobServiceClient
+        except ImportError as e:
+            raise RuntimeError("blob 상태 저장소를 쓰려면 azure-storage-blob 패키지가 필요합니다.") from e
+        self.container = BlobServiceClient.from_connection_string(connection_string).get_container_client(container)
+        self._container_ready = False
+
+    def get(self, key: str) -> Tuple[Any, Optional[str]]:
+        from azure.core.exceptions import ResourceNotFoundError
+
+        try:
+            downloader = self.container.download_blob(key)
+        except ResourceNotFoundError:
+            return None, None
+        return json.loads(downloader.readall().decode("utf-8")), downloader.properties.etag
+
+    def put(self, key: str, value: Any, etag: Optional[str]) -> str:
+        from azure.core import MatchConditions
+        from azure.core.exceptions import ResourceExistsError, ResourceModifiedError
+
+        self._ensure_container()
+        try:
+            if etag is None:
+                result = self.container.upload_blob(key, _dumps(value), overwrite=False)
+            else:
+                result = self.container.upload_blob(
+                    key, _dumps(value), overwrite=True, etag=etag, match_condition=MatchConditions.IfNotModified
+                )
+        except (ResourceExistsError, ResourceModifiedError) as e:
+            raise StateConflict(key) from e
+        return result["etag"]
+
+    def _ensure_container(self):
+        if self._container_ready:
+            return
+        from azure.core.exceptions import ResourceExistsError
+
+        try:
+            self.container.create_container()
+        except ResourceExistsError:
+            pass
+        self._container_ready = True
+
+
+class StateStore:
+    """실행 동안의 상태 캐시 + 모아서 쓰기
+
+    Args:
+        backend: 실제 저장소
+        max_attempts: 조건부 쓰기 충돌 시 최대 시도 횟수
+    """
+
+    def __init__(self, backend: StateBackend, max_attempts: int = 5):
+        self.backend = backend
+        self.max_attempts = max_attempts
+        self._cache: Dict[str, Tuple[Any, Optional[str]]] = {}
+        self._pending: Dict[str, List[Tuple[Callable[[Any], Any], Any]]] = {}
+
+    @classmethod
+    def from_env(cls) -> "StateStore":
+        """RNDO_STATE_BACKEND=local(기본) | blob
+
+        blob: RNDO_STATE_CONNECTION (없으면 AzureWebJobsStorage), RNDO_STATE_CONTAINER
+        """
+        kind = os.environ.get("RNDO_STATE_BACKEND", "local")
+        if kind == "blob":
+            connection = os.environ.get("RNDO_STATE_CONNECTION") or os.environ["AzureWebJobsStorage"]
+            backend = BlobStateBackend(connection, os.environ.get("RNDO_STATE_CONTAINER", DEFAULT_CONTAINER))
+        elif kind == "local":
+            backend = LocalStateBackend()
+        else:
+            raise ValueError(f"알 수 없는 상태 저장소: {kind}")
+        return cls(backend)
+
+    def scope(self) -> "StateStore":
+        """같은 백엔드를 쓰는 실행별 저장소 (캐시와 예약한 변경은 따로)"""
+        return StateStore(self.backend, self.max_attempts)
+
+    def _load(self, key: str) -> Tuple[Any, Optional[str]]:
+        if key not in self._cache:
+            self._cache[key] = self.backend.get(key)
+        return self._cache[key]
+
+    @staticmethod
+    def _apply(value: Any, merges: List[Tuple[Callable[[Any], Any], Any]]) -> Any:
+        for merge, default in merges:
+            value = merge(copy.deepcopy(default) if value is None else value)
+        return value
+
+    def read(self, key: str, default: Any = None) -> Any:
+        """현재 값 (이번 실행에서 아직 안 쓴 변경 포함)"""
+        value, _ = self._load(key)
+        merges = self._pending.get(key)
+        if merges:
+            value = self._apply(copy.deepcopy(value), merges)
+        return default if value is None else value
+
+    def update(self, key: str, merge: Callable[[Any], Any], default: Any = None):
+        """변경 예약 (flush에서 저장)
+
+        Args:
+            merge: 현재 값을 받아 새 값을 반환 (충돌 시 최신 값에 다시 적용됨)
+            default: 키가 없을 때 merge에 넘길 값
+        """
+        self._pending.setdefault(key, []).append((merge, default))
+
+    def flush(self, keys: Iterable[str] = None) -> int:
+        """예약한 변경 저장 (키당 한 번 쓰기)
+
+        Returns:
+            저장한 키 수
+
+        Raises:
+            StateConflict: max_attempts번 모두 다른 실행과 충돌
+            (충돌이든 네트워크 오류든 저장하지 못한 변경은 다시 예약해 두므로 다음 flush에서 재시도)
+        """
+        keys = list(self._pending) if keys is None else [k for k in keys if k in self._pending]
+        for key in keys:
+            merges = self._pending.pop(key)
+            try:
+                for attempt in range(self.max_attempts):
+                    value, etag = self._load(key)
+                    new = self._apply(copy.deepcopy(value), merges)
+                    try:
+                        self._cache[key] = (new, self.backend.put(key, new, etag))
+                        break
+                    except StateConflict:
+                        print(f"[상태] {key} 다른 실행이 먼저 저장함, 다시 읽어 병합 ({attempt + 1}/{self.max_attempts})")
+                        self._cache.pop(key, None)
+                else:
+                    raise StateConflict(key)
+            except BaseException:
+                self._pending[key] = merges + self._pending.get(key, [])
+                raise
+        return len(keys)
+
+
+# 프로세스 전체가 공유하는 상태 저장소 (백엔드 설정용, 실행마다 scope()로 나눠 씀)
+state = StateStore.from_env()
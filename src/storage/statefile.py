@@ -0,0 +1,47 @@
+"""
+로컬 JSON 상태 파일 잠금/원자적 쓰기 (상태 저장소 local 백엔드용)
+타이머 실행과 수동 실행이 겹칠 수 있으므로
+- 확인하고-쓰는 동안 옆 잠금 파일(<파일>.lock)에 배타 잠금
+- 임시 파일에 끝까지 쓰고 fsync 후 교체 (쓰는 도중 중단돼도 이전 내용 유지, 읽는 쪽은 반쯤 쓴 파일을 보지 않음)
+"""
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+try:
+    import fcntl
+except ImportError:  # Windows 로컬 개발 환경 (Functions 호스트는 Linux)
+    fcntl = None
+
+
+@contextmanager
+def locked(path: Path):
+    """path 전용 잠금 파일에 배타 잠금 (같은 호스트의 다른 프로세스/실행과 직렬화)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path.with_name(path.name + ".lock"), "a") as lock:
+        if fcntl:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+
+def write_json_atomic(path: Path, data: Any, **dump_kwargs):
+    """같은 폴더의 임시 파일에 쓰고 교체"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=path.name + ".", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, **dump_kwargs)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
@@ -0,0 +1,132 @@
+"""
+멀티 테넌트 설정
+한 번 수집한 공고를 여러 팀(테넌트)에 나눠 보냄
+테넌트마다 Webhook, 이미 알린 공고 목록, 관련도 프로필, 키워드 구독, 출처 필터를 따로 가짐
+"""
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Set
+
+from src.filters import RelevanceProfile, Watchlist
+from src.storage.paths import DATA_DIR
+from src.storage.state import StateStore
+
+
+ROOT = Path(__file__).parent.parent
+
+# 테넌트 설정 위치 (RNDO_TENANTS 환경변수로 변경 가능)
+DEFAULT_TENANTS = ROOT / "config" / "tenants.json"
+
+# 테넌트별 상태 키 접두사
+TENANTS_PREFIX = "tenants"
+
+
+@dataclass
+class Tenant:
+    """테넌트 (알림 받는 팀 하나)"""
+    name: str
+    webhook_url: str
+    seen_key: str  # 상태 저장소 키 (local이면 data/ 기준 경로)
+    profile: Optional[RelevanceProfile] = None
+    watchlist: Optional[Watchlist] = None
+    sources: Optional[List[str]] = None  # None이면 모든 출처
+    primary: bool = False  # 리마인더 발송 대상
+
+    def load_seen(self, state: StateStore) -> Set[str]:
+        """이미 알린 공고 ID 목록 로드 (실행 동안 캐시)"""
+        return set(state.read(self.seen_key, []))
+
+    def save_seen(self, state: StateStore, seen_ids: Set[str]) -> Set[str]:
+        """알린 공고 ID 목록 저장 예약 (flush_seen 또는 실행 끝에 한 번에 저장)
+
+        겹쳐 도는 다른 실행/인스턴스가 그사이 저장한 ID와 합쳐서 저장
+
+        Returns:
+            합친 ID 목록
+        """
+        seen_ids = set(seen_ids)
+        state.update(self.seen_key, lambda current: sorted(set(current) | seen_ids), default=[])
+        return self.load_seen(state)
+
+    def flush_seen(self, state: StateStore):
+        state.flush([self.seen_key])
+
+    def accepts(self, source: str) -> bool:
+        return self.sources is None or source in self.sources
+
+
+def _resolve(path: Optional[str]) -> Optional[Path]:
+    if not path:
+        return None
+    path = Path(path)
+    return path if path.is_absolute() else ROOT / path
+
+
+def _seen_key(path: Optional[str]) -> Optional[str]:
+    """설정의 seen_file(프로젝트 기준 경로) → 상태 저장소 키 (data/ 밖 경로는 그대로, local 전용)"""
+    path = _resolve(path)
+    if path is None:
+        return None
+    try:
+        return path.relative_to(DATA_DIR).as_posix()
+    except ValueError:
+        return str(path)
+
+
+def load_tenants(default_webhook: Optional[str], default_seen_key: str) -> List[Tenant]:
+    """테넌트 목록 로드
+
+    설정 파일이 없으면 TEAMS_WEBHOOK_URL + 기존 seen 목록을 쓰는 단일 테넌트
+
+    설정 예시 (config/tenants.json):
+        {"tenants": [{"name": "ai-team", "webhook_url": "${TEAMS_WEBHOOK_AI}",
+                      "profile": "config/profiles/ai.json",
+                      "subscriptions": "config/subscriptions/ai.json",
+                      "sources": ["ntis", "bizinfo"]}]}
+    """
+    path = Path(os.environ.get("RNDO_TENANTS", DEFAULT_TENANTS))
+    if not path.exists():
+        if not default_webhook:
+            return []
+        return [
+            Tenant(
+                name="default",
+                webhook_url=default_webhook,
+                seen_key=default_seen_key,
+                profile=RelevanceProfile.load(),
+                watchlist=Watchlist.load(),
+                primary=True,
+            )
+        ]
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    tenants = []
+    for item in data.get("tenants", []):
+        name = item["name"]
+        profile_path = _resolve(item.get("profile"))
+        subscriptions_path = _resolve(item.get("subscriptions"))
+        tenants.append(
+            Tenant(
+                name=name,
+                webhook_url=os.path.expandvars(item["webhook_url"]),
+                seen_key=_seen_key(item.get("seen_file")) or f"{TENANTS_PREFIX}/{name}/seen_announcements.json",
+                profile=RelevanceProfile.load(profile_path) if profile_path else None,
+                watchlist=Watchlist.load(subscriptions_path) if subscriptions_path else None,
+                sources=item.get("sources"),
+                primary=bool(item.get("primary", False)),
+            )
+        )
+
+    # 대표 테넌트는 하나만 (primary: true가 없으면 첫 번째, 여러 개면 첫 번째 것만)
+    primaries = [t for t in tenants if t.primary]
+    if len(primaries) > 1:
+        print("대표 테넌트가 여러 개라 첫 번째만 사용: " + ", ".join(t.name for t in primaries))
+    for t in tenants:
+        t.primary = False
+    if tenants:
+        (primaries[0] if primaries else tenants[0]).primary = True
+    return tenants
@@ -0,0 +1,28 @@
+"""
+텍스트 처리 유틸 (한국어 바이그램 등)
+"""
+import re
+from typing import List, Optional
+
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """소문자 어절 단위 분리"""
+    return _TOKEN_RE.findall((text or "").lower())
+
+
+def to_bigrams(text: Optional[str]) -> List[str]:
+    """한국어 검색용 바이그램 분리
+
+    공백 단위 어절마다 2글자씩 겹쳐 자름 (예: "의료AI" → 의료, 료a, ai)
+    한 글자 어절은 그대로 둠
+    """
+    grams = []
+    for token in tokenize(text):
+        if len(token) == 1:
+            grams.append(token)
+        else:
+            grams.extend(token[i:i + 2] for i in range(len(token) - 1))
+    return grams
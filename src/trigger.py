@@ -0,0 +1,84 @@
+"""
+수동 실행 합치기
+여러 사람이 거의 동시에 수동 실행을 누르면 브라우저 묶음이 여러 벌 뜨므로
+- 실행 중에 들어온 요청은 새로 실행하지 않고 진행 중인 실행 결과를 같이 기다림 (singleflight)
+- 마지막 실행이 끝난 지 RNDO_TRIGGER_FRESH_SECONDS 안이면 다시 수집하지 않고 그 결과 요약을 돌려줌
+- force면 최근 결과를 무시하고 새로 실행 (진행 중인 실행이 있으면 그 결과가 가장 최신이므로 합류)
+같은 워커 프로세스 안에서만 합쳐짐
+- 같은 호스트의 다른 프로세스와 겹친 실행은 알림 선점(storage/claims.py, 공고 이력 SQLite)이 중복 발송을 막음
+- 다른 인스턴스와 겹친 실행은 선점 DB를 공유하지 않으므로 막지 못함
+  (공유 상태 저장소의 seen 목록은 먼저 끝난 실행이 저장한 뒤에 시작한 실행부터 반영됨)
+"""
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Awaitable, Callable, Optional
+
+
+@dataclass
+class TriggerResult:
+    """수동 실행 결과"""
+    summary: str
+    finished_at: datetime
+    mode: str  # "run": 새로 실행, "joined": 진행 중인 실행에 합류, "cached": 최근 결과 재사용
+
+    @property
+    def message(self) -> str:
+        label = {
+            "run": "rndo 실행 완료",
+            "joined": "진행 중이던 실행에 합류, 완료",
+            "cached": f"최근 실행 결과 ({self.finished_at:%H:%M:%S} 완료, force로 다시 실행 가능)",
+        }[self.mode]
+        return f"{label}\n{self.summary}" if self.summary else label
+
+
+class TriggerCoalescer:
+    """수동 실행 합치기
+
+    Args:
+        runner: 실제 실행 함수 (요약 문자열을 주는 결과 또는 None 반환)
+        fresh_seconds: 이 시간 안의 결과는 다시 수집하지 않고 재사용 (0이면 재사용 안 함)
+    """
+
+    def __init__(self, runner: Callable[[], Awaitable[Optional[object]]], fresh_seconds: float = 300.0):
+        self.runner = runner
+        self.fresh_seconds = fresh_seconds
+        self._inflight: Optional[asyncio.Task] = None
+        self._last: Optional[TriggerResult] = None
+        self._last_at = 0.0  # time.monotonic 기준 마지막 성공 시각
+
+    @classmethod
+    def from_env(cls, runner: Callable[[], Awaitable[Optional[object]]]) -> "TriggerCoalescer":
+        return cls(runner, fresh_seconds=float(os.environ.get("RNDO_TRIGGER_FRESH_SECONDS", "300")))
+
+    def fresh(self) -> Optional[TriggerResult]:
+        """재사용할 수 있는 최근 결과"""
+        if self._last is None or time.monotonic() - self._last_at >= self.fresh_seconds:
+            return None
+        return self._last
+
+    async def trigger(self, force: bool = False) -> TriggerResult:
+        """실행 요청 (실패하면 같이 기다리던 요청 모두에 같은 예외)"""
+        if self._inflight is not None:
+            result = await asyncio.shield(self._inflight)
+            return TriggerResult(result.summary, result.finished_at, "joined")
+
+        if not force:
+            cached = self.fresh()
+            if cached:
+                return TriggerResult(cached.summary, cached.finished_at, "cached")
+
+        # 요청한 쪽 연결이 끊겨도 같이 기다리는 요청이 있으므로 실행 자체는 취소하지 않음
+        self._inflight = asyncio.ensure_future(self._run())
+        return await asyncio.shield(self._inflight)
+
+    async def _run(self) -> TriggerResult:
+        try:
+            stats = await self.runner()
+            result = TriggerResult(stats.summary() if stats else "", datetime.now(), "run")
+            self._last, self._last_at = result, time.monotonic()
+            return result
+        finally:
+            self._inflight = None
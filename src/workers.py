@@ -0,0 +1,154 @@
+"""
+코디네이터/워커 모드
+코디네이터가 출처별(또는 백필 페이지 범위별) 작업을 작업 큐에 넣고, 워커 여러 개가 나눠 수집
+- 수집 작업 {"kind": "scrape", "source": "ntis"}: 그 출처만 run_observer로 수집 → 저장/알림
+- 백필 작업 {"kind": "backfill", "source": "ntis", "pages": [11, 20]}: 페이지 범위를 공고 이력에 저장
+실패하거나 워커가 죽으면 ack하지 않으므로 임대가 만료된 뒤 다른 워커가 다시 처리
+알 수 없는 작업이나 이 워커에서 켜지 않은 출처(RNDO_SOURCES)의 작업은 처리하지 않고 포기(dead letter)
+임대가 만료돼 같은 작업이 겹쳐 처리되면 같은 호스트의 워커끼리는 알림 선점이 중복 발송을 막지만,
+다른 머신의 워커와는 선점 DB를 공유하지 않아 중복 발송될 수 있으므로 임대 시간은 작업 시간보다 넉넉하게
+
+사용법:
+    python -m src.workers coordinate [--all] [--backfill ntis --pages 300 --shard-size 10]
+    python -m src.workers work [--max-jobs 5] [--wait]
+"""
+import argparse
+import asyncio
+from typing import Optional
+
+from src.backfill import BACKFILL_SOURCES, backfill_range
+from src.main import enabled_scrapers, run_observer
+from src.workqueue import LEASE_SECONDS, Job, WorkQueue
+
+
+# 큐가 비었을 때 다시 확인하는 간격 (--wait)
+POLL_SECONDS = 10
+
+
+def enqueue_backfill(queue: WorkQueue, source: str, pages: int, shard_size: int = 10) -> int:
+    """게시판 1~pages 페이지를 shard_size씩 나눠 백필 작업 추가
+
+    Returns:
+        추가한 작업 수
+    """
+    added = 0
+    for start in range(1, pages + 1, shard_size):
+        end = min(start + shard_size - 1, pages)
+        added += queue.enqueue(
+            {"kind": "backfill", "source": source, "pages": [start, end]},
+            key=f"backfill:{source}:{start}-{end}",
+        )
+    print(f"[코디네이터] {source} 백필 작업 {added}개 추가")
+    return added
+
+
+class InvalidJob(Exception):
+    """이 워커가 처리할 수 없는 작업 (다시 시도해도 소용없으므로 포기)"""
+
+
+async def process(job: Job) -> bool:
+    """작업 하나 처리
+
+    Returns:
+        True면 ack (끝난 작업), False면 임대 만료 후 다시 시도
+
+    Raises:
+        InvalidJob: 알 수 없는 작업이거나 켜지 않은 출처
+    """
+    kind = job.payload.get("kind")
+    source = job.payload.get("source")
+    if kind == "scrape":
+        if source not in enabled_scrapers():
+            raise InvalidJob(f"RNDO_SOURCES에 없는 출처: {source}")
+        stats = await run_observer(sources=[source])
+        # None이면 테넌트 설정이 없어 수집하지 않은 것 (설정을 고친 뒤 다시 처리하도록 ack하지 않음)
+        return stats is not None and source not in stats.errors
+    if kind == "backfill":
+        if source not in BACKFILL_SOURCES:
+            raise InvalidJob(f"백필할 수 없는 출처: {source}")
+        try:
+            start, end = (int(page) for page in job.payload["pages"])
+        except (KeyError, TypeError, ValueError) as e:
+            raise InvalidJob(f"잘못된 페이지 범위: {job.payload.get('pages')}") from e
+        shard = await backfill_range(source, start, end)
+        return shard.done
+    raise InvalidJob(f"알 수 없는 작업: {kind}")
+
+
+async def work(
+    queue: WorkQueue,
+    max_jobs: Optional[int] = None,
+    wait: bool = False,
+    lease_seconds: float = LEASE_SECONDS,
+) -> int:
+    """작업을 임대해 처리하고 ack
+
+    Args:
+        max_jobs: 이만큼 처리하면 종료 (None이면 제한 없음)
+        wait: 큐가 비어도 종료하지 않고 기다림
+        lease_seconds: 작업 하나의 임대 시간 (넘기면 다른 워커가 다시 가져감)
+
+    Returns:
+        처리한(ack한) 작업 수
+    """
+    done = 0
+    handled = 0
+    while max_jobs is None or handled < max_jobs:
+        job = queue.lease(lease_seconds)
+        if job is None:
+            if not wait:
+                break
+            await asyncio.sleep(POLL_SECONDS)
+            continue
+
+        handled += 1
+        print(f"[워커] 작업 {job.id} ({job.attempts}번째 시도): {job.payload}")
+        try:
+            finished = await process(job)
+        except InvalidJob as e:
+            print(f"[워커] 작업 {job.id} 포기 ({e}): {job.payload}")
+            if not queue.dead_letter(job):
+                print(f"[워커] 작업 {job.id} 임대가 먼저 만료돼 다른 워커가 가져감")
+            continue
+        except Exception as e:
+            print(f"[워커] 작업 {job.id} 실패: {e}")
+            finished = False
+
+        if not finished:
+            print(f"[워커] 작업 {job.id} 미완료, 임대 만료 후 다시 시도")
+        elif queue.ack(job):
+            done += 1
+        else:
+            print(f"[워커] 작업 {job.id} 임대가 먼저 만료돼 다른 워커가 가져감")
+    print(f"[워커] 작업 {handled}개 처리, 완료 {done}개")
+    return done
+
+
+def main():
+    parser = argparse.ArgumentParser(description="작업 큐 코디네이터/워커")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    coordinate = commands.add_parser("coordinate", help="작업 추가")
+    coordinate.add_argument("--all", action="store_true", help="게시 빈도와 관계없이 모든 출처 작업 추가")
+    coordinate.add_argument("--backfill", choices=sorted(BACKFILL_SOURCES), help="수집 대신 백필 작업 추가")
+    coordinate.add_argument("--pages", type=int, default=300, help="백필할 최대 페이지 수")
+    coordinate.add_argument("--shard-size", type=int, default=10, help="백필 작업당 페이지 수")
+
+    worker = commands.add_parser("work", help="작업 처리")
+    worker.add_argument("--max-jobs", type=int, help="이만큼 처리하면 종료")
+    worker.add_argument("--wait", action="store_true", help="큐가 비어도 종료하지 않고 기다림")
+    worker.add_argument("--lease-seconds", type=float, default=LEASE_SECONDS, help="작업 임대 시간")
+    args = parser.parse_args()
+
+    queue = WorkQueue.from_env()
+    if args.command == "coordinate":
+        if args.backfill:
+            enqueue_backfill(queue, args.backfill, args.pages, args.shard_size)
+        else:
+            asyncio.run(run_observer(scheduled=not args.all, queue=queue))
+    else:
+        asyncio.run(work(queue, args.max_jobs, args.wait, args.lease_seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,321 @@
+"""
+작업 큐 (코디네이터가 출처/페이지 범위별 작업을 넣고, 여러 워커가 나눠 처리)
+한 Functions 실행 안에서 모든 출처를 돌리면 한 머신의 Chromium 수가 한계라서
+- sqlite: <데이터 폴더>/queue.db (로컬 개발, 같은 호스트의 워커 여러 개)
+- azure: Azure Storage Queue (여러 머신, RNDO_QUEUE_BACKEND=azure, 로컬에서는 Azurite)
+
+워커는 작업을 임대(lease)해서 처리하고 끝나면 ack로 지움
+임대 시간 안에 ack하지 않으면(워커가 죽었거나 실패) 다시 다른 워커가 가져가고,
+MAX_ATTEMPTS번 넘게 실패했거나 dead_letter()로 포기한 작업은 더 이상 내주지 않음
+(sqlite는 그대로 남기고 azure는 <큐>-poison으로 옮김)
+같은 key 작업은 앞 작업이 ack/포기될 때까지 하나만 큐에 있음 (sqlite: UNIQUE 열, azure: <큐>-keys 컨테이너의 Blob)
+"""
+import json
+import os
+import sqlite3
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional
+
+from src.storage.paths import DATA_DIR
+
+
+DEFAULT_DB = DATA_DIR / "queue.db"
+
+DEFAULT_QUEUE = "rndo-jobs"
+
+# 작업 하나의 기본 임대 시간 (실행 시간 예산보다 길게)
+LEASE_SECONDS = 600
+
+# 이 횟수만큼 임대했는데도 ack되지 않은 작업은 포기
+MAX_ATTEMPTS = 3
+
+# azure 메시지 보관 기간 (지나면 큐에서 사라지므로 같은 key 표시도 버려진 것으로 봄)
+JOB_TTL = timedelta(days=1)
+
+
+@dataclass
+class Job:
+    """임대한 작업"""
+    id: str
+    payload: dict
+    attempts: int  # 이번 임대 포함 몇 번째 시도인지
+    receipt: str  # ack에 필요한 임대 확인값 (임대가 만료돼 다른 워커가 가져가면 무효)
+    key: Optional[str] = None  # 같은 작업 합치기용 key
+
+
+class WorkQueue:
+    """작업 큐 인터페이스"""
+
+    def enqueue(self, payload: dict, key: Optional[str] = None) -> bool:
+        """작업 추가
+
+        Args:
+            key: 같은 key의 작업이 아직 큐에 있으면 추가하지 않음 (지원하는 백엔드만)
+
+        Returns:
+            추가 여부
+        """
+        raise NotImplementedError
+
+    def lease(self, seconds: float = LEASE_SECONDS) -> Optional[Job]:
+        """처리할 작업 하나 임대 (없으면 None)"""
+        raise NotImplementedError
+
+    def ack(self, job: Job) -> bool:
+        """처리 완료 → 큐에서 삭제
+
+        Returns:
+            False면 임대가 이미 만료돼 다른 워커가 가져감
+        """
+        raise NotImplementedError
+
+    def dead_letter(self, job: Job) -> bool:
+        """다시 해도 소용없는 작업 → 포기 (다시 내주지 않고 같은 key 작업은 다시 넣을 수 있음)
+
+        Returns:
+            False면 임대가 이미 만료돼 다른 워커가 가져감
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def from_env(cls) -> "WorkQueue":
+        """RNDO_QUEUE_BACKEND=sqlite(기본) | azure
+
+        azure: RNDO_QUEUE_CONNECTION (없으면 AzureWebJobsStorage), RNDO_QUEUE_NAME
+        """
+        kind = os.environ.get("RNDO_QUEUE_BACKEND", "sqlite")
+        if kind == "azure":
+            connection = os.environ.get("RNDO_QUEUE_CONNECTION") or os.environ["AzureWebJobsStorage"]
+            return AzureWorkQueue(connection, os.environ.get("RNDO_QUEUE_NAME", DEFAULT_QUEUE))
+        if kind == "sqlite":
+            return SqliteWorkQueue()
+        raise ValueError(f"알 수 없는 작업 큐: {kind}")
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    key TEXT UNIQUE,
+    payload TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    leased_until REAL NOT NULL DEFAULT 0,
+    receipt TEXT,
+    enqueued_at TEXT NOT NULL
+);
+"""
+
+
+class SqliteWorkQueue(WorkQueue):
+    """SQLite 작업 큐 (임대 만료 시각은 프로세스 간에 비교하므로 time.time 기준)"""
+
+    def __init__(self, db_path: Path = None, max_attempts: int = MAX_ATTEMPTS):
+        self.db_path = Path(db_path) if db_path else DEFAULT_DB
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_attempts = max_attempts
+        self.conn = sqlite3.connect(self.db_path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+
+    def enqueue(self, payload: dict, key: Optional[str] = None) -> bool:
+        with self.conn:
+            if key:
+                # 포기한 작업은 같은 key로 다시 넣을 수 있게 정리
+                self.conn.execute(
+                    "DELETE FROM jobs WHERE key = ? AND attempts >= ? AND leased_until <= ?",
+                    (key, self.max_attempts, time.time()),
+                )
+            cursor = self.conn.execute(
+                "INSERT OR IGNORE INTO jobs (key, payload, enqueued_at) VALUES (?, ?, ?)",
+                (key, json.dumps(payload, ensure_ascii=False), datetime.now().isoformat()),
+            )
+        return cursor.rowcount > 0
+
+    def lease(self, seconds: float = LEASE_SECONDS) -> Optional[Job]:
+        now = time.time()
+        receipt = uuid.uuid4().hex
+        with self.conn:
+            # 두 워커가 같은 작업을 고르지 않게 처음부터 쓰기 잠금
+            self.conn.execute("BEGIN IMMEDIATE")
+            row = self.conn.execute(
+                "SELECT id, payload, attempts, key FROM jobs WHERE leased_until <= ? AND attempts < ? ORDER BY id LIMIT 1",
+                (now, self.max_attempts),
+            ).fetchone()
+            if row is None:
+                return None
+            self.conn.execute(
+                "UPDATE jobs SET attempts = attempts + 1, leased_until = ?, receipt = ? WHERE id = ?",
+                (now + seconds, receipt, row[0]),
+            )
+        return Job(id=str(row[0]), payload=json.loads(row[1]), attempts=row[2] + 1, receipt=receipt, key=row[3])
+
+    def ack(self, job: Job) -> bool:
+        with self.conn:
+            cursor = self.conn.execute("DELETE FROM jobs WHERE id = ? AND receipt = ?", (int(job.id), job.receipt))
+        return cursor.rowcount > 0
+
+    def dead_letter(self, job: Job) -> bool:
+        with self.conn:
+            cursor = self.conn.execute(
+                "UPDATE jobs SET attempts = MAX(attempts, ?), leased_until = 0 WHERE id = ? AND receipt = ?",
+                (self.max_attempts, int(job.id), job.receipt),
+            )
+        return cursor.rowcount > 0
+
+    def counts(self) -> dict:
+        """대기/임대 중/포기 작업 수"""
+        now = time.time()
+        row = self.conn.execute(
+            """
+            SELECT
+                SUM(attempts < ? AND leased_until <= ?),
+                SUM(leased_until > ?),
+                SUM(attempts >= ? AND leased_until <= ?)
+            FROM jobs
+            """,
+            (self.max_attempts, now, now, self.max_attempts, now),
+        ).fetchone()
+        return {"ready": row[0] or 0, "leased": row[1] or 0, "dead": row[2] or 0}
+
+    def close(self):
+        self.conn.close()
+
+
+class AzureWorkQueue(WorkQueue):
+    """Azure Storage Queue (임대 = 메시지 보이지 않는 시간, ack = 메시지 삭제)
+
+    메시지 본문은 {"key": key, "payload": 작업}
+    같은 key 작업 합치기: <큐>-keys 컨테이너에 key 이름의 Blob을 없을 때만 만들어 표시하고 ack/포기할 때 지움
+    (워커가 메시지를 지우고 표시를 지우기 전에 죽어 남은 표시는 JOB_TTL이 지나면 다시 씀)
+    """
+
+    def __init__(
+        self,
+        connection_string: str,
+        name: str = DEFAULT_QUEUE,
+        max_attempts: int = MAX_ATTEMPTS,
+        ttl: timedelta = JOB_TTL,
+    ):
+        try:
+            from azure.storage.blob import BlobServiceClient
+            from azure.storage.queue import QueueClient
+        except ImportError as e:
+            raise RuntimeError("azure 작업 큐를 쓰려면 azure-storage-queue, azure-storage-blob 패키지가 필요합니다.") from e
+        self.client = QueueClient.from_connection_string(connection_string, name)
+        self.poison = QueueClient.from_connection_string(connection_string, f"{name}-poison")
+        self.keys = BlobServiceClient.from_connection_string(connection_string).get_container_client(f"{name}-keys")
+        self.max_attempts = max_attempts
+        self.ttl = ttl
+        self._queues_ready = False
+
+    def _ensure_queues(self):
+        if self._queues_ready:
+            return
+        from azure.core.exceptions import ResourceExistsError
+
+        for client in (self.client, self.poison):
+            try:
+                client.create_queue()
+            except ResourceExistsError:
+                pass
+        try:
+            self.keys.create_container()
+        except ResourceExistsError:
+            pass
+        self._queues_ready = True
+
+    def _mark(self, key: str) -> bool:
+        """key 표시 만들기 (이미 있고 JOB_TTL 안이면 False)"""
+        from azure.core import MatchConditions
+        from azure.core.exceptions import ResourceExistsError, ResourceModifiedError, ResourceNotFoundError
+
+        try:
+            self.keys.upload_blob(key, b"", overwrite=False)
+            return True
+        except ResourceExistsError:
+            pass
+        try:
+            properties = self.keys.get_blob_client(key).get_blob_properties()
+        except ResourceNotFoundError:  # 그사이 ack됨
+            return self._mark(key)
+        if datetime.now(timezone.utc) - properties.last_modified < self.ttl:
+            return False
+        # 버려진 표시: 그사이 다른 코디네이터가 먼저 다시 쓰지 않았을 때만 가져옴
+        try:
+            self.keys.upload_blob(
+                key, b"", overwrite=True, etag=properties.etag, match_condition=MatchConditions.IfNotModified
+            )
+        except (ResourceModifiedError, ResourceNotFoundError):
+            return False
+        return True
+
+    def _unmark(self, key: Optional[str]):
+        if not key:
+            return
+        from azure.core.exceptions import ResourceNotFoundError
+
+        try:
+            self.keys.delete_blob(key)
+        except ResourceNotFoundError:
+            pass
+
+    @staticmethod
+    def _dumps(payload: dict, key: Optional[str]) -> str:
+        return json.dumps({"key": key, "payload": payload}, ensure_ascii=False)
+
+    def enqueue(self, payload: dict, key: Optional[str] = None) -> bool:
+        self._ensure_queues()
+        if key and not self._mark(key):
+            return False
+        try:
+            self.client.send_message(self._dumps(payload, key), time_to_live=int(self.ttl.total_seconds()))
+        except BaseException:
+            self._unmark(key)
+            raise
+        return True
+
+    def lease(self, seconds: float = LEASE_SECONDS) -> Optional[Job]:
+        self._ensure_queues()
+        while True:
+            message = self.client.receive_message(visibility_timeout=int(seconds))
+            if message is None:
+                return None
+            body = json.loads(message.content)
+            if message.dequeue_count <= self.max_attempts:
+                return Job(
+                    id=message.id,
+                    payload=body["payload"],
+                    attempts=message.dequeue_count,
+                    receipt=message.pop_receipt,
+                    key=body["key"],
+                )
+            print(f"[작업 큐] {message.dequeue_count}번 실패한 작업을 {self.poison.queue_name}로 옮김: {message.content}")
+            self.poison.send_message(message.content)
+            self.client.delete_message(message.id, message.pop_receipt)
+            self._unmark(body["key"])
+
+    def ack(self, job: Job) -> bool:
+        from azure.core.exceptions import HttpResponseError
+
+        try:
+            self.client.delete_message(job.id, job.receipt)
+        except HttpResponseError:  # 메시지가 없거나 pop receipt가 바뀜 (다른 워커가 다시 임대)
+            return False
+        self._unmark(job.key)
+        return True
+
+    def dead_letter(self, job: Job) -> bool:
+        from azure.core.exceptions import HttpResponseError
+
+        self._ensure_queues()
+        # 옮기기 전에 지웠다가 실패하면 작업이 사라지므로 poison 큐에 먼저 넣음
+        self.poison.send_message(self._dumps(job.payload, job.key))
+        try:
+            self.client.delete_message(job.id, job.receipt)
+        except HttpResponseError:
+            return False
+        self._unmark(job.key)
+        return True
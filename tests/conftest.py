@@ -0,0 +1,51 @@
+import os
+import uuid
+
+import pytest
+
+
+# Azurite(로컬 Azure Storage 에뮬레이터) 연결 문자열, 없으면 기본 개발 계정
+AZURITE_CONNECTION = os.environ.get("AZURITE_CONNECTION_STRING", "UseDevelopmentStorage=true")
+
+# 1이면 Azurite에 연결할 수 없을 때 건너뛰지 않고 실패 (CI에서 Azurite 테스트가 조용히 빠지지 않게)
+REQUIRE_AZURITE = os.environ.get("RNDO_REQUIRE_AZURITE") == "1"
+
+
+def _reachable(client) -> bool:
+    try:
+        client.get_service_properties(timeout=2)
+    except Exception:
+        return False
+    return True
+
+
+def _unavailable(reason: str):
+    if REQUIRE_AZURITE:
+        pytest.fail(reason)
+    pytest.skip(reason)
+
+
+@pytest.fixture
+def azurite_blob():
+    """Azurite Blob 연결 문자열 (에뮬레이터가 없으면 건너뜀, RNDO_REQUIRE_AZURITE=1이면 실패)"""
+    from azure.storage.blob import BlobServiceClient
+
+    if not _reachable(BlobServiceClient.from_connection_string(AZURITE_CONNECTION, retry_total=0)):
+        _unavailable("Azurite Blob에 연결할 수 없음 (azurite-blob 실행 후 다시 시도)")
+    return AZURITE_CONNECTION
+
+
+@pytest.fixture
+def azurite_queue():
+    """Azurite Queue 연결 문자열 (에뮬레이터가 없으면 건너뜀, RNDO_REQUIRE_AZURITE=1이면 실패)"""
+    from azure.storage.queue import QueueServiceClient
+
+    if not _reachable(QueueServiceClient.from_connection_string(AZURITE_CONNECTION, retry_total=0)):
+        _unavailable("Azurite Queue에 연결할 수 없음 (azurite-queue 실행 후 다시 시도)")
+    return AZURITE_CONNECTION
+
+
+@pytest.fixture
+def unique_name():
+    """테스트마다 겹치지 않는 컨테이너/큐 이름"""
+    return f"rndo-test-{uuid.uuid4().hex[:12]}"
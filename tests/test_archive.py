@@ -0,0 +1,39 @@
+from datetime import datetime, timedelta
+
+from src.storage.archive import PageArchive
+
+
+def test_round_trip_and_content_addressing(tmp_path):
+    archive = PageArchive(tmp_path, retention_days=30)
+    now = datetime(2026, 3, 10, 9, 0)
+    rows = {"rows": [{"title": "2026년 인공지능 지원사업", "period": "2026-03-01 ~ 2026-03-31"}]}
+
+    sha = archive.put("bizinfo", "https://www.bizinfo.go.kr/list", "rows", rows, now)
+    html_sha = archive.put("ntis", "https://www.ntis.go.kr/list", "list", "<html>목록</html>", now)
+    # 같은 내용은 한 번만 저장하고 인덱스만 추가
+    assert archive.put("bizinfo", "https://www.bizinfo.go.kr/list", "rows", rows, now + timedelta(hours=1)) == sha
+
+    assert archive.read_json(sha) == rows
+    assert archive.read_text(html_sha) == "<html>목록</html>"
+    assert [p.fetched_at for p in archive.pages(source="bizinfo")] == [now, now + timedelta(hours=1)]
+    assert archive.latest("bizinfo", "rows").fetched_at == now + timedelta(hours=1)
+    assert archive.stats()["pages"] == 3
+    assert archive.stats()["blobs"] == 2
+    archive.close()
+
+
+def test_prune_keeps_content_still_referenced(tmp_path):
+    archive = PageArchive(tmp_path, retention_days=30)
+    now = datetime(2026, 3, 10, 9, 0)
+    old = now - timedelta(days=40)
+
+    shared = archive.put("ntis", "https://www.ntis.go.kr/list", "list", "<html>같은 목록</html>", old)
+    archive.put("ntis", "https://www.ntis.go.kr/list", "list", "<html>같은 목록</html>", now)
+    expired = archive.put("ntis", "https://www.ntis.go.kr/list", "list", "<html>예전 목록</html>", old)
+
+    # 오래된 인덱스는 지우되 최근 인덱스가 참조하는 내용은 남김
+    assert archive.prune(now) == 1
+    assert archive.read_text(shared) == "<html>같은 목록</html>"
+    assert not (tmp_path / "objects" / expired[:2] / f"{expired}.z").exists()
+    assert [p.fetched_at for p in archive.pages()] == [now]
+    archive.close()
@@ -0,0 +1,44 @@
+from src.backfill import Checkpoint
+
+
+def test_checkpoint_resumes_from_saved_pages(tmp_path):
+    path = tmp_path / "ntis.json"
+    checkpoint = Checkpoint("ntis", pages=25, shard_size=10, path=path)
+    assert [(s.start, s.end) for s in checkpoint.shards] == [(1, 10), (11, 20), (21, 25)]
+
+    first, second, _ = checkpoint.shards
+    first.next_page, first.saved = 4, 30
+    second.next_page, second.done, second.saved = 21, True, 100
+    checkpoint.save()
+
+    resumed = Checkpoint.load("ntis", pages=25, shard_size=10, path=path)
+    assert [(s.key, s.next_page) for s in resumed.pending()] == [("1-10", 4), ("21-25", 21)]
+    assert resumed.saved == 130
+    assert not resumed.complete
+
+
+def test_checkpoint_with_different_range_starts_over(tmp_path):
+    path = tmp_path / "ntis.json"
+    checkpoint = Checkpoint("ntis", pages=20, shard_size=10, path=path)
+    checkpoint.shards[0].done = True
+    checkpoint.save()
+
+    restarted = Checkpoint.load("ntis", pages=30, shard_size=10, path=path)
+    assert [s.next_page for s in restarted.pending()] == [1, 11, 21]
+
+
+def test_mark_end_skips_shards_past_the_last_page(tmp_path):
+    path = tmp_path / "bizinfo.json"
+    checkpoint = Checkpoint("bizinfo", pages=30, shard_size=10, path=path)
+    checkpoint.mark_end(15)
+    # 더 뒤에서 빈 페이지가 나와도 이미 알게 된 끝을 늘리지 않음
+    checkpoint.mark_end(25)
+    assert checkpoint.last_page == 14
+    assert [s.key for s in checkpoint.pending()] == ["1-10", "11-20"]
+
+    checkpoint.shards[0].done = True
+    checkpoint.shards[1].next_page = 15
+    checkpoint.save()
+    resumed = Checkpoint.load("bizinfo", pages=30, shard_size=10, path=path)
+    assert resumed.last_page == 14
+    assert resumed.complete
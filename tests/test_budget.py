@@ -0,0 +1,34 @@
+import time
+
+import pytest
+
+from src.budget import RunBudget
+
+
+def _budget(elapsed=0.0):
+    # 수집에 쓸 수 있는 시간 240초에서 elapsed만큼 지난 예산
+    return RunBudget(seconds=270.0, reserve=30.0, started=time.monotonic() - elapsed)
+
+
+@pytest.mark.parametrize("waiting, slots, waves", [
+    (1, 2, 1),
+    (2, 2, 1),
+    (3, 2, 2),
+    (5, 2, 3),
+    (6, 3, 2),
+])
+def test_allocate_divides_by_waves(waiting, slots, waves):
+    assert _budget().allocate(waiting, slots) == pytest.approx(240.0 / waves, abs=0.5)
+
+
+def test_allocate_treats_zero_as_one():
+    # 마지막 출처(대기 0)나 브라우저 수 0도 나누기 오류 없이 한 번에 배분
+    assert _budget().allocate(0, 2) == pytest.approx(240.0, abs=0.5)
+    assert _budget().allocate(3, 0) == pytest.approx(80.0, abs=0.5)
+
+
+def test_allocate_uses_time_left_after_reserve():
+    # 먼저 끝난 출처가 쓴 시간만큼 뒤 출처 몫이 줄고, reserve 안으로 들어가면 0
+    assert _budget(elapsed=120.0).allocate(2, 1) == pytest.approx(60.0, abs=0.5)
+    assert _budget(elapsed=250.0).allocate(1, 1) == 0.0
+    assert _budget(elapsed=300.0).allocate(4, 2) == 0.0
@@ -0,0 +1,54 @@
+import sqlite3
+from datetime import datetime
+
+from src.models import Announcement
+from src.storage import ChangeTracker
+
+
+def _announcement(deadline, status="접수중", id="ntis_1"):
+    return Announcement(
+        id=id, source="ntis", title="2026년 스마트공장 구축 지원사업", url="https://example.com/1",
+        organization="중소벤처기업부", deadline=deadline, status=status,
+    )
+
+
+def test_first_sighting_records_without_events():
+    tracker = ChangeTracker(sqlite3.connect(":memory:"))
+    assert tracker.detect([_announcement(datetime(2026, 4, 30))]) == []
+    assert [v["version"] for v in tracker.history("ntis_1")] == [1]
+
+
+def test_deadline_extension_is_reported():
+    tracker = ChangeTracker(sqlite3.connect(":memory:"))
+    tracker.detect([_announcement(datetime(2026, 4, 30))])
+    events = tracker.detect([_announcement(datetime(2026, 5, 15))])
+    assert [(e.field, e.old, e.new) for e in events] == [("deadline", "2026-04-30", "2026-05-15")]
+
+
+def test_closed_status_is_quiet():
+    tracker = ChangeTracker(sqlite3.connect(":memory:"))
+    tracker.detect([_announcement(datetime(2026, 4, 30))])
+    assert tracker.detect([_announcement(datetime(2026, 4, 30), status="마감")]) == []
+
+
+def test_duplicate_id_in_one_batch():
+    tracker = ChangeTracker(sqlite3.connect(":memory:"))
+    tracker.detect([_announcement(datetime(2026, 4, 30))])
+
+    # 같은 공고가 두 페이지에 걸쳐 한 배치에 두 번 들어옴 (같은 내용 한 번, 바뀐 내용 한 번)
+    events = tracker.detect([
+        _announcement(datetime(2026, 5, 15)),
+        _announcement(datetime(2026, 5, 15)),
+        _announcement(datetime(2026, 5, 20)),
+    ])
+    assert [(e.field, e.old, e.new) for e in events] == [
+        ("deadline", "2026-04-30", "2026-05-15"),
+        ("deadline", "2026-05-15", "2026-05-20"),
+    ]
+    assert [v["version"] for v in tracker.history("ntis_1")] == [1, 2, 3]
+
+
+def test_duplicate_new_id_in_one_batch():
+    tracker = ChangeTracker(sqlite3.connect(":memory:"))
+    assert tracker.detect([_announcement(datetime(2026, 4, 30)), _announcement(datetime(2026, 4, 30))]) == []
+    assert [v["version"] for v in tracker.history("ntis_1")] == [1]
@@ -0,0 +1,31 @@
+from datetime import datetime, timedelta, timezone
+
+from src.models import Announcement, CompactAnnouncement, decode_jsonl, encode_jsonl
+from src.models.compact import from_epoch, to_epoch
+
+
+def _announcement():
+    return Announcement(
+        id="ntis_1", source="ntis", title="스마트공장 구축 지원", url="https://example.com/1",
+        organization="중소벤처기업부", deadline=datetime(2026, 4, 30),
+        status="접수중", scraped_at=datetime(2026, 3, 15, 9, 0, 12, 345678),
+        links=[{"source": "bizinfo", "url": "https://example.com/b1"}],
+    )
+
+
+def test_dict_round_trip_keeps_microseconds():
+    a = _announcement()
+    restored = CompactAnnouncement.from_dict(a.to_dict()).to_announcement()
+    assert restored.scraped_at == a.scraped_at
+    assert restored.to_dict() == a.to_dict()
+
+
+def test_jsonl_round_trip():
+    records = [CompactAnnouncement.from_announcement(_announcement())]
+    assert decode_jsonl(encode_jsonl(records)) == records
+
+
+def test_aware_datetime_is_normalized_to_local_naive():
+    aware = datetime(2026, 3, 15, 0, 0, 0, 500, tzinfo=timezone(timedelta(hours=9)))
+    assert from_epoch(to_epoch(aware)) == aware.astimezone().replace(tzinfo=None)
+
@@ -0,0 +1,76 @@
+import sqlite3
+from datetime import datetime
+
+from src.filters.dedupe import Deduplicator, organizations_compatible
+from src.models import Announcement
+
+
+def _announcement(id, source, title, organization=None, deadline=None):
+    return Announcement(
+        id=id, source=source, title=title, url=f"https://example.com/{id}",
+        organization=organization, deadline=deadline,
+    )
+
+
+def test_merges_same_title_across_sources():
+    dedupe = Deduplicator(sqlite3.connect(":memory:"))
+    result = dedupe.merge([
+        _announcement("ntis_1", "ntis", "2026년 인공지능 반도체 기술개발사업 신규과제 공고", "과학기술정보통신부"),
+        _announcement("biz_1", "bizinfo", "[과기정통부] 2026년 인공지능 반도체 기술개발사업 신규과제 공고", "과학기술정보통신부"),
+    ], seen_ids=set())
+    assert [a.id for a in result.canonical] == ["ntis_1"]
+    assert result.merged == {"biz_1": "ntis_1"}
+
+
+def test_different_organizations_are_not_merged():
+    dedupe = Deduplicator(sqlite3.connect(":memory:"))
+    result = dedupe.merge([
+        _announcement("ntis_1", "ntis", "2026년 인공지능 반도체 기술개발사업 신규과제 공고", "과학기술정보통신부"),
+        _announcement("biz_1", "bizinfo", "2026년 인공지능 반도체 기술개발사업 신규과제 공고", "경기도경제과학진흥원"),
+    ], seen_ids=set())
+    assert len(result.canonical) == 2
+    assert result.merged == {}
+
+
+def test_batch_group_keeps_one_announcement_per_source():
+    dedupe = Deduplicator(sqlite3.connect(":memory:"))
+    title = "2026년 인공지능 반도체 기술개발사업 신규과제 공고"
+    result = dedupe.merge([
+        _announcement("ntis_1", "ntis", title, "과학기술정보통신부", datetime(2026, 3, 10)),
+        _announcement("biz_1", "bizinfo", title, "과학기술정보통신부", datetime(2026, 3, 11)),
+        _announcement("ntis_2", "ntis", title, "과학기술정보통신부", datetime(2026, 3, 12)),
+    ], seen_ids=set())
+    # 기업마당 공고를 사이에 두고 NTIS의 서로 다른 두 공고가 한 그룹으로 이어지면 안 됨
+    assert [a.id for a in result.canonical] == ["ntis_1", "ntis_2"]
+    assert result.merged == {"biz_1": "ntis_1"}
+
+
+def test_titles_without_shingles_are_not_merged():
+    dedupe = Deduplicator(sqlite3.connect(":memory:"))
+    result = dedupe.merge([
+        _announcement("ntis_1", "ntis", "[공고] (2026년도) 모집 공고"),
+        _announcement("biz_1", "bizinfo", "2026년 안내"),
+        _announcement("ks_1", "kstartup", "공고"),
+    ], seen_ids=set())
+    assert len(result.canonical) == 3
+    assert result.merged == {}
+
+
+def test_history_match_respects_organization():
+    conn = sqlite3.connect(":memory:")
+    dedupe = Deduplicator(conn)
+    deadline = datetime(2026, 4, 30)
+    sent = _announcement("ntis_1", "ntis", "2026년 스마트공장 구축 지원사업 공고", "중소벤처기업부", deadline)
+    dedupe.index([sent])
+
+    other_org = _announcement("biz_1", "bizinfo", "2026년 스마트공장 구축 지원사업 공고", "부산광역시", deadline)
+    same_org = _announcement("biz_2", "bizinfo", "2026년 스마트공장 구축 지원사업 공고", "중소벤처기업부", deadline)
+    assert dedupe.merge([other_org], {"ntis_1"}).merged == {}
+    assert dedupe.merge([same_org], {"ntis_1"}).merged == {"biz_2": "ntis_1"}
+
+
+def test_organizations_compatible():
+    assert organizations_compatible(None, "중소벤처기업부")
+    assert organizations_compatible("과학기술정보통신부", "과학기술정보통신부 정보통신산업진흥원")
+    assert organizations_compatible("중소벤처기업부(중기부)", "중소벤처기업부")
+    assert not organizations_compatible("과학기술정보통신부", "부산광역시")
@@ -0,0 +1,24 @@
+from datetime import date, datetime
+
+from src.models import Announcement
+from src.storage.history import AnnouncementStore
+
+
+def _announcement(id, deadline):
+    return Announcement(
+        id=id, source="ntis", title=f"2026년 {id} 지원사업 공고", url=f"https://example.com/{id}",
+        deadline=deadline,
+    )
+
+
+def test_search_deadline_range_includes_both_days(tmp_path):
+    store = AnnouncementStore(tmp_path / "announcements.db")
+    store.upsert_many([
+        _announcement("a", datetime(2026, 3, 9, 18, 0)),
+        _announcement("b", datetime(2026, 3, 10)),
+        _announcement("c", datetime(2026, 3, 10, 18, 0)),
+        _announcement("d", datetime(2026, 3, 11)),
+    ])
+    found = store.search(deadline_from=datetime(2026, 3, 10, 9, 0), deadline_to=datetime(2026, 3, 10, 9, 0))
+    assert sorted(a.id for a in found) == ["b", "c"]
+    assert sorted(a.id for a in store.search(deadline_to=date(2026, 3, 10))) == ["a", "b", "c"]
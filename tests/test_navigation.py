@@ -0,0 +1,32 @@
+from src.scrapers.navigation import NavigationCache
+
+
+def test_parallel_caches_keep_each_others_entries(tmp_path):
+    path = tmp_path / "navigation.json"
+    a = NavigationCache(path)
+    b = NavigationCache(path)
+    # 둘 다 빈 파일을 읽은 뒤 각자 다른 출처를 기억
+    assert a.get("ntis", "entry") is None
+    assert b.get("bizinfo", "entry") is None
+
+    a.remember("ntis", "entry", "direct")
+    b.remember("bizinfo", "entry", "menu")
+
+    fresh = NavigationCache(path)
+    assert fresh.get("ntis", "entry") == "direct"
+    assert fresh.get("bizinfo", "entry") == "menu"
+    # 나중에 저장한 쪽도 다른 워커가 기억한 값을 봄
+    assert b.get("ntis", "entry") == "direct"
+
+
+def test_save_does_not_revert_newer_value_from_other_worker(tmp_path):
+    path = tmp_path / "navigation.json"
+    a = NavigationCache(path)
+    b = NavigationCache(path)
+    a.remember("ntis", "entry", "direct")
+    b.remember("ntis", "entry", "menu")
+    a.remember("ntis", "selector", "table tr")
+
+    fresh = NavigationCache(path)
+    assert fresh.get("ntis", "entry") == "menu"
+    assert fresh.get("ntis", "selector") == "table tr"
@@ -0,0 +1,158 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from src.models import Announcement
+from src.pipeline import ObserverPipeline, _Enriched, _RowBatch, _TenantRun
+from src.scrapers.base import BaseScraper
+from src.scrapers.rowfilter import SeenRows
+from src.storage import AnnouncementStore, state
+from src.tenants import Tenant
+
+
+class _FakeNotifier:
+    def __init__(self, send_ok=True, digest_ok=True):
+        self.send_ok = send_ok
+        self.digest_ok = digest_ok
+
+    async def send_new_announcements(self, announcements):
+        return self.send_ok
+
+    async def send_digest(self, announcements):
+        return self.digest_ok
+
+
+class _PagedScraper(BaseScraper):
+    """페이지마다 행 지문을 쌓고 공고 하나씩 넘기는 스크래퍼"""
+
+    BASE_URL = "https://example.com"
+    source_name = "ntis"
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+    async def fetch_announcements(self):
+        return []
+
+    async def fetch_detail(self, announcement_id):
+        return {}
+
+    async def stream_announcements(self, **kwargs):
+        for page, fingerprints in enumerate([[1, 2], [3], [4]]):
+            self.stage_rows(fingerprints)
+            yield [_announcement(f"page{page}")]
+
+
+def _announcement(id):
+    return Announcement(id=id, source="ntis", title=f"2026년 연구개발 지원사업 {id}", url=f"https://example.com/{id}")
+
+
+def _flush(tmp_path, store, notifier):
+    tenant = Tenant(name="team", webhook_url="https://example.com/hook", seen_key=str(tmp_path / "team.json"))
+    pipeline = ObserverPipeline({}, store, [tenant])
+    run = _TenantRun(tenant, client=None, corpus=[], state=pipeline.state)
+    run.notifier = notifier
+    run.pending = _Enriched([_announcement("card")], [_announcement("digest")], set())
+    asyncio.run(pipeline._flush(run))
+    return pipeline, run
+
+
+def test_digest_failure_keeps_sent_cards_and_releases_only_digest_claims(tmp_path):
+    with AnnouncementStore(tmp_path / "announcements.db") as store:
+        pipeline, run = _flush(tmp_path, store, _FakeNotifier(digest_ok=False))
+        assert run.seen_ids == {"card"}
+        assert (run.stats.sent, run.stats.digest, run.stats.failed) == (1, 0, 1)
+
+        # 다른 실행은 카드 공고를 다시 선점하지 못하고 요약 공고는 다시 보낼 수 있음
+        other = ObserverPipeline({}, store, []).claims
+        assert other.claim("team", ["card", "digest"]) == {"digest"}
+
+
+def test_card_failure_releases_everything(tmp_path):
+    with AnnouncementStore(tmp_path / "announcements.db") as store:
+        pipeline, run = _flush(tmp_path, store, _FakeNotifier(send_ok=False))
+        assert run.seen_ids == set()
+        assert (run.stats.sent, run.stats.failed) == (0, 2)
+        other = ObserverPipeline({}, store, []).claims
+        assert other.claim("team", ["card", "digest"]) == {"card", "digest"}
+
+
+def test_overlapping_runs_keep_their_own_row_fingerprints(tmp_path):
+    key = str(tmp_path / "seen_rows.json")
+    first, second = SeenRows(state.scope(), key), SeenRows(state.scope(), key)
+    first.observe("ntis", [1, 2])
+    second.observe("ntis", [3])
+
+    # 두 번째 실행이 반영하지 않고 끝나도 첫 번째 실행의 지문은 남음
+    assert first.commit(datetime(2026, 3, 10)) == 2
+    assert sorted(SeenRows(state.scope(), key).fingerprints("ntis")) == [1, 2]
+
+
+def test_rows_of_a_batch_cut_off_before_handoff_are_not_recorded(tmp_path):
+    key = str(tmp_path / "seen_rows.json")
+    seen_rows = SeenRows(state.scope(), key)
+    with AnnouncementStore(tmp_path / "announcements.db") as store:
+        pipeline = ObserverPipeline({}, store, [], seen_rows=seen_rows)
+        pipeline.stats.scraped["ntis"] = 0
+        outbox = asyncio.Queue(1)
+
+        async def scenario():
+            # 첫 배치만 넘어가고 두 번째 배치를 넘기다 시간 제한으로 끊김
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(pipeline._collect("ntis", _PagedScraper(), outbox), 0.05)
+            return outbox.get_nowait()
+
+        item = asyncio.run(scenario())
+        pipeline._fingerprint(item)
+
+    assert seen_rows.commit(datetime(2026, 3, 10)) == 2
+    assert sorted(SeenRows(state.scope(), key).fingerprints("ntis")) == [1, 2]
+
+
+@pytest.mark.parametrize("digest_ok, recorded", [(True, [1, 2]), (False, [])])
+def test_rows_are_recorded_once_every_tenant_delivered(tmp_path, digest_ok, recorded):
+    key = str(tmp_path / "seen_rows.json")
+    seen_rows = SeenRows(state.scope(), key)
+    with AnnouncementStore(tmp_path / "announcements.db") as store:
+        tenants = [
+            Tenant(name=name, webhook_url="https://example.com/hook", seen_key=str(tmp_path / f"{name}.json"))
+            for name in ("a", "b")
+        ]
+        pipeline = ObserverPipeline({}, store, tenants, seen_rows=seen_rows)
+        rows = _RowBatch("ntis", [1, 2], waiting=2)
+        runs = [_TenantRun(tenant, client=None, corpus=[], state=pipeline.state) for tenant in tenants]
+        runs[0].notifier, runs[1].notifier = _FakeNotifier(), _FakeNotifier(digest_ok=digest_ok)
+        runs[0].pending = _Enriched([_announcement("card")], [], set(), [rows])
+        runs[1].pending = _Enriched([], [_announcement("digest")], set(), [rows])
+
+        # 첫 테넌트만 보냈을 때는 아직 기록하지 않음
+        asyncio.run(pipeline._flush(runs[0]))
+        assert seen_rows.commit(datetime(2026, 3, 10)) == 0
+        asyncio.run(pipeline._flush(runs[1]))
+
+    seen_rows.commit(datetime(2026, 3, 10))
+    assert sorted(SeenRows(state.scope(), key).fingerprints("ntis")) == recorded
+
+
+def test_title_based_aifactory_ids_count_as_seen(tmp_path):
+    from src.parsers import aifactory
+
+    title = "2026 의료영상 AI 경진대회"
+    tenant = Tenant(name="team", webhook_url="https://example.com/hook", seen_key=str(tmp_path / "team.json"))
+    earlier = state.scope()
+    tenant.save_seen(earlier, {aifactory.legacy_id(title)})
+    tenant.flush_seen(earlier)
+    run = _TenantRun(tenant, client=None, corpus=[], state=state.scope())
+
+    [renamed] = aifactory.parse([{"taskId": "3041", "title": title}], datetime(2026, 3, 1))
+    [other] = aifactory.parse([{"taskId": "3042", "title": "2026 기상 예측 AI 경진대회"}], datetime(2026, 3, 1))
+    assert renamed.id == "aifactory_3041"
+    assert renamed.url == aifactory.DETAIL_URL.format(id="3041")
+
+    # 제목 기준 ID로 이미 알린 공모전은 새 ID도 본 것으로 기록, 처음 보는 공모전은 그대로 새 공고
+    assert run.adopt_legacy_ids([renamed, other]) == {"aifactory_3041"}
+    assert "aifactory_3041" in run.seen_ids and "aifactory_3042" not in run.seen_ids
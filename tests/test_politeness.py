@@ -0,0 +1,77 @@
+import asyncio
+
+from src.politeness import HostPolicy, PolitenessScheduler
+
+
+def _scheduler():
+    return PolitenessScheduler(HostPolicy(rate=1000.0, burst=100, concurrency=10))
+
+
+async def _run(scheduler, url, n):
+    traffic = scheduler.track()
+    for _ in range(n):
+        async with scheduler.request(url):
+            await asyncio.sleep(0)
+    return scheduler.snapshot(traffic)
+
+
+def test_counts_are_per_run():
+    scheduler = _scheduler()
+
+    async def main():
+        first = await asyncio.create_task(_run(scheduler, "https://www.ntis.go.kr/a", 3))
+        second = await asyncio.create_task(_run(scheduler, "https://www.ntis.go.kr/b", 2))
+        return first, second
+
+    first, second = asyncio.run(main())
+    assert first["www.ntis.go.kr"]["requests"] == 3
+    # 앞 실행의 요청이 쌓이지 않음
+    assert second["www.ntis.go.kr"]["requests"] == 2
+
+
+def test_overlapping_runs_do_not_mix():
+    scheduler = _scheduler()
+
+    async def main():
+        return await asyncio.gather(
+            _run(scheduler, "https://www.ntis.go.kr/", 4),
+            _run(scheduler, "https://www.bizinfo.go.kr/", 1),
+        )
+
+    first, second = asyncio.run(main())
+    assert {host: h["requests"] for host, h in first.items()} == {"www.ntis.go.kr": 4}
+    assert {host: h["requests"] for host, h in second.items()} == {"www.bizinfo.go.kr": 1}
+
+
+def test_throttled_responses_count_for_the_run():
+    scheduler = PolitenessScheduler(HostPolicy(rate=1000.0, burst=100, base_backoff=0.0))
+
+    async def main():
+        traffic = scheduler.track()
+        async with scheduler.request("https://www.iris.go.kr/") as slot:
+            slot.status = 429
+        return scheduler.snapshot(traffic)
+
+    summary = asyncio.run(main())["www.iris.go.kr"]
+    assert (summary["requests"], summary["throttled"], summary["failures"]) == (1, 1, 1)
+
+
+def test_per_url_scheduler_limits_each_webhook_separately():
+    scheduler = PolitenessScheduler(HostPolicy(rate=1000.0, burst=100, concurrency=1), per_url=True)
+
+    async def main():
+        traffic = scheduler.track()
+        a = scheduler.request("https://example.webhook.office.com/webhookb2/a")
+        b = scheduler.request("https://example.webhook.office.com/webhookb2/b")
+        async with a:
+            # 같은 호스트라도 다른 Webhook은 동시 요청 한도를 따로 씀
+            async with b:
+                pass
+        return traffic
+
+    traffic = asyncio.run(main())
+    assert sorted(traffic) == [
+        "https://example.webhook.office.com/webhookb2/a",
+        "https://example.webhook.office.com/webhookb2/b",
+    ]
+
@@ -0,0 +1,29 @@
+from src.filters.relevance import RelevanceProfile, RelevanceScorer
+from src.models import Announcement
+
+
+def _announcement(id, title):
+    return Announcement(id=id, source="ntis", title=title, url=f"https://example.com/{id}")
+
+
+def test_unseen_terms_lower_the_score():
+    scorer = RelevanceScorer(RelevanceProfile(keywords=["디지털헬스"])).fit(["스마트공장 구축 지원사업"])
+    exact, padded = scorer.score([
+        _announcement("a", "디지털헬스"),
+        _announcement("b", "디지털헬스 해양수산 물류 창업 보육센터 입주기업 모집"),
+    ])
+    assert exact > 0.9
+    # 어휘 밖 단어를 빼고 정규화하면 두 공고가 같은 점수가 됨
+    assert padded < exact / 2
+
+
+def test_score_does_not_depend_on_the_batch():
+    profile = RelevanceProfile(keywords=["의료 AI", "디지털헬스"])
+    target = _announcement("a", "2026년 의료 AI 영상판독 기술개발 지원사업")
+    alone = RelevanceScorer(profile).score([target])
+    with_others = RelevanceScorer(profile).score([
+        target,
+        _announcement("b", "2026년 의료기기 수출 지원사업"),
+        _announcement("c", "2026년 의료 데이터 바우처 지원사업"),
+    ])
+    assert alone[0] == with_others[0]
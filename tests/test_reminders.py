@@ -0,0 +1,66 @@
+import asyncio
+from datetime import datetime
+
+from src.models import Announcement
+from src.reminders import ReminderStore, send_due_reminders
+from src.storage.history import AnnouncementStore
+
+
+class _FakeNotifier:
+    def __init__(self, ok=True):
+        self.ok = ok
+        self.sent = []
+
+    async def send_reminders(self, reminders):
+        self.sent.append([(r.announcement.id, r.offset_days) for r in reminders])
+        return self.ok
+
+
+def _store(tmp_path):
+    store = AnnouncementStore(tmp_path / "announcements.db")
+    store.upsert_many([
+        Announcement(
+            id="ntis_1", source="ntis", title="2026년 인공지능 기술개발사업 공고",
+            url="https://example.com/1", deadline=datetime(2026, 3, 20),
+        )
+    ])
+    return store
+
+
+def test_watch_counts_only_new_or_changed_reminders(tmp_path):
+    store = _store(tmp_path)
+    reminders = ReminderStore(store.conn)
+    announcement = store.get("ntis_1")
+    now = datetime(2026, 3, 1)
+    assert reminders.watch([announcement], now) == 3
+    assert reminders.watch([announcement], now) == 0
+
+    announcement.deadline = datetime(2026, 3, 25)
+    assert reminders.watch([announcement], now) == 3
+
+
+def test_overlapping_runs_send_once(tmp_path):
+    store = _store(tmp_path)
+    ReminderStore(store.conn).watch([store.get("ntis_1")], datetime(2026, 3, 1))
+    # 다른 실행은 같은 DB 파일에 따로 연결
+    other = AnnouncementStore(tmp_path / "announcements.db")
+    now = datetime(2026, 3, 13, 10, 0)
+
+    first, second = _FakeNotifier(), _FakeNotifier()
+    assert asyncio.run(send_due_reminders(ReminderStore(store.conn), first, now)) == 1
+    assert asyncio.run(send_due_reminders(ReminderStore(other.conn), second, now)) == 0
+    # D-14와 D-7이 모두 지났으면 임박한 D-7 하나만
+    assert first.sent == [[("ntis_1", 7)]]
+    assert second.sent == []
+
+
+def test_failed_send_releases_the_claim(tmp_path):
+    store = _store(tmp_path)
+    reminders = ReminderStore(store.conn)
+    reminders.watch([store.get("ntis_1")], datetime(2026, 3, 1))
+    now = datetime(2026, 3, 13, 10, 0)
+
+    assert asyncio.run(send_due_reminders(reminders, _FakeNotifier(ok=False), now)) == 0
+    retry = _FakeNotifier()
+    assert asyncio.run(send_due_reminders(reminders, retry, datetime(2026, 3, 13, 11, 0))) == 1
+    assert retry.sent == [[("ntis_1", 7)]]
@@ -0,0 +1,40 @@
+from datetime import datetime, timedelta
+
+from src.parsers import bizinfo
+from src.reparse import reparse
+from src.storage import AnnouncementStore, ChangeTracker, PageArchive
+
+
+ROWS = {"rows": [
+    {"no": "1", "title": "2026년 창업 지원사업 공고", "period": "2026-03-01 ~ 2026-03-20", "department": "중소벤처기업부"},
+    {"no": "2", "title": "2026년 수출 바우처 지원사업", "period": "2026-03-01 ~ 2026-03-25", "department": "산업통상자원부"},
+]}
+
+
+def test_reparse_compares_saved_page_with_stored_announcements(tmp_path):
+    fetched_at = datetime.now() - timedelta(hours=1)
+    archive = PageArchive(tmp_path / "archive")
+    archive.put("bizinfo", bizinfo.page_url(1), "rows", ROWS, fetched_at)
+
+    with AnnouncementStore(tmp_path / "announcements.db") as store:
+        # 예전 파서가 저장한 공고: 첫 번째는 마감일이 다르고, 목록에 없는 공고가 하나 더 있음
+        first, second = bizinfo.parse(ROWS, fetched_at)
+        stale = bizinfo.parse(ROWS, fetched_at)[0]
+        stale.deadline = datetime(2026, 3, 19)
+        gone = bizinfo.parse({"rows": [{"no": "9", "title": "2026년 사라진 지원사업 공고", "period": ""}]}, fetched_at)[0]
+        store.upsert_many([stale, gone])
+        ChangeTracker(store.conn).detect([stale, gone])
+
+        report = reparse(archive, store, sources=["bizinfo"], workers=1)
+        assert (report.pages, report.failed_pages, report.announcements) == (1, 0, 2)
+        assert list(report.changed) == [first.id]
+        assert report.changed[first.id]["deadline"][1].startswith("2026-03-20")
+        assert report.new == [second.id]
+        assert report.missing == [gone.id]
+
+        # --apply: 재파싱 결과를 이력에 반영하면 다음 비교에서는 변경 없음
+        reparse(archive, store, sources=["bizinfo"], workers=1, apply=True)
+        assert store.get(first.id).deadline == datetime(2026, 3, 20)
+        again = reparse(archive, store, sources=["bizinfo"], workers=1)
+        assert (again.unchanged, again.changed, again.new) == (2, {}, [])
+    archive.close()
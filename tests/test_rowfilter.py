@@ -0,0 +1,48 @@
+import json
+import shutil
+import subprocess
+from datetime import datetime
+
+import pytest
+
+from src.parsers import bizinfo
+from src.scrapers.rowfilter import ROW_FILTER_JS
+
+
+node = shutil.which("node")
+
+
+def _run_filter(filters: dict, expression: str):
+    """페이지 안 필터 함수를 node로 실행"""
+    script = ROW_FILTER_JS + f"\nconst f = makeRowFilter({json.dumps(filters)});\nconsole.log(JSON.stringify({expression}));"
+    out = subprocess.run([node, "-e", script], capture_output=True, text=True, check=True).stdout
+    return json.loads(out)
+
+
+@pytest.mark.skipif(node is None, reason="node가 없음")
+def test_closed_matches_status_exactly():
+    filters = {"skipStatuses": ["마감", "종료"]}
+    assert _run_filter(filters, "['마감', ' 종료 ', '마감임박', '접수중', ''].map(f.closed)") == [
+        True, True, False, False, False,
+    ]
+
+
+@pytest.mark.skipif(node is None, reason="node가 없음")
+def test_closed_by_keeps_rows_on_their_last_day():
+    now = int(datetime(2026, 3, 10, 15, 0).timestamp() * 1000)
+    filters = {"skipStatuses": ["마감", "종료"], "now": now}
+    result = _run_filter(
+        filters,
+        "[new Date(2026, 2, 9), new Date(2026, 2, 10), new Date(2026, 2, 11), null].map(f.closedBy)",
+    )
+    assert result == [True, False, False, False]
+
+
+def test_bizinfo_parser_open_on_deadline_day():
+    now = datetime(2026, 3, 10, 15, 0)
+    rows = [
+        {"no": "1", "title": "2026년 창업 지원사업", "period": "2026-03-01 ~ 2026-03-10"},
+        {"no": "2", "title": "2026년 수출 지원사업", "period": "2026-03-01 ~ 2026-03-09"},
+    ]
+    statuses = [a.status for a in bizinfo.parse({"rows": rows}, now, year=2026)]
+    assert statuses == ["접수중", "마감"]
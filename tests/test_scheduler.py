@@ -0,0 +1,38 @@
+from datetime import datetime, timedelta
+
+from src.models import Announcement
+from src.scheduler import AdaptiveScheduler
+from src.storage import AnnouncementStore
+from src.storage.history import ORIGIN_BACKFILL, ORIGIN_REPARSE
+
+
+def _announcement(i: int) -> Announcement:
+    return Announcement(
+        id=f"ntis-{i}",
+        source="ntis",
+        title=f"2026년 연구개발 지원사업 공고 {i}",
+        url=f"https://example.com/{i}",
+    )
+
+
+def test_backfill_and_reparse_do_not_count_as_new_postings(tmp_path):
+    store = AnnouncementStore(tmp_path / "announcements.db")
+    scheduler = AdaptiveScheduler(store.conn)
+    scheduler.record_run("ntis", datetime.now() - timedelta(weeks=2))
+    baseline = sum(scheduler.hourly_rates("ntis"))
+
+    store.upsert_many([_announcement(i) for i in range(50)], origin=ORIGIN_BACKFILL)
+    store.upsert_many([_announcement(i) for i in range(50, 60)], origin=ORIGIN_REPARSE)
+    assert sum(scheduler.hourly_rates("ntis")) == baseline
+
+    store.upsert_many([_announcement(i) for i in range(60, 63)])
+    assert sum(scheduler.hourly_rates("ntis")) > baseline
+
+
+def test_observed_announcement_keeps_origin_when_backfill_sees_it_again(tmp_path):
+    store = AnnouncementStore(tmp_path / "announcements.db")
+    store.upsert_many([_announcement(1)])
+    store.upsert_many([_announcement(1)], origin=ORIGIN_BACKFILL)
+    origin = store.conn.execute("SELECT origin FROM announcements WHERE id = 'ntis-1'").fetchone()[0]
+    assert origin == "observe"
+
@@ -0,0 +1,97 @@
+import pytest
+
+from src.storage.state import BlobStateBackend, LocalStateBackend, StateConflict, StateStore
+
+
+def _union(ids):
+    return lambda current: sorted(set(current) | set(ids))
+
+
+class _FlakyBackend(LocalStateBackend):
+    """처음 한 번은 저장 중 네트워크 오류"""
+
+    def __init__(self, root):
+        super().__init__(root)
+        self.failures = 1
+
+    def put(self, key, value, etag):
+        if self.failures:
+            self.failures -= 1
+            raise OSError("connection reset")
+        return super().put(key, value, etag)
+
+
+def _merge_overlapping_runs(backend):
+    shared = StateStore(backend)
+    first, second = shared.scope(), shared.scope()
+    assert first.read("seen.json", []) == []
+    assert second.read("seen.json", []) == []
+
+    first.update("seen.json", _union(["a"]), default=[])
+    second.update("seen.json", _union(["b"]), default=[])
+    assert first.flush() == 1
+    # 두 번째 실행은 읽은 뒤 첫 번째 실행이 저장했으므로 충돌 → 다시 읽어 병합
+    assert second.flush() == 1
+    assert shared.scope().read("seen.json") == ["a", "b"]
+
+
+def test_local_overlapping_runs_merge(tmp_path):
+    _merge_overlapping_runs(LocalStateBackend(tmp_path))
+
+
+def test_scopes_do_not_share_pending_merges(tmp_path):
+    shared = StateStore(LocalStateBackend(tmp_path))
+    first, second = shared.scope(), shared.scope()
+    first.update("seen.json", _union(["a"]), default=[])
+    second.update("seen.json", _union(["b"]), default=[])
+
+    # 첫 번째 실행을 저장해도 두 번째 실행이 예약한 변경은 그대로
+    first.flush()
+    assert shared.scope().read("seen.json") == ["a"]
+    assert second.flush() == 1
+    assert shared.scope().read("seen.json") == ["a", "b"]
+
+
+def test_flush_keeps_merges_after_backend_error(tmp_path):
+    store = StateStore(_FlakyBackend(tmp_path))
+    store.update("seen.json", _union(["a"]), default=[])
+    with pytest.raises(OSError):
+        store.flush()
+    assert store.read("seen.json") == ["a"]
+
+    assert store.flush() == 1
+    assert StateStore(LocalStateBackend(tmp_path)).read("seen.json") == ["a"]
+
+
+def test_flush_keeps_merges_after_repeated_conflicts(tmp_path):
+    backend = LocalStateBackend(tmp_path)
+    store = StateStore(backend, max_attempts=2)
+    store.read("seen.json")
+    backend.put = lambda key, value, etag: (_ for _ in ()).throw(StateConflict(key))
+    store.update("seen.json", _union(["a"]), default=[])
+    with pytest.raises(StateConflict):
+        store.flush()
+    assert store.read("seen.json") == ["a"]
+
+
+def test_blob_overlapping_runs_merge(azurite_blob, unique_name):
+    backend = BlobStateBackend(azurite_blob, unique_name)
+    try:
+        _merge_overlapping_runs(backend)
+    finally:
+        backend.container.delete_container()
+
+
+def test_blob_conditional_write(azurite_blob, unique_name):
+    backend = BlobStateBackend(azurite_blob, unique_name)
+    try:
+        etag = backend.put("seen.json", ["a"], None)
+        with pytest.raises(StateConflict):
+            backend.put("seen.json", ["b"], None)
+        new_etag = backend.put("seen.json", ["a", "b"], etag)
+        with pytest.raises(StateConflict):
+            backend.put("seen.json", ["c"], etag)
+        assert backend.get("seen.json") == (["a", "b"], new_etag)
+        assert backend.get("missing.json") == (None, None)
+    finally:
+        backend.container.delete_container()
@@ -0,0 +1,89 @@
+import json
+from datetime import datetime
+
+from src.models import Announcement
+from src.pipeline import ObserverPipeline, _RowBatch, _TenantRun
+from src.storage import AnnouncementStore, state
+from src.tenants import Tenant, load_tenants
+
+
+TITLE = "2026년 스마트공장 구축 지원사업 참여기업 모집 공고"
+
+
+def _announcement(id, source):
+    return Announcement(
+        id=id, source=source, title=TITLE, url=f"https://example.com/{id}",
+        organization="중소벤처기업부", deadline=datetime(2026, 4, 30),
+    )
+
+
+def _run(tmp_path, name, sources=None, seen=()):
+    tenant = Tenant(name=name, webhook_url="https://example.com/hook",
+                    seen_key=str(tmp_path / f"{name}.json"), sources=sources)
+    run = _TenantRun(tenant, client=None, corpus=[], state=state.scope())
+    run.seen_ids = set(seen)
+    return run
+
+
+def _dedupe(pipeline, batch):
+    # 수집 단계에서 넘어온 것처럼 행 지문 없는 배치로 감싸서 넘김
+    return pipeline._dedupe((batch, _RowBatch(batch[0].source, [], len(pipeline.runs))))
+
+
+def test_history_duplicate_is_suppressed_only_for_tenants_that_saw_it(tmp_path):
+    with AnnouncementStore(tmp_path / "announcements.db") as store:
+        pipeline = ObserverPipeline({}, store, [])
+        pipeline.deduplicator.index([_announcement("ntis_1", "ntis")])
+        research = _run(tmp_path, "research", seen={"ntis_1"})
+        startup = _run(tmp_path, "startup", sources=["bizinfo", "kstartup"])
+        pipeline.runs = [research, startup]
+
+        enriched = pipeline._enrich(_dedupe(pipeline, [_announcement("biz_1", "bizinfo")]))
+
+    assert enriched["research"].send == []
+    assert enriched["research"].quiet_ids == {"biz_1"}
+    assert [a.id for a in enriched["startup"].send] == ["biz_1"]
+
+
+def test_in_batch_duplicate_reaches_tenant_filtering_the_canonical_source(tmp_path):
+    with AnnouncementStore(tmp_path / "announcements.db") as store:
+        pipeline = ObserverPipeline({}, store, [])
+        startup = _run(tmp_path, "startup", sources=["bizinfo"])
+        pipeline.runs = [startup]
+
+        batch = [_announcement("ntis_1", "ntis"), _announcement("biz_1", "bizinfo")]
+        enriched = pipeline._enrich(_dedupe(pipeline, batch))
+
+    # 대표 공고는 NTIS지만 합쳐진 기업마당 출처를 받는 테넌트에도 전달
+    assert [a.id for a in enriched["startup"].send] == ["ntis_1"]
+
+
+def test_later_batch_duplicate_is_suppressed_for_the_same_tenant(tmp_path):
+    with AnnouncementStore(tmp_path / "announcements.db") as store:
+        pipeline = ObserverPipeline({}, store, [])
+        everyone = _run(tmp_path, "everyone")
+        pipeline.runs = [everyone]
+
+        first = pipeline._enrich(_dedupe(pipeline, [_announcement("ntis_1", "ntis")]))
+        second = pipeline._enrich(_dedupe(pipeline, [_announcement("biz_1", "bizinfo")]))
+
+    assert [a.id for a in first["everyone"].send] == ["ntis_1"]
+    assert second["everyone"].send == []
+    assert first["everyone"].send[0].links == [{"source": "bizinfo", "url": "https://example.com/biz_1"}]
+
+
+def test_single_primary_tenant(tmp_path, monkeypatch):
+    config = tmp_path / "tenants.json"
+    config.write_text(json.dumps({"tenants": [
+        {"name": "a", "webhook_url": "https://example.com/a"},
+        {"name": "b", "webhook_url": "https://example.com/b", "primary": True},
+        {"name": "c", "webhook_url": "https://example.com/c", "primary": True},
+    ]}), encoding="utf-8")
+    monkeypatch.setenv("RNDO_TENANTS", str(config))
+    assert [t.name for t in load_tenants(None, "seen.json") if t.primary] == ["b"]
+
+    config.write_text(json.dumps({"tenants": [
+        {"name": "a", "webhook_url": "https://example.com/a"},
+        {"name": "b", "webhook_url": "https://example.com/b"},
+    ]}), encoding="utf-8")
+    assert [t.name for t in load_tenants(None, "seen.json") if t.primary] == ["a"]
@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+
+from src.trigger import TriggerCoalescer
+
+
+class _Stats:
+    def __init__(self, n):
+        self.n = n
+
+    def summary(self):
+        return f"실행 {self.n}"
+
+
+class _Runner:
+    """호출 횟수를 세고, release 전까지 끝나지 않는 실행"""
+
+    def __init__(self, fail=False):
+        self.calls = 0
+        self.fail = fail
+        self.release = None
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        if self.fail:
+            raise RuntimeError("수집 실패")
+        return _Stats(self.calls)
+
+
+async def _start(runner, coalescer, *forces):
+    """요청들을 동시에 넣고 실행이 시작된 뒤 끝내게 함"""
+    runner.release = asyncio.Event()
+    tasks = [asyncio.ensure_future(coalescer.trigger(force=force)) for force in forces]
+    await asyncio.sleep(0)
+    runner.release.set()
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def test_concurrent_requests_join_one_run():
+    runner = _Runner()
+    coalescer = TriggerCoalescer(runner)
+
+    results = asyncio.run(_start(runner, coalescer, False, False, True))
+    assert runner.calls == 1
+    # force로 들어와도 진행 중인 실행이 가장 최신이므로 합류
+    assert [r.mode for r in results] == ["run", "joined", "joined"]
+    assert {r.summary for r in results} == {"실행 1"}
+
+
+def test_recent_result_is_reused_unless_forced():
+    runner = _Runner()
+    coalescer = TriggerCoalescer(runner, fresh_seconds=300)
+
+    async def main():
+        await _start(runner, coalescer, False)
+        cached = await _start(runner, coalescer, False)
+        forced = await _start(runner, coalescer, True)
+        return cached[0], forced[0]
+
+    cached, forced = asyncio.run(main())
+    assert cached.mode == "cached" and cached.summary == "실행 1"
+    assert forced.mode == "run" and forced.summary == "실행 2"
+    assert runner.calls == 2
+
+
+def test_zero_fresh_seconds_never_reuses():
+    runner = _Runner()
+    coalescer = TriggerCoalescer(runner, fresh_seconds=0)
+
+    async def main():
+        await _start(runner, coalescer, False)
+        return await _start(runner, coalescer, False)
+
+    [result] = asyncio.run(main())
+    assert result.mode == "run"
+    assert runner.calls == 2
+
+
+def test_failure_reaches_every_waiter_and_is_not_cached():
+    runner = _Runner(fail=True)
+    coalescer = TriggerCoalescer(runner)
+
+    async def main():
+        failed = await _start(runner, coalescer, False, False)
+        runner.fail = False
+        retried = await _start(runner, coalescer, False)
+        return failed, retried[0]
+
+    failed, retried = asyncio.run(main())
+    assert all(isinstance(e, RuntimeError) for e in failed)
+    assert retried.mode == "run"
+    assert runner.calls == 2
+
+
+def test_message_labels_the_mode():
+    runner = _Runner()
+    coalescer = TriggerCoalescer(runner)
+
+    async def main():
+        await _start(runner, coalescer, False)
+        return await _start(runner, coalescer, False)
+
+    [cached] = asyncio.run(main())
+    assert cached.message.startswith("최근 실행 결과")
+    assert cached.message.endswith("실행 1")
+
+
+@pytest.mark.parametrize("value, expected", [("60", 60.0), ("0", 0.0)])
+def test_from_env(monkeypatch, value, expected):
+    monkeypatch.setenv("RNDO_TRIGGER_FRESH_SECONDS", value)
+    assert TriggerCoalescer.from_env(_Runner()).fresh_seconds == expected
@@ -0,0 +1,28 @@
+from src.filters.watchlist import Subscription, Watchlist
+from src.models import Announcement
+
+
+def _announcement(title, organization=None):
+    return Announcement(id="ntis_1", source="ntis", title=title, url="https://example.com/1", organization=organization)
+
+
+def _watchlist():
+    return Watchlist(
+        [
+            Subscription(name="의료", keywords=["의료 AI"], channel="health"),
+            Subscription(name="데이터", keywords=["데이터"], channel="data", exclude=["바우처"]),
+        ],
+        {"health": "https://example.com/health", "data": "https://example.com/data"},
+    )
+
+
+def test_keyword_does_not_match_across_title_and_organization():
+    # 제목 끝 '의료'와 주최 앞 'AI'를 이어 붙이면 '의료AI'가 됨
+    assert _watchlist().match(_announcement("2026년 스마트 의료", "AI융합연구원")) == []
+
+
+def test_matches_title_or_organization_and_honors_exclude():
+    watchlist = _watchlist()
+    assert [s.name for s in watchlist.match(_announcement("2026년 의료AI 실증 지원"))] == ["의료"]
+    assert [s.name for s in watchlist.match(_announcement("2026년 실증 지원", "한국데이터산업진흥원"))] == ["데이터"]
+    assert watchlist.match(_announcement("2026년 데이터 바우처 지원사업")) == []
@@ -0,0 +1,102 @@
+import asyncio
+from datetime import timedelta
+
+from src.workers import work
+from src.workqueue import AzureWorkQueue, SqliteWorkQueue
+
+
+def test_sqlite_key_dedupe_until_ack(tmp_path):
+    queue = SqliteWorkQueue(tmp_path / "queue.db")
+    assert queue.enqueue({"kind": "scrape", "source": "ntis"}, key="scrape:ntis")
+    assert not queue.enqueue({"kind": "scrape", "source": "ntis"}, key="scrape:ntis")
+
+    job = queue.lease(60)
+    assert job.key == "scrape:ntis"
+    # 처리 중에도 같은 작업은 다시 넣지 않음
+    assert not queue.enqueue({"kind": "scrape", "source": "ntis"}, key="scrape:ntis")
+    assert queue.ack(job)
+    assert queue.enqueue({"kind": "scrape", "source": "ntis"}, key="scrape:ntis")
+
+
+def test_sqlite_dead_letter_stops_job_and_frees_key(tmp_path):
+    queue = SqliteWorkQueue(tmp_path / "queue.db")
+    queue.enqueue({"kind": "scrape", "source": "ntis"}, key="scrape:ntis")
+    job = queue.lease(60)
+    assert queue.dead_letter(job)
+    assert queue.lease(60) is None
+    assert queue.counts() == {"ready": 0, "leased": 0, "dead": 1}
+    assert queue.enqueue({"kind": "scrape", "source": "ntis"}, key="scrape:ntis")
+
+
+def test_worker_dead_letters_disabled_source_and_unknown_kind(tmp_path, monkeypatch):
+    monkeypatch.setenv("RNDO_SOURCES", "aifactory")
+    queue = SqliteWorkQueue(tmp_path / "queue.db")
+    queue.enqueue({"kind": "scrape", "source": "ntis"}, key="scrape:ntis")
+    queue.enqueue({"kind": "backfill", "source": "ntis", "pages": "1-10"})
+    queue.enqueue({"kind": "report"})
+
+    assert asyncio.run(work(queue)) == 0
+    assert queue.counts() == {"ready": 0, "leased": 0, "dead": 3}
+
+
+def test_worker_keeps_scrape_job_when_nothing_ran(tmp_path, monkeypatch):
+    # 웹훅이 없으면 run_observer가 수집하지 않고 None을 돌려주므로 작업을 지우지 않음
+    monkeypatch.setenv("RNDO_SOURCES", "ntis")
+    monkeypatch.delenv("TEAMS_WEBHOOK_URL", raising=False)
+    monkeypatch.setenv("RNDO_TENANTS", str(tmp_path / "missing.json"))
+    queue = SqliteWorkQueue(tmp_path / "queue.db")
+    queue.enqueue({"kind": "scrape", "source": "ntis"}, key="scrape:ntis")
+
+    assert asyncio.run(work(queue)) == 0
+    assert queue.counts() == {"ready": 0, "leased": 1, "dead": 0}
+
+
+def _azure_queue(connection, name, **kwargs):
+    queue = AzureWorkQueue(connection, name, **kwargs)
+    queue._ensure_queues()
+    return queue
+
+
+def _cleanup(queue):
+    queue.client.delete_queue()
+    queue.poison.delete_queue()
+    queue.keys.delete_container()
+
+
+def test_azure_key_dedupe_until_ack(azurite_queue, azurite_blob, unique_name):
+    queue = _azure_queue(azurite_queue, unique_name)
+    try:
+        assert queue.enqueue({"kind": "scrape", "source": "ntis"}, key="scrape:ntis")
+        assert not queue.enqueue({"kind": "scrape", "source": "ntis"}, key="scrape:ntis")
+        assert queue.enqueue({"kind": "scrape", "source": "bizinfo"}, key="scrape:bizinfo")
+
+        job = queue.lease(60)
+        assert job.key == "scrape:ntis" and job.payload == {"kind": "scrape", "source": "ntis"}
+        assert not queue.enqueue({"kind": "scrape", "source": "ntis"}, key="scrape:ntis")
+        assert queue.ack(job)
+        assert queue.enqueue({"kind": "scrape", "source": "ntis"}, key="scrape:ntis")
+    finally:
+        _cleanup(queue)
+
+
+def test_azure_dead_letter_moves_to_poison_and_frees_key(azurite_queue, azurite_blob, unique_name):
+    queue = _azure_queue(azurite_queue, unique_name)
+    try:
+        queue.enqueue({"kind": "scrape", "source": "ntis"}, key="scrape:ntis")
+        job = queue.lease(60)
+        assert queue.dead_letter(job)
+        assert queue.lease(1) is None
+        assert queue.poison.peek_messages(max_messages=5)
+        assert queue.enqueue({"kind": "scrape", "source": "ntis"}, key="scrape:ntis")
+    finally:
+        _cleanup(queue)
+
+
+def test_azure_stale_key_is_reclaimed(azurite_queue, azurite_blob, unique_name):
+    queue = _azure_queue(azurite_queue, unique_name, ttl=timedelta(seconds=0))
+    try:
+        # 메시지가 사라졌는데 표시만 남은 경우 (워커가 지우는 도중 죽음)
+        queue.keys.upload_blob("scrape:ntis", b"")
+        assert queue.enqueue({"kind": "scrape", "source": "ntis"}, key="scrape:ntis")
+    finally:
+        _cleanup(queue)